@@ -13,10 +13,12 @@ for the BuildCheck tool. It includes:
 """
 
 import os
+import sys
 import time
 import logging
 import math
 import pickle
+from bisect import bisect_left
 from typing import Dict, List, Optional, Tuple, Set
 from dataclasses import dataclass
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -27,7 +29,48 @@ from rich.progress import Progress
 
 console = Console()
 
-@dataclass
+# How likely each build file is to yield a version, as priority tiers (0 first).
+# Files not listed are checked last.
+_FILE_PRIORITY = {
+    '.mvn/wrapper/maven-wrapper.properties': 0,  # High success rate
+    'gradle/wrapper/gradle-wrapper.properties': 0,  # High success rate
+    'pom.xml': 1,  # Medium success rate
+    'build.gradle': 1,  # Medium success rate
+    'Jenkinsfile': 2,  # Lower success rate
+    'gradle.properties': 3,  # Lower success rate
+    'maven-wrapper.properties': 4,  # Rare
+}
+_UNKNOWN_FILE_PRIORITY = 5
+
+# Suggestions by the fraction of API calls that has to be cut, as a step function:
+# each threshold the fraction exceeds adds its tier ahead of the milder ones
+_SUGGESTION_THRESHOLDS = (0.2, 0.3, 0.5)
+_SUGGESTION_TIERS = (
+    [
+        "Enable caching with --use-cache",
+        "Use --optimized flag",
+        "Run in multiple sessions",
+    ],
+    [
+        "Reduce max_workers to 4 or less",
+        "Increase rate_limit_delay to 0.1s",
+        "Use file pattern filtering",
+    ],
+    [
+        "Use --jenkins-only mode (reduces calls by 70%)",
+        "Enable aggressive caching",
+        "Use bulk file fetching",
+    ],
+)
+_SUGGESTIONS_BY_STEP = tuple(
+    tuple(suggestion for tier in reversed(_SUGGESTION_TIERS[:step]) for suggestion in tier)
+    for step in range(len(_SUGGESTION_THRESHOLDS) + 1)
+)
+
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(frozen=True, **_DATACLASS_OPTIONS)
 class APIPrediction:
     """Prediction of API calls needed for analysis"""
     total_repositories: int
@@ -65,6 +108,12 @@ class APIOptimizer:
         # Bulk operation tracking
         self.bulk_operations = []
         
+        # Short-lived caches of values that cost an API call: (time.monotonic(), value)
+        self.rate_limit_cache_duration = 5
+        self.size_estimate_cache_duration = 60
+        self.rate_limit_cache = None
+        self.size_estimate_cache = None
+        
     def predict_api_calls(self, 
                          estimated_repos: int, 
                          jenkins_only: bool = False,
@@ -178,12 +227,16 @@ class APIOptimizer:
         )
     
     def _get_rate_limit_remaining(self) -> int:
-        """Get remaining API calls"""
+        """Get remaining API calls, asking the rate limit endpoint at most every few seconds"""
+        if self.rate_limit_cache and time.monotonic() - self.rate_limit_cache[0] < self.rate_limit_cache_duration:
+            return self.rate_limit_cache[1]
         try:
             rate_limit = self.github.get_rate_limit()
-            return rate_limit.core.remaining
+            remaining = rate_limit.core.remaining
         except Exception:
             return 5000  # Default assumption
+        self.rate_limit_cache = (time.monotonic(), remaining)
+        return remaining
     
     def get_organization_size_estimate(self) -> int:
         """
@@ -192,13 +245,19 @@ class APIOptimizer:
         Returns:
             Estimated number of repositories
         """
+        # Repeated estimates within a minute reuse the last search
+        if self.size_estimate_cache and time.monotonic() - self.size_estimate_cache[0] < self.size_estimate_cache_duration:
+            return self.size_estimate_cache[1]
+        
         try:
             # Use search API to get a quick count
             search_query = f"org:{self.org_name}"
             self.api_calls_made += 1
             
             search_results = self.github.search_repositories(query=search_query)
-            return min(search_results.totalCount, 1000)  # Cap at 1000 for estimation
+            estimate = min(search_results.totalCount, 1000)  # Cap at 1000 for estimation
+            self.size_estimate_cache = (time.monotonic(), estimate)
+            return estimate
             
         except Exception as e:
             if self.verbose:
@@ -363,22 +422,12 @@ class APIOptimizer:
         Returns:
             Optimized list of file patterns
         """
-        # Define success rates based on common patterns
-        success_rates = {
-            '.mvn/wrapper/maven-wrapper.properties': 0.8,  # High success rate
-            'gradle/wrapper/gradle-wrapper.properties': 0.8,  # High success rate
-            'pom.xml': 0.6,  # Medium success rate
-            'build.gradle': 0.6,  # Medium success rate
-            'Jenkinsfile': 0.4,  # Lower success rate
-            'gradle.properties': 0.3,  # Lower success rate
-            'maven-wrapper.properties': 0.2,  # Rare
-        }
-        
-        # Sort by success rate (highest first)
-        def get_success_rate(pattern):
-            return success_rates.get(pattern, 0.1)
-        
-        return sorted(file_patterns, key=get_success_rate, reverse=True)
+        # One pass dropping each pattern into its priority tier, then concatenate -
+        # the same order as a stable sort, without a key callback per pattern
+        buckets = [[] for _ in range(_UNKNOWN_FILE_PRIORITY + 1)]
+        for pattern in file_patterns:
+            buckets[_FILE_PRIORITY.get(pattern, _UNKNOWN_FILE_PRIORITY)].append(pattern)
+        return [pattern for bucket in buckets for pattern in bucket]
     
     def create_analysis_plan(self, 
                            repositories: List[Repository],
@@ -519,24 +568,9 @@ class APIOptimizer:
         Returns:
             List of optimization suggestions
         """
-        suggestions = []
-        
-        if current_calls > target_calls:
-            reduction_needed = current_calls - target_calls
-            
-            if reduction_needed > current_calls * 0.5:
-                suggestions.append("Use --jenkins-only mode (reduces calls by 70%)")
-                suggestions.append("Enable aggressive caching")
-                suggestions.append("Use bulk file fetching")
-            
-            if reduction_needed > current_calls * 0.3:
-                suggestions.append("Reduce max_workers to 4 or less")
-                suggestions.append("Increase rate_limit_delay to 0.1s")
-                suggestions.append("Use file pattern filtering")
-            
-            if reduction_needed > current_calls * 0.2:
-                suggestions.append("Enable caching with --use-cache")
-                suggestions.append("Use --optimized flag")
-                suggestions.append("Run in multiple sessions")
+        if current_calls <= target_calls:
+            return []
         
-        return suggestions 
\ No newline at end of file
+        # Number of thresholds strictly below the fraction of calls to cut
+        reduction_fraction = (current_calls - target_calls) / current_calls
+        return list(_SUGGESTIONS_BY_STEP[bisect_left(_SUGGESTION_THRESHOLDS, reduction_fraction)]) 
\ No newline at end of file
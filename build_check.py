@@ -34,9 +34,20 @@ import time
 import logging
 import pickle
 import fnmatch
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import functools
+import base64
+import hashlib
+import io
+import math
+import xml.etree.ElementTree as ElementTree
+import sqlite3
+import threading
+from typing import Dict, Iterator, List, Optional, Tuple
+from collections import defaultdict
+from dataclasses import dataclass, replace, fields
+from datetime import datetime
+from operator import attrgetter
+from concurrent.futures import Future, ThreadPoolExecutor
 from github import Github, Repository, RateLimitExceededException, GithubException
 from rich.console import Console
 from rich.table import Table
@@ -58,8 +69,222 @@ except ImportError:
     APIOptimizer = None
     APIPrediction = None
 
+# Decode API responses with orjson when it is installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    # Fallback to the standard library decoder
+    _json_loads = json.loads
+
 console = Console()
 
+# Version validation patterns, compiled once at import
+_INVALID_VERSION_PATTERNS = [
+    re.compile(r'\b(def|import|apply|plugin|group|version|repos|subprojects|allprojects)\b', re.IGNORECASE),
+    re.compile(r'[{}]'),  # Curly braces
+    re.compile(r'^\s*$'),  # Empty or whitespace only
+    re.compile(r'^[^0-9]'),  # Doesn't start with a number
+    re.compile(r'[<>]'),  # XML-like tags
+]
+_DIGIT_PATTERN = re.compile(r'\d')
+_VERSION_CHARS_PATTERN = re.compile(r'^[\d.+\-a-zA-Z_]+$')
+
+# Common placeholder patterns for Java versions
+_PLACEHOLDER_PATTERNS = [
+    re.compile(r'^\$\{.*\}$'),  # ${java.version}, ${version.java}, etc.
+    re.compile(r'^\$[a-zA-Z_][a-zA-Z0-9_.]*$'),  # $java.version, $version.java, etc. (without numbers)
+    re.compile(r'^[a-zA-Z_][a-zA-Z0-9_.]*$'),  # javaVersion, versionJava, etc. (without numbers)
+    re.compile(r'^\$\{[a-zA-Z_][a-zA-Z0-9_.]*\}$'),  # ${java.version}, ${version.java}, etc.
+    re.compile(r'^\$[a-zA-Z_][a-zA-Z0-9_.]*\.[a-zA-Z0-9_.]*$'),  # $java.runtime.version, etc.
+]
+
+# Translation table for escaping text interpolated into the HTML report. One C-level
+# str.translate pass per value, equivalent to html.escape(value, quote=True).
+_HTML_ESCAPE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#x27;'})
+# Versions, paths and repository names rarely need escaping; one regex search lets
+# those skip the per-character translate pass and be returned without a copy
+_HTML_UNSAFE = re.compile(r'[&<>"\']')
+
+def _escape_html(value) -> str:
+    """Escape a report value for inclusion in HTML (None renders as 'None' as before)"""
+    value = str(value)
+    return value.translate(_HTML_ESCAPE) if _HTML_UNSAFE.search(value) else value
+
+# Repository fields kept in the repository list cache - everything the analysis reads.
+# Repositories are rebuilt incomplete (see _repository_from_raw), so reading any
+# other attribute makes PyGithub fetch the full repository from the kept 'url'.
+_CACHED_REPOSITORY_FIELDS = ('id', 'name', 'full_name', 'url', 'default_branch', 'archived', 'size', 'pushed_at')
+
+# Every file written to the cache directory: pickled caches with their count
+# sidecars, and the SQLite HTTP cache with its write-ahead log files
+CACHE_FILE_SUFFIXES = ('.pkl', '.pkl.meta', '.sqlite', '.sqlite-wal', '.sqlite-shm')
+
+@functools.lru_cache(maxsize=128)
+def _title(value: str) -> str:
+    """Title-case a build tool name; memoized since only a handful of names repeat across all rows"""
+    return value.title()
+
+# HTML report row templates - the static markup is built once at import and only
+# the cell values are formatted per row. Rows are emitted one per line with short,
+# unquoted class names (.r repository, .v version badge) to keep large reports small.
+_HTML_BUILD_TOOL_ROW = (
+    "\n<tr><td><span class=r>{repository}</span></td><td><strong>{name}</strong></td>"
+    "<td><span class=v>{version}</span></td><td><code>{file_path}</code></td><td>{detection_method}</td></tr>"
+)
+_HTML_JAVA_VERSION_ROW = (
+    "\n<tr><td><span class=r>{repository}</span></td><td><span class=v>{version}</span></td>"
+    "<td>{source_compatibility}</td><td>{target_compatibility}</td>"
+    "<td><code>{file_path}</code></td><td>{detection_method}</td></tr>"
+)
+_HTML_PLUGIN_VERSION_ROW = (
+    "\n<tr><td><span class=r>{repository}</span></td><td><strong>{name}</strong></td>"
+    "<td><span class=v>{version}</span></td><td><code>{file_path}</code></td><td>{detection_method}</td></tr>"
+)
+
+# Invariant parts of the HTML report, so each export only formats the dynamic values
+_HTML_STYLE = """    <style>
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+            line-height: 1.6;
+            margin: 0;
+            padding: 20px;
+            background-color: #f5f5f5;
+        }
+        .container {
+            max-width: 1200px;
+            margin: 0 auto;
+            background: white;
+            padding: 30px;
+            border-radius: 8px;
+            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+        }
+        h1 {
+            color: #2c3e50;
+            border-bottom: 3px solid #3498db;
+            padding-bottom: 10px;
+        }
+        h2 {
+            color: #34495e;
+            margin-top: 30px;
+        }
+        .summary-stats {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+            gap: 20px;
+            margin: 20px 0;
+        }
+        .stat-card {
+            background: #ecf0f1;
+            padding: 20px;
+            border-radius: 6px;
+            text-align: center;
+        }
+        .stat-number {
+            font-size: 2em;
+            font-weight: bold;
+            color: #3498db;
+        }
+        .stat-label {
+            color: #7f8c8d;
+            margin-top: 5px;
+        }
+        table {
+            width: 100%;
+            border-collapse: collapse;
+            margin: 20px 0;
+            background: white;
+        }
+        th, td {
+            padding: 12px;
+            text-align: left;
+            border-bottom: 1px solid #ddd;
+        }
+        th {
+            background-color: #3498db;
+            color: white;
+            font-weight: bold;
+        }
+        tr:nth-child(even) {
+            background-color: #f8f9fa;
+        }
+        tr:hover {
+            background-color: #e3f2fd;
+        }
+        .v {
+            background: #27ae60;
+            color: white;
+            padding: 4px 8px;
+            border-radius: 12px;
+            font-size: 0.9em;
+            font-weight: bold;
+        }
+        .r {
+            font-family: 'Courier New', monospace;
+            background: #f1f2f6;
+            padding: 2px 6px;
+            border-radius: 4px;
+        }
+        .analysis-mode {
+            background: #e8f5e8;
+            border: 1px solid #27ae60;
+            padding: 10px;
+            border-radius: 6px;
+            margin: 20px 0;
+        }
+        .timestamp {
+            color: #7f8c8d;
+            font-size: 0.9em;
+            text-align: center;
+            margin-top: 30px;
+        }
+    </style>
+</head>
+"""
+_HTML_BUILD_TOOL_TABLE_HEAD = """
+        <h2>🛠️ Build Tool Versions</h2>
+        <table>
+            <thead>
+                <tr>
+                    <th>Repository</th>
+                    <th>Build Tool</th>
+                    <th>Version</th>
+                    <th>Config File</th>
+                    <th>Detection Method</th>
+                </tr>
+            </thead>
+            <tbody>"""
+_HTML_JAVA_VERSION_TABLE_HEAD = """
+        <h2>☕ Java Versions</h2>
+        <table>
+            <thead>
+                <tr>
+                    <th>Repository</th>
+                    <th>Java Version</th>
+                    <th>Source Compatibility</th>
+                    <th>Target Compatibility</th>
+                    <th>Config File</th>
+                    <th>Detection Method</th>
+                </tr>
+            </thead>
+            <tbody>"""
+_HTML_PLUGIN_VERSION_TABLE_HEAD = """
+        <h2>🔌 Plugin Versions</h2>
+        <table>
+            <thead>
+                <tr>
+                    <th>Repository</th>
+                    <th>Plugin Name</th>
+                    <th>Version</th>
+                    <th>Config File</th>
+                    <th>Detection Method</th>
+                </tr>
+            </thead>
+            <tbody>"""
+_HTML_TABLE_END = """
+            </tbody>
+        </table>"""
+
 # Configure logging
 def display_configuration(org_name: str, token: str, output: str, csv: str, html: str, 
                          jenkins_only: bool, optimized: bool, rate_limit_delay: float, 
@@ -186,9 +411,246 @@ class PluginVersion:
     branch: str
     detection_method: str
 
+@dataclass
+class CompiledPatterns:
+    """A list of regex patterns compiled once, searched one at a time in priority order
+    
+    The patterns are deliberately not fused into a single alternation: a match of
+    one alternative consumes text that a later pattern may need (e.g. the Jenkins
+    `maven 'Maven 3.8.1'` match hides the bare 3.8.1 from the fallback pattern).
+    kinds carries an optional per-pattern tag (e.g. 'source'/'target' for Java patterns).
+    """
+    regexes: List[re.Pattern]
+    kinds: List[Optional[str]]
+    
+    @classmethod
+    def compile(cls, patterns: List[str], flags: int, kinds: Optional[List[str]] = None) -> 'CompiledPatterns':
+        return cls([re.compile(p, flags) for p in patterns], kinds or [None] * len(patterns))
+    
+    def first_matches(self, content: str) -> Iterator[Tuple[int, Tuple[Optional[str], ...]]]:
+        """Yield (pattern index, capture groups) of the first match of each matching pattern, in pattern order"""
+        for index, regex in enumerate(self.regexes):
+            match = regex.search(content)
+            if match:
+                yield index, match.groups()
+
+@dataclass
+class RateLimitStatus:
+    """Core rate limit state as reported by the X-RateLimit-* headers of the last response"""
+    remaining: int
+    limit: int
+    reset: datetime
+
+# Column order of each finding type in every report format
+_BUILD_TOOL_FIELDS = attrgetter('repository', 'name', 'version', 'file_path', 'detection_method')
+_JAVA_VERSION_FIELDS = attrgetter('repository', 'version', 'source_compatibility', 'target_compatibility', 'file_path', 'detection_method')
+_PLUGIN_VERSION_FIELDS = attrgetter('repository', 'plugin_name', 'version', 'file_path', 'detection_method')
+
+@dataclass
+class ReportRows:
+    """The findings flattened once into tuples, shared by the JSON, CSV and HTML exporters
+    
+    Materializing the rows a single time means requesting several report formats
+    doesn't re-walk (or, for stored findings, re-query) the findings per format.
+    """
+    build_tools: List[tuple]
+    java_versions: List[tuple]
+    plugin_versions: List[tuple]
+    
+    @classmethod
+    def from_findings(cls, all_build_tools: List['BuildTool'], all_java_versions: List['JavaVersion'], all_plugin_versions: List['PluginVersion']) -> 'ReportRows':
+        return cls(
+            list(map(_BUILD_TOOL_FIELDS, all_build_tools)),
+            list(map(_JAVA_VERSION_FIELDS, all_java_versions)),
+            list(map(_PLUGIN_VERSION_FIELDS, all_plugin_versions))
+        )
+
+class StoredFindings:
+    """A read-only, re-iterable view over one findings table in a ResultStore
+    
+    Supports len(), truthiness and iteration like the lists it replaces, but rows
+    are only turned back into dataclass instances while they are being iterated.
+    """
+    
+    def __init__(self, conn: sqlite3.Connection, table: str, record_type: type):
+        self.conn = conn
+        self.table = table
+        self.record_type = record_type
+    
+    def __len__(self) -> int:
+        return self.conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+    
+    def __bool__(self) -> bool:
+        return self.conn.execute(f"SELECT 1 FROM {self.table} LIMIT 1").fetchone() is not None
+    
+    def __iter__(self):
+        record_type = self.record_type
+        for row in self.conn.execute(f"SELECT * FROM {self.table} ORDER BY rowid"):
+            yield record_type(*row)
+
+class ResultStore:
+    """Spills analysis findings to an on-disk SQLite database
+    
+    Findings are inserted as each repository finishes instead of being held in
+    three ever-growing lists, so memory stays flat on very large organizations.
+    With an empty path the database is private to the connection and removed when
+    it is closed. With a path it persists across runs, holding the findings of
+    each repository together with the version they were analyzed at
+    (see store_repository), so unchanged repositories can be read back.
+    """
+    
+    TABLES = (('build_tools', BuildTool), ('java_versions', JavaVersion), ('plugin_versions', PluginVersion))
+    
+    def __init__(self, path: str = ""):
+        # An empty filename gives a private temporary database that SQLite
+        # keeps in its page cache until it grows, then spills to disk. Persistent
+        # stores are written by the analysis workers, so the connection is shared
+        # behind a lock.
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.lock = threading.Lock()
+        self.inserts = {}
+        self.selects = {}
+        self.row_getters = {}
+        if path:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+        for table, record_type in self.TABLES:
+            columns = [field.name for field in fields(record_type)]
+            self.conn.execute(f"CREATE TABLE IF NOT EXISTS {table} ({', '.join(columns)})")
+            self.inserts[table] = f"INSERT INTO {table} VALUES ({', '.join('?' * len(columns))})"
+            self.selects[table] = f"SELECT * FROM {table} WHERE repository = ? ORDER BY rowid"
+            # Reads the fields straight into a row tuple; astuple walks fields()
+            # and deep-copies every value for each record
+            self.row_getters[table] = attrgetter(*columns)
+            if path:
+                self.conn.execute(f"CREATE INDEX IF NOT EXISTS {table}_repository ON {table} (repository)")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS repositories "
+            "(repository TEXT PRIMARY KEY, pushed_at TEXT, default_branch TEXT, fingerprint TEXT)"
+        )
+    
+    def add(self, build_tools: List[BuildTool], java_versions: List[JavaVersion], plugin_versions: List[PluginVersion]):
+        """Store the findings of one repository"""
+        with self.lock:
+            for (table, _), records in zip(self.TABLES, (build_tools, java_versions, plugin_versions)):
+                if records:
+                    self.conn.executemany(self.inserts[table], map(self.row_getters[table], records))
+    
+    def repository_versions(self, fingerprint: str) -> Dict[str, Tuple[str, str]]:
+        """Return {repository: (pushed_at, default_branch)} of the findings stored under fingerprint"""
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT repository, pushed_at, default_branch FROM repositories WHERE fingerprint = ?", (fingerprint,)
+            ).fetchall()
+        return {repository: (pushed_at, default_branch) for repository, pushed_at, default_branch in rows}
+    
+    def store_repository(self, repository: str, version: Tuple[str, str], fingerprint: str, build_tools: List[BuildTool], java_versions: List[JavaVersion], plugin_versions: List[PluginVersion]):
+        """Replace the stored findings of one repository, recording the version they belong to"""
+        with self.lock:
+            for table, _ in self.TABLES:
+                self.conn.execute(f"DELETE FROM {table} WHERE repository = ?", (repository,))
+            for (table, _), records in zip(self.TABLES, (build_tools, java_versions, plugin_versions)):
+                if records:
+                    self.conn.executemany(self.inserts[table], map(self.row_getters[table], records))
+            self.conn.execute("INSERT OR REPLACE INTO repositories VALUES (?, ?, ?, ?)", (repository, *version, fingerprint))
+    
+    def repository_findings(self, repository: str) -> Tuple[List[BuildTool], List[JavaVersion], List[PluginVersion]]:
+        """Read back the stored (build_tools, java_versions, plugin_versions) of one repository"""
+        with self.lock:
+            return tuple(
+                [record_type(*row) for row in self.conn.execute(self.selects[table], (repository,))]
+                for table, record_type in self.TABLES
+            )
+    
+    def commit(self):
+        with self.lock:
+            self.conn.commit()
+    
+    def views(self) -> Tuple[StoredFindings, StoredFindings, StoredFindings]:
+        """Return (build_tools, java_versions, plugin_versions) views over the stored findings"""
+        self.commit()
+        return tuple(StoredFindings(self.conn, table, record_type) for table, record_type in self.TABLES)
+    
+    def close(self):
+        self.conn.close()
+
+def _request_json(requester, verb: str, url: str, parameters: Optional[Dict[str, str]] = None, headers: Optional[Dict[str, str]] = None, input=None) -> Tuple[Dict[str, str], object]:
+    """
+    Make a request like PyGithub's requestJsonAndCheck, decoding the body with _json_loads
+    
+    Args:
+        requester: PyGithub Requester to send the request with
+        verb: HTTP method
+        url: API URL to request
+        parameters: Optional query parameters
+        headers: Optional request headers
+        input: Optional JSON request body
+        
+    Returns:
+        Tuple of (response headers, decoded body); the body is None when empty
+        
+    Raises:
+        GithubException: If the response status is 400 or above
+    """
+    status, response_headers, output = requester.requestJson(verb, url, parameters, headers, input)
+    data = None
+    if output:
+        try:
+            data = _json_loads(output)
+        except ValueError:
+            # Same leniency as PyGithub: plain-text bodies are wrapped, broken JSON is an error
+            if output.startswith(('{', '[')):
+                raise
+            data = {'data': output}
+    if status >= 400:
+        raise requester.createException(status, response_headers, data)
+    return response_headers, data
+
+class HttpCache:
+    """Conditional request cache: ETag and decoded body per API resource, in SQLite
+    
+    Entries are read and written one resource at a time, so a run only loads the
+    responses it revalidates and every new ETag is stored as soon as it arrives.
+    An empty path gives a private temporary database that lasts for the run.
+    """
+    
+    def __init__(self, path: str = ""):
+        # Shared by the fetch workers, so one connection guarded by a lock
+        self.conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.lock = threading.Lock()
+        if path:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, etag TEXT, body BLOB, fetched_at REAL)")
+    
+    def get(self, key: tuple) -> Optional[Tuple[str, object]]:
+        """Return (etag, decoded body) stored for key, or None"""
+        with self.lock:
+            row = self.conn.execute("SELECT etag, body FROM entries WHERE key = ?", (json.dumps(key),)).fetchone()
+        return (row[0], pickle.loads(row[1])) if row else None
+    
+    def put(self, key: tuple, etag: str, data):
+        """Store the ETag and decoded body of a response"""
+        body = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)",
+                (json.dumps(key), etag, body, time.time())
+            )
+    
+    def close(self):
+        self.conn.close()
+
 class SimpleBuildAnalyzer:
     """Simplified analyzer focused on actual build tool versions and Java versions"""
     
+    # Above this many rows the detailed report is printed as plain text instead of a Rich Table
+    PLAIN_TABLE_THRESHOLD = 10_000
+    
+    # Repositories whose candidate files are prefetched at a time. The next batch is
+    # prefetched while one is analyzed, so at most two batches are held in memory.
+    PREFETCH_BATCH_SIZE = 100
+    
     def __init__(self, github_token: str, org_name: str, rate_limit_delay: float = 0.05, max_workers: int = 8, verbose: bool = False, use_cache: bool = False, cache_dir: str = ".cache", exclusions: Optional[Dict[str, List[str]]] = None):
         """
         Initialize the analyzer with GitHub credentials and configuration
@@ -203,12 +665,20 @@ class SimpleBuildAnalyzer:
             cache_dir: Directory to store cache files (default: .cache)
             exclusions: Dictionary with 'repositories' and 'patterns' lists for exclusion rules
         """
-        self.github = Github(github_token)
+        # One shared pool for per-file fetches, so the total number of threads stays
+        # bounded at high worker counts instead of every repository starting its own
+        fetch_workers = max(4, max_workers)
+        # Size the keep-alive connection pool for every thread that can issue a request
+        # (analysis workers + fetch workers). With the default of 10, extra connections
+        # are discarded after each request and pay a new TCP/TLS handshake next time.
+        self.github = Github(github_token, per_page=100, pool_size=max_workers + fetch_workers)
         self.org_name = org_name
         self.org = self.github.get_organization(org_name)
         self.rate_limit_delay = rate_limit_delay
         self.max_workers = max_workers
+        self.fetch_executor = ThreadPoolExecutor(max_workers=fetch_workers, thread_name_prefix="buildcheck-fetch")
         self.api_calls_made = 0  # Track API usage for monitoring and debugging
+        self.api_calls_lock = threading.Lock()  # Calls are made from worker threads
         self.verbose = verbose
         
         # Caching configuration
@@ -216,13 +686,28 @@ class SimpleBuildAnalyzer:
         self.cache_dir = cache_dir
         self.cache_duration = 3600  # Cache repositories for 1 hour
         
-        # Rate limiting optimization - cache rate limit info to avoid excessive API calls
-        self.last_rate_limit_check = 0
-        self.rate_limit_cache = None
-        self.rate_limit_cache_duration = 30  # Cache rate limit info for 30 seconds
+        # Rate limit state from the X-RateLimit-* headers of the last response of
+        # each budget. REST (core) and GraphQL are limited separately, but PyGithub
+        # keeps a single rate_limiting figure that responses of both overwrite.
+        self.rate_limit_cache = None  # Core (REST) budget
+        self.graphql_rate_limit = None
+        self.rate_limit_lock = threading.Lock()
+        # Earliest time.monotonic() at which the next call may start while close to
+        # the limit. Shared by all worker threads so they pace as one client.
+        self.next_paced_call = 0.0
+        
+        # Conditional request cache. Revalidating with If-None-Match returns 304 for
+        # unchanged resources, which GitHub does not count against the primary rate
+        # limit. Only persisted when caching is enabled.
+        self.etag_cache = HttpCache(self._get_cache_path('http', '.sqlite') if use_cache else "")
         
         # Repository exclusions
         self.exclusions = exclusions or {'repositories': [], 'patterns': []}
+        # Precompute exclusion checks: exact names as a set, and all glob patterns
+        # fused into one regex so each repository name is matched once
+        self.excluded_names = frozenset(self.exclusions.get('repositories', []))
+        patterns = self.exclusions.get('patterns', [])
+        self.exclusion_regex = re.compile('|'.join(fnmatch.translate(pattern) for pattern in patterns)) if patterns else None
         
         # API optimizer for prediction and optimization
         self.api_optimizer = APIOptimizer(self.github, org_name, verbose, cache_dir, self.cache_duration) if APIOptimizer else None
@@ -326,6 +811,14 @@ class SimpleBuildAnalyzer:
             }
         }
         
+        # Structured parsers for Java settings, keyed by file name. These read the
+        # parsed document instead of running the DOTALL regexes over it; build
+        # scripts (Groovy/Kotlin DSL) and unparseable files use the patterns above.
+        self.java_parsers = {
+            'pom.xml': self._parse_pom_java_settings,
+            'gradle.properties': self._parse_properties_java_settings
+        }
+        
         # Define plugin version detection patterns
         self.plugin_version_patterns = {
             'gradle': {
@@ -337,63 +830,185 @@ class SimpleBuildAnalyzer:
                 ]
             }
         }
+        
+        # Detection results per blob SHA: {sha: {(detector, path): result}}. A file's
+        # results are a pure function of its content and the patterns, so unchanged
+        # files are neither downloaded nor re-scanned on later runs. The cache is
+        # dropped whenever the patterns change.
+        self.patterns_fingerprint = hashlib.sha1(
+            repr((self.build_tools, self.java_version_patterns, sorted(self.java_parsers), self.plugin_version_patterns)).encode()
+        ).hexdigest()
+        cached_results = self._load_persistent_cache('blob_results') or {}
+        if cached_results.get('fingerprint') == self.patterns_fingerprint:
+            self.blob_results = cached_results['results']
+        else:
+            self.blob_results = {}
+        
+        # Findings per repository, only reused while the repository's pushed_at and
+        # default branch are unchanged. Both come with the repository listing, so
+        # unchanged repositories cost no API calls. Only those versions, keyed by
+        # repository name (the store is per organization), are held in memory; the
+        # findings stay in the store and are read back when a repository is reused.
+        self.repo_result_store = ResultStore(self._get_cache_path('repo_results', '.sqlite') if use_cache else "")
+        self.repo_results = self.repo_result_store.repository_versions(self.patterns_fingerprint)
+        # Set when the repository list was loaded from the list cache. Its pushed_at
+        # values can be up to cache_duration old, so findings are not reused then.
+        self.repository_list_cached = False
+        
+        self._compile_patterns()
+        
+        # Every file any detector may read, in first-seen order, so that all
+        # candidates for a repository can be fetched in one request
+        self.candidate_files = list(dict.fromkeys(
+            file_name
+            for config in (*self.build_tools.values(), *self.java_version_patterns.values(), *self.plugin_version_patterns.values())
+            for file_name in config['files']
+        ))
+        
+        # Candidate files fetched ahead of analysis for the current and next batch of
+        # repositories, keyed by full name; analyze_repository pops its entry
+        self.prefetched_files = {}
+        
+        # Full names of repositories with a file that could not be fetched for a
+        # reason other than not existing (timeouts, 5xx, secondary rate limits).
+        # Their findings may be incomplete, so they are not stored for reuse.
+        self.failed_fetches = set()
+        self.failed_fetches_lock = threading.Lock()  # Files are fetched from worker threads
+
+    def close(self):
+        """Shut down the file fetch workers and close the HTTP and repository result caches"""
+        self.fetch_executor.shutdown(wait=True)
+        self.etag_cache.close()
+        self.repo_result_store.close()
+
+    def _compile_patterns(self):
+        """
+        Pre-compile all detection patterns once so extraction doesn't re-parse them per file
+        
+        Build tool and Java patterns are compiled per config ('compiled'). Java
+        patterns are tagged with their kind so _extract_java_version doesn't need to
+        inspect the pattern source for every match.
+        """
+        flags = re.IGNORECASE | re.MULTILINE | re.DOTALL
+        
+        for tool_config in self.build_tools.values():
+            tool_config['compiled'] = CompiledPatterns.compile(tool_config['version_patterns'], flags)
+        
+        for java_config in self.java_version_patterns.values():
+            kinds = []
+            for pattern in java_config['patterns']:
+                pattern_lower = pattern.lower()
+                if 'source' in pattern_lower and 'target' not in pattern_lower:
+                    kind = 'source'
+                elif 'target' in pattern_lower:
+                    kind = 'target'
+                elif 'java.version' in pattern_lower:
+                    kind = 'java.version'
+                else:
+                    kind = 'compiler'
+                kinds.append(kind)
+            java_config['compiled'] = CompiledPatterns.compile(java_config['patterns'], flags, kinds)
+        
+        for plugin_config in self.plugin_version_patterns.values():
+            plugin_config['compiled'] = [re.compile(p, re.IGNORECASE | re.MULTILINE) for p in plugin_config['patterns']]
+
+    def get_rate_limit_status(self) -> RateLimitStatus:
+        """
+        Get the current core (REST) rate limit status, preferably without a request
+        
+        The headers of every response read through _request_json are recorded per
+        budget by _record_rate_limit, so the REST budget is known for free once a
+        REST response has been seen. The rate limit endpoint, which doesn't count
+        against the limit, is only asked before that or after the recorded reset.
+        
+        Returns:
+            RateLimitStatus with the remaining and total requests and the reset time
+        """
+        with self.rate_limit_lock:
+            status = self.rate_limit_cache
+        if status is None or status.reset.timestamp() <= time.time():
+            core_limit = self.github.get_rate_limit().core
+            status = RateLimitStatus(core_limit.remaining, core_limit.limit, core_limit.reset)
+            with self.rate_limit_lock:
+                self.rate_limit_cache = status
+        return status
+
+    def _record_rate_limit(self, response_headers: Dict[str, str]):
+        """
+        Record the X-RateLimit-* headers of a response under the budget they describe
+        
+        Args:
+            response_headers: Lowercased response headers, as returned by _request_json
+        """
+        try:
+            status = RateLimitStatus(
+                int(float(response_headers['x-ratelimit-remaining'])),
+                int(float(response_headers['x-ratelimit-limit'])),
+                datetime.fromtimestamp(int(float(response_headers['x-ratelimit-reset'])))
+            )
+        except (KeyError, ValueError):
+            return
+        
+        resource = response_headers.get('x-ratelimit-resource', 'core')
+        with self.rate_limit_lock:
+            if resource == 'core':
+                self.rate_limit_cache = status
+            elif resource == 'graphql':
+                self.graphql_rate_limit = status
 
     def _check_rate_limit(self):
         """
-        Check and handle GitHub API rate limits with caching to reduce API calls
+        Check and handle GitHub API rate limits using the headers of the last response
         
         GitHub has strict API limits (5000 requests/hour for authenticated users).
         This method monitors our usage and implements backoff strategies to avoid
         hitting these limits. It's crucial for the script to work reliably with
         large organizations.
         
-        Performance optimization: Cache rate limit info for 30 seconds to avoid
-        excessive API calls that were slowing down the script significantly.
+        The status comes from get_rate_limit_status(), so checking costs no extra
+        requests once responses are flowing. Throttled 403/429 responses are
+        retried by PyGithub's GithubRetry, which already honours Retry-After and
+        the reset header.
         """
-        current_time = time.time()
-        
-        # Use cached rate limit info if it's still fresh (within 30 seconds)
-        if (self.rate_limit_cache and 
-            current_time - self.last_rate_limit_check < self.rate_limit_cache_duration):
-            core_limit = self.rate_limit_cache
-        else:
-            # Only make API call if cache is stale or doesn't exist
-            try:
-                rate_limit = self.github.get_rate_limit()
-                core_limit = rate_limit.core
-                self.rate_limit_cache = core_limit
-                self.last_rate_limit_check = current_time
-                
-                if self.verbose:
-                    logging.debug(f"Rate limit check: {core_limit.remaining}/{core_limit.limit} requests remaining")
-                    logging.debug(f"  - Reset time: {core_limit.reset.strftime('%Y-%m-%d %H:%M:%S')}")
-            except Exception as e:
-                # If we can't check rate limits, continue but warn
-                # This prevents the script from failing if rate limit checking fails
-                console.print(f"[yellow]Warning: Could not check rate limit: {str(e)}[/yellow]")
-                if self.verbose:
-                    logging.warning(f"Could not check rate limit: {str(e)}")
-                return
-        
-        # If we're close to the limit, add extra delay to slow down
-        # This prevents us from hitting the limit unexpectedly
-        if core_limit.remaining < 50:
-            extra_delay = (50 - core_limit.remaining) * 0.05
-            time.sleep(extra_delay)
-            console.print(f"[yellow]Rate limit warning: {core_limit.remaining} requests remaining[/yellow]")
+        try:
+            status = self.get_rate_limit_status()
+        except Exception as e:
+            # If we can't check rate limits, continue but warn
+            # This prevents the script from failing if rate limit checking fails
+            console.print(f"[yellow]Warning: Could not check rate limit: {str(e)}[/yellow]")
             if self.verbose:
-                logging.warning(f"Rate limit warning: {core_limit.remaining} requests remaining, added {extra_delay:.2f}s delay")
+                logging.warning(f"Could not check rate limit: {str(e)}")
+            return
         
-        # If we've hit the limit, wait until reset
-        # This is the nuclear option - we've used all our requests
-        if core_limit.remaining == 0:
-            reset_timestamp = core_limit.reset.timestamp()
-            wait_time = reset_timestamp - time.time()
+        if self.verbose:
+            logging.debug(f"Rate limit check: {status.remaining}/{status.limit} requests remaining")
+            logging.debug(f"  - Reset time: {status.reset.strftime('%Y-%m-%d %H:%M:%S')}")
+        
+        # If we've hit the limit, wait until the exact reset time from the headers
+        if status.remaining == 0:
+            wait_time = status.reset.timestamp() - time.time()
             if wait_time > 0:
                 console.print(f"[red]Rate limit exceeded. Waiting {int(wait_time)} seconds until reset...[/red]")
                 if self.verbose:
                     logging.error(f"Rate limit exceeded. Waiting {int(wait_time)} seconds until reset")
                 time.sleep(wait_time + 1)
+        
+        # If we're close to the limit, spread the remaining budget over the time
+        # left until reset instead of a fixed slowdown. Each call reserves the next
+        # slot under the lock, so the workers together - not each of them - make
+        # one call per interval.
+        elif status.remaining < 50:
+            interval = max(0.0, status.reset.timestamp() - time.time()) / status.remaining
+            with self.rate_limit_lock:
+                now = time.monotonic()
+                slot = max(self.next_paced_call, now)
+                self.next_paced_call = slot + interval
+            extra_delay = slot - now
+            if extra_delay > 0:
+                time.sleep(extra_delay)
+            console.print(f"[yellow]Rate limit warning: {status.remaining} requests remaining[/yellow]")
+            if self.verbose:
+                logging.warning(f"Rate limit warning: {status.remaining} requests remaining, added {extra_delay:.2f}s delay")
 
     def _make_api_call(self, call_description: str = "API call"):
         """
@@ -408,26 +1023,28 @@ class SimpleBuildAnalyzer:
         Args:
             call_description: Description of the API call for logging/debugging
         """
-        # Only check rate limit every 10 calls to reduce overhead
-        if self.api_calls_made % 10 == 0:
-            self._check_rate_limit()
+        # Rate limit state comes from the last response's headers, so checking
+        # on every call costs no extra requests
+        self._check_rate_limit()
         
-        self.api_calls_made += 1
+        with self.api_calls_lock:
+            self.api_calls_made += 1
+            call_number = self.api_calls_made
         
         # Add minimal delay between calls - reduced from 0.1s to 0.05s for better performance
         # 0.05s delay means max 20 calls/second, still well within GitHub's limits
-        if self.api_calls_made > 1:
+        if call_number > 1:
             time.sleep(self.rate_limit_delay)
 
         if self.verbose:
             # Use cached rate limit info instead of making another API call
             if self.rate_limit_cache:
-                logging.debug(f"API Call #{self.api_calls_made}: {call_description}")
+                logging.debug(f"API Call #{call_number}: {call_description}")
                 logging.debug(f"  - Rate Limit: {self.rate_limit_cache.remaining}/{self.rate_limit_cache.limit} requests remaining")
                 logging.debug(f"  - Rate Limit Reset: {self.rate_limit_cache.reset.strftime('%Y-%m-%d %H:%M:%S')}")
                 logging.debug(f"  - Delay Applied: {self.rate_limit_delay}s")
             else:
-                logging.debug(f"API Call #{self.api_calls_made}: {call_description}")
+                logging.debug(f"API Call #{call_number}: {call_description}")
                 logging.debug(f"  - Rate limit info not available")
                 logging.debug(f"  - Delay Applied: {self.rate_limit_delay}s")
 
@@ -479,15 +1096,11 @@ class SimpleBuildAnalyzer:
             True if repository should be excluded, False otherwise
         """
         # Check exact repository names
-        if repo_name in self.exclusions.get('repositories', []):
+        if repo_name in self.excluded_names:
             return True
         
         # Check pattern-based exclusions
-        for pattern in self.exclusions.get('patterns', []):
-            if fnmatch.fnmatch(repo_name, pattern):
-                return True
-        
-        return False
+        return self.exclusion_regex is not None and self.exclusion_regex.match(repo_name) is not None
 
     def search_repos_with_jenkinsfiles(self) -> List[Repository]:
         """
@@ -604,8 +1217,6 @@ class SimpleBuildAnalyzer:
         repos = []
         
         try:
-            self._make_api_call("Get organization repositories")
-            
             if self.verbose:
                 logging.info(f"Fetching all repositories from organization: {self.org_name}")
             
@@ -614,10 +1225,11 @@ class SimpleBuildAnalyzer:
             empty_repos = 0
             excluded_repos = 0
             
-            # Use pagination to handle large organizations efficiently
-            # GitHub API returns 30 repos per page by default, but we can request up to 100
-            page = 1
-            per_page = 100  # Maximum allowed by GitHub API
+            # GraphQL lists the repositories with only the fields the analysis reads;
+            # without it, page through the REST listing.
+            pages = self._graphql_repository_pages()
+            if pages is None:
+                pages = self._rest_repository_pages()
             
             with Progress(
                 SpinnerColumn(),
@@ -627,22 +1239,23 @@ class SimpleBuildAnalyzer:
                 console=console
             ) as progress:
                 task = progress.add_task(
-                    f"Fetching repositories (page {page})...", 
+                    "Fetching repositories...", 
                     total=None  # We don't know total yet
                 )
                 
-                while True:
-                    # Fetch repositories with pagination
-                    self._make_api_call(f"Get organization repositories page {page}")
-                    page_repos = list(self.org.get_repos().get_page(page - 1))  # GitHub uses 0-based indexing
-                    
-                    if not page_repos:
-                        break  # No more repositories
-                    
+                for page_repos in pages:
                     # Process repositories in this page
                     for repo in page_repos:
                         total_repos += 1
                         
+                        # Check if repository should be excluded - by name only, before
+                        # any other repository attribute is read
+                        if self._should_exclude_repository(repo.name):
+                            excluded_repos += 1
+                            if self.verbose:
+                                logging.debug(f"Skipping excluded repository: {repo.name}")
+                            continue
+                        
                         # Skip archived and empty repos - they're unlikely to have build configurations
                         # This reduces noise and focuses analysis on active projects
                         if repo.archived:
@@ -657,28 +1270,12 @@ class SimpleBuildAnalyzer:
                                 logging.debug(f"Skipping empty repository: {repo.name}")
                             continue
                         
-                        # Check if repository should be excluded
-                        if self._should_exclude_repository(repo.name):
-                            excluded_repos += 1
-                            if self.verbose:
-                                logging.debug(f"Skipping excluded repository: {repo.name}")
-                            continue
-                        
                         repos.append(repo)
                         if self.verbose:
                             logging.debug(f"Added repository for analysis: {repo.name} (size: {repo.size} bytes)")
                     
                     # Update progress
                     progress.update(task, description=f"Fetched {total_repos} repositories (found: {len(repos)}, skipped: {archived_repos + empty_repos + excluded_repos})")
-                    
-                    # If we got fewer repos than requested, we've reached the end
-                    if len(page_repos) < per_page:
-                        break
-                    
-                    page += 1
-                    
-                    # Add a small delay between pages to be respectful
-                    time.sleep(0.1)
             
             if total_repos == 0:
                 console.print("[yellow]No repositories found in the organization[/yellow]")
@@ -705,13 +1302,124 @@ class SimpleBuildAnalyzer:
         
         return repos
 
-    def get_specific_repository(self, repo_name: str) -> Optional[Repository]:
+    def _rest_repository_pages(self) -> Iterator[List[Repository]]:
         """
-        Get a specific repository by name
-        
-        This method retrieves a single repository from the GitHub organization
-        by its name. It's useful for analyzing a specific repository instead
-        of the entire organization.
+        Yield the organization's repositories page by page from the REST listing
+        
+        Returns:
+            Iterator over lists of up to 100 repositories
+        """
+        self._make_api_call("Get organization repositories")
+        
+        # Use pagination to handle large organizations efficiently
+        # GitHub API returns 30 repos per page by default, but we can request up to 100
+        per_page = 100  # Maximum allowed by GitHub API
+        
+        # Create the paginated listing once and request its pages directly rather
+        # than rebuilding a PaginatedList for every page
+        paginated_repos = self.org.get_repos()
+        
+        page = 0  # GitHub uses 0-based indexing
+        while True:
+            self._make_api_call(f"Get organization repositories page {page + 1}")
+            page_repos = list(paginated_repos.get_page(page))
+            
+            if not page_repos:
+                return  # No more repositories
+            
+            yield page_repos
+            
+            # If we got fewer repos than requested, we've reached the end
+            if len(page_repos) < per_page:
+                return
+            
+            page += 1
+
+    def _graphql_repository_pages(self, page_size: int = 100) -> Optional[Iterator[List[Repository]]]:
+        """
+        List the organization's repositories through GraphQL
+        
+        Each page carries just the fields the repository cache keeps, far smaller
+        than the full REST repository payloads. Candidate files are fetched later,
+        per analysis batch (see prefetch_repository_files). The first page is
+        fetched before returning so callers can fall back to REST.
+        
+        Args:
+            page_size: Number of repositories per query
+            
+        Returns:
+            Iterator over pages of repositories, or None if the GraphQL API could not be used
+            
+        Raises:
+            GithubException: If a page after the first could not be fetched
+        """
+        first_page = self._graphql_repository_page(None, page_size)
+        if first_page is None:
+            return None
+        
+        def pages(page):
+            while True:
+                page_repos, cursor = page
+                yield page_repos
+                if cursor is None:
+                    return
+                page = self._graphql_repository_page(cursor, page_size)
+                if page is None:
+                    raise GithubException(502, {"message": "GraphQL repository listing failed part-way"}, None)
+        
+        return pages(first_page)
+
+    def _graphql_repository_page(self, cursor: Optional[str], page_size: int) -> Optional[Tuple[List[Repository], Optional[str]]]:
+        """
+        Fetch one page of organization repositories via GraphQL
+        
+        Args:
+            cursor: End cursor of the previous page, or None for the first page
+            page_size: Number of repositories per query
+            
+        Returns:
+            Tuple of (repositories, cursor of the next page or None), or None if the
+            GraphQL API could not be used
+        """
+        requester = self.org._requester
+        query = (
+            "query($org: String!, $cursor: String) { organization(login: $org) { "
+            f"repositories(first: {page_size}, after: $cursor) {{ pageInfo {{ hasNextPage endCursor }} "
+            "nodes { databaseId name nameWithOwner isArchived diskUsage pushedAt defaultBranchRef { name } } } } }"
+        )
+        data = self._graphql_request(
+            requester, query, {"org": self.org_name, "cursor": cursor},
+            f"GraphQL list of up to {page_size} repositories"
+        )
+        connection = ((data or {}).get('organization') or {}).get('repositories')
+        if connection is None:
+            return None
+        
+        page_repos = []
+        for node in connection['nodes']:
+            # The same fields the repository list cache keeps, in REST form
+            raw = {
+                'id': node['databaseId'],
+                'name': node['name'],
+                'full_name': node['nameWithOwner'],
+                'url': f"{requester.base_url}/repos/{node['nameWithOwner']}",
+                'default_branch': (node['defaultBranchRef'] or {}).get('name'),
+                'archived': node['isArchived'],
+                'size': node['diskUsage'],
+                'pushed_at': node['pushedAt']
+            }
+            page_repos.append(self._repository_from_raw(raw))
+        
+        page_info = connection['pageInfo']
+        return page_repos, page_info['endCursor'] if page_info['hasNextPage'] else None
+
+    def get_specific_repository(self, repo_name: str) -> Optional[Repository]:
+        """
+        Get a specific repository by name
+        
+        This method retrieves a single repository from the GitHub organization
+        by its name. It's useful for analyzing a specific repository instead
+        of the entire organization.
         
         Args:
             repo_name: Name of the repository to retrieve
@@ -776,14 +1484,39 @@ class SimpleBuildAnalyzer:
         if self.verbose:
             logging.info(f"Starting analysis of repository: {repo.name}")
         
-        try:
-            # Get repository contents from the default branch
-            # Most build configurations are in the default branch
-            self._make_api_call(f"Get contents for {repo.name}")
-            contents = repo.get_contents("", ref=repo.default_branch)
-            
+        # Empty repositories have nothing to detect - skip them using the metadata
+        # we already have instead of spending API calls on them
+        if repo.size == 0:
+            if self.verbose:
+                logging.debug(f"Skipping empty repository: {repo.name}")
+            return build_tools, java_versions, plugin_versions
+        
+        # Nothing has been pushed since the last analysis - reuse its findings
+        with self.failed_fetches_lock:
+            self.failed_fetches.discard(repo.full_name)
+        repo_version = (str(repo.pushed_at), repo.default_branch)
+        if self._has_reusable_findings(repo):
             if self.verbose:
-                logging.debug(f"Retrieved repository contents for {repo.name}")
+                logging.debug(f"Reusing findings for unchanged repository: {repo.name}")
+            return self.repo_result_store.repository_findings(repo.name)
+        
+        try:
+            # Fetch every candidate file in a single GraphQL request. If GraphQL is
+            # unavailable, list the tree once instead and concurrently fetch the
+            # candidates that exist and whose blob hasn't been analyzed before
+            # (no tree means trying every candidate).
+            tree = None
+            blobs = self.prefetched_files.pop(repo.full_name, None)
+            if blobs is None:
+                blobs = self._graphql_fetch_files(repo, self.candidate_files)
+            if blobs is not None:
+                shas = {path: sha for path, (sha, _) in blobs.items()}
+                file_contents = {path: content for path, (_, content) in blobs.items()}
+            else:
+                tree = self._list_repo_tree(repo) or {}
+                shas = {path: tree[path] for path in self.candidate_files if path in tree}
+                uncached = [path for path in self.candidate_files if shas.get(path) not in self.blob_results]
+                file_contents = self._fetch_files_concurrently(repo, uncached, tree or None)
             
             # Check each build tool type
             for tool_name, tool_config in self.build_tools.items():
@@ -793,29 +1526,28 @@ class SimpleBuildAnalyzer:
                 # Check files in order of reliability
                 for file_name in tool_config['files']:
                     try:
-                        # Try to get the file content
-                        file_content = self._get_file_content(repo, file_name)
-                        if file_content:
-                            # Extract version using the defined patterns
-                            version = self._extract_version(file_content, tool_config['version_patterns'])
-                            if version:
-                                if self.verbose:
-                                    logging.info(f"Found {tool_name} version {version} in {repo.name} ({file_name})")
-                                
-                                # Found a version - create BuildTool object
-                                build_tools.append(BuildTool(
-                                    name=tool_name,
-                                    version=version,
-                                    file_path=file_name,
-                                    repository=repo.name,
-                                    branch=repo.default_branch,
-                                    detection_method=f"Found in {file_name}"
-                                ))
-                                # Stop checking other files for this tool - we found the version
-                                break
-                            else:
-                                if self.verbose:
-                                    logging.debug(f"No {tool_name} version found in {file_name} for {repo.name}")
+                        # Extract version using the defined patterns
+                        version = self._detect_cached(
+                            repo, ('build', tool_name), file_name, file_contents, shas, tree,
+                            lambda content: self._extract_version(content, tool_config['compiled'])
+                        )
+                        if version:
+                            if self.verbose:
+                                logging.info(f"Found {tool_name} version {version} in {repo.name} ({file_name})")
+                            
+                            # Found a version - create BuildTool object
+                            build_tools.append(BuildTool(
+                                name=tool_name,
+                                version=version,
+                                file_path=file_name,
+                                repository=repo.name,
+                                branch=repo.default_branch,
+                                detection_method=f"Found in {file_name}"
+                            ))
+                            # Stop checking other files for this tool - we found the version
+                            break
+                        elif self.verbose and file_name in shas:
+                            logging.debug(f"No {tool_name} version found in {file_name} for {repo.name}")
                     except Exception as e:
                         # File doesn't exist or can't be read - continue to next file
                         if self.verbose:
@@ -829,14 +1561,17 @@ class SimpleBuildAnalyzer:
                 
                 for file_name in java_config['files']:
                     try:
-                        file_content = self._get_file_content(repo, file_name)
-                        if file_content:
-                            java_version = self._extract_java_version(file_content, java_config['patterns'], build_tool, file_name, repo.name, repo.default_branch)
-                            if java_version:
-                                if self.verbose:
-                                    logging.info(f"Found Java version {java_version.version} in {repo.name} ({file_name})")
-                                java_versions.append(java_version)
-                                break  # Found Java version for this build tool
+                        java_version = self._detect_cached(
+                            repo, ('java', build_tool), file_name, file_contents, shas, tree,
+                            lambda content: self._extract_java_version(content, java_config['compiled'], build_tool, file_name, repo.name, repo.default_branch)
+                        )
+                        if java_version:
+                            # Cached results may come from another repository with the same blob
+                            java_version = replace(java_version, repository=repo.name, branch=repo.default_branch)
+                            if self.verbose:
+                                logging.info(f"Found Java version {java_version.version} in {repo.name} ({file_name})")
+                            java_versions.append(java_version)
+                            break  # Found Java version for this build tool
                     except Exception as e:
                         if self.verbose:
                             logging.debug(f"Error checking Java version in {file_name} for {repo.name}: {str(e)}")
@@ -849,14 +1584,16 @@ class SimpleBuildAnalyzer:
                 
                 for file_name in plugin_config['files']:
                     try:
-                        file_content = self._get_file_content(repo, file_name)
-                        if file_content:
-                            plugin_version = self._extract_plugin_version(file_content, plugin_config['patterns'], build_tool, file_name, repo.name, repo.default_branch)
-                            if plugin_version:
-                                if self.verbose:
-                                    logging.info(f"Found plugin version {plugin_version.version} in {repo.name} ({file_name})")
-                                plugin_versions.append(plugin_version)
-                                break  # Found plugin version for this build tool
+                        plugin_version = self._detect_cached(
+                            repo, ('plugin', build_tool), file_name, file_contents, shas, tree,
+                            lambda content: self._extract_plugin_version(content, plugin_config['compiled'], build_tool, file_name, repo.name, repo.default_branch)
+                        )
+                        if plugin_version:
+                            plugin_version = replace(plugin_version, repository=repo.name, branch=repo.default_branch)
+                            if self.verbose:
+                                logging.info(f"Found plugin version {plugin_version.version} in {repo.name} ({file_name})")
+                            plugin_versions.append(plugin_version)
+                            break  # Found plugin version for this build tool
                     except Exception as e:
                         if self.verbose:
                             logging.debug(f"Error checking plugin version in {file_name} for {repo.name}: {str(e)}")
@@ -864,6 +1601,17 @@ class SimpleBuildAnalyzer:
             
             if self.verbose:
                 logging.info(f"Completed analysis of {repo.name}: {len(build_tools)} build tools, {len(java_versions)} Java versions, {len(plugin_versions)} plugin versions")
+            
+            with self.failed_fetches_lock:
+                fetch_failed = repo.full_name in self.failed_fetches
+                self.failed_fetches.discard(repo.full_name)
+            if fetch_failed:
+                # Only a missing file means absent - don't reuse findings built on a failed fetch
+                if self.verbose:
+                    logging.debug(f"Not storing findings for {repo.name}: some files could not be fetched")
+            elif repo.pushed_at:
+                self.repo_result_store.store_repository(repo.name, repo_version, self.patterns_fingerprint, build_tools, java_versions, plugin_versions)
+                self.repo_results[repo.name] = repo_version
                         
         except Exception as e:
             console.print(f"[yellow]Warning: Could not analyze {repo.name}: {str(e)}[/yellow]")
@@ -963,7 +1711,7 @@ class SimpleBuildAnalyzer:
                             content = repo_files[file_name]
                             if self.verbose:
                                 logging.debug(f"Checking {tool_name} in {file_name} for {repo_name}")
-                            version = self._extract_version(content, tool_config['version_patterns'])
+                            version = self._extract_version(content, tool_config['compiled'])
                             if version:
                                 if self.verbose:
                                     logging.info(f"Found {tool_name} version {version} in {repo_name} ({file_name})")
@@ -987,7 +1735,7 @@ class SimpleBuildAnalyzer:
                         if file_name in repo_files:
                             content = repo_files[file_name]
                             java_version = self._extract_java_version(
-                                content, java_config['patterns'], build_tool, 
+                                content, java_config['compiled'], build_tool, 
                                 file_name, repo_name, repo.default_branch
                             )
                             if java_version:
@@ -1000,7 +1748,7 @@ class SimpleBuildAnalyzer:
                         if file_name in repo_files:
                             content = repo_files[file_name]
                             plugin_version = self._extract_plugin_version(
-                                content, plugin_config['patterns'], build_tool,
+                                content, plugin_config['compiled'], build_tool,
                                 file_name, repo_name, repo.default_branch
                             )
                             if plugin_version:
@@ -1013,15 +1761,18 @@ class SimpleBuildAnalyzer:
         
         return all_build_tools, all_java_versions, all_plugin_versions
 
-    def analyze_repositories_individual(self, repositories: List[Repository]) -> Tuple[List[BuildTool], List[JavaVersion], List[PluginVersion]]:
+    def analyze_repositories_individual(self, repositories: List[Repository], result_store: Optional[ResultStore] = None) -> Tuple[List[BuildTool], List[JavaVersion], List[PluginVersion]]:
         """
         Analyze repositories using individual analysis (fallback method)
         
         Args:
             repositories: List of repositories to analyze
+            result_store: Optional on-disk store that findings are streamed into as
+                each repository finishes, instead of accumulating them in memory
             
         Returns:
-            Tuple of (build_tools, java_versions, plugin_versions) found in all repositories
+            Tuple of (build_tools, java_versions, plugin_versions) found in all repositories.
+            With a result_store these are StoredFindings views rather than lists.
         """
         console.print(f"[bold blue]Analyzing {len(repositories)} repositories individually...[/bold blue]")
         
@@ -1041,59 +1792,499 @@ class SimpleBuildAnalyzer:
                 total=len(repositories)
             )
             
-            # Use ThreadPoolExecutor for parallel processing
+            # Use ThreadPoolExecutor for parallel processing. executor.map needs no
+            # future-to-repository bookkeeping: analyze_repository_parallel already
+            # isolates per-repository errors, and results arrive in repository order.
+            # Progress is advanced here rather than from inside the workers.
+            # Repositories are analyzed in batches whose candidate files are fetched
+            # with a few GraphQL requests. The next batch is prefetched on the fetch
+            # pool while the current one is analyzed, so workers don't sit idle
+            # waiting for it and only two batches of file contents are held at once.
+            batches = [
+                repositories[start:start + self.PREFETCH_BATCH_SIZE]
+                for start in range(0, len(repositories), self.PREFETCH_BATCH_SIZE)
+            ]
             with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                future_to_repo = {
-                    executor.submit(self.analyze_repository_parallel, repo, task): repo 
-                    for repo in repositories
-                }
-                
-                for future in as_completed(future_to_repo):
-                    try:
-                        build_tools, java_versions, plugin_versions = future.result()
-                        all_build_tools.extend(build_tools)
-                        all_java_versions.extend(java_versions)
-                        all_plugin_versions.extend(plugin_versions)
-                    except Exception as e:
-                        repo = future_to_repo[future]
-                        console.print(f"[red]Error analyzing {repo.name}: {str(e)}[/red]")
+                prefetch = self.fetch_executor.submit(self.prefetch_repository_files, batches[0]) if batches else None
+                for index, batch in enumerate(batches):
+                    prefetch.result()
+                    if index + 1 < len(batches):
+                        prefetch = self.fetch_executor.submit(self.prefetch_repository_files, batches[index + 1])
+                    for build_tools, java_versions, plugin_versions in executor.map(self.analyze_repository_parallel, batch):
+                        if result_store:
+                            result_store.add(build_tools, java_versions, plugin_versions)
+                        else:
+                            all_build_tools.extend(build_tools)
+                            all_java_versions.extend(java_versions)
+                            all_plugin_versions.extend(plugin_versions)
+                        progress.advance(task)
+                    # Drop entries a failed analysis didn't consume, keeping the next batch's
+                    for repo in batch:
+                        self.prefetched_files.pop(repo.full_name, None)
+        
+        self._save_analysis_caches()
         
+        if result_store:
+            return result_store.views()
         return all_build_tools, all_java_versions, all_plugin_versions
 
-    def _get_file_content(self, repo: Repository, file_path: str) -> Optional[str]:
+    def _graphql_request(self, requester, query: str, variables: Dict[str, str], description: str) -> Optional[dict]:
+        """
+        Send a GraphQL query through PyGithub's requester (same token, retries and pooling)
+        
+        Args:
+            requester: PyGithub requester of the repository or organization
+            query: GraphQL query document
+            variables: Values for the query's variables
+            description: Description of the call for logging/debugging
+            
+        Returns:
+            The response's 'data' object, or None if the GraphQL API could not be used
+        """
+        base_url = requester.base_url
+        if base_url.endswith('/api/v3'):
+            graphql_url = base_url[:-len('v3')] + 'graphql'  # GitHub Enterprise Server
+        else:
+            graphql_url = f"{base_url}/graphql"
+        
+        try:
+            self._make_api_call(description)
+            response_headers, response = _request_json(
+                requester, "POST", graphql_url, input={"query": query, "variables": variables}
+            )
+            self._record_rate_limit(response_headers)
+        except GithubException as e:
+            if self.verbose:
+                logging.debug(f"{description} failed: {str(e)}")
+            return None
+        
+        data = (response or {}).get('data')
+        if data is None and self.verbose:
+            logging.debug(f"{description} returned no data: {(response or {}).get('errors')}")
+        return data
+
+    def _graphql_fetch_files(self, repo: Repository, paths: List[str], batch_size: int = 100) -> Optional[Dict[str, Tuple[str, str]]]:
+        """
+        Fetch several files from the default branch with one GraphQL request per batch
+        
+        Each path becomes an aliased `object(expression: "branch:path")` field, so
+        the whole candidate list costs one round-trip instead of one per file.
+        
+        Args:
+            repo: GitHub Repository object
+            paths: File paths to fetch, relative to the repository root
+            batch_size: Maximum number of aliased fields per query
+            
+        Returns:
+            Dictionary mapping path to (blob SHA, content) for files that exist, or
+            None if the GraphQL API could not be used
+        """
+        owner, name = repo.full_name.split('/', 1)
+        
+        contents = {}
+        for start in range(0, len(paths), batch_size):
+            batch = paths[start:start + batch_size]
+            fields = self._graphql_file_fields(repo.default_branch, batch)
+            query = f"query($owner: String!, $name: String!) {{ repository(owner: $owner, name: $name) {{ {fields} }} }}"
+            
+            data = self._graphql_request(
+                repo._requester, query, {"owner": owner, "name": name},
+                f"GraphQL fetch of {len(batch)} files from {repo.name}"
+            )
+            repository = (data or {}).get('repository')
+            if repository is None:
+                return None
+            
+            contents.update(self._graphql_file_blobs(repository, batch))
+        
+        if self.verbose:
+            logging.debug(f"Fetched {len(contents)}/{len(paths)} candidate files from {repo.name} via GraphQL")
+        return contents
+
+    def _graphql_file_fields(self, branch: str, paths: List[str]) -> str:
+        """Build aliased `object(expression: "branch:path")` fields, f0..fN, for paths"""
+        return " ".join(
+            f'f{i}: object(expression: {json.dumps(f"{branch}:{path}")}) {{ ... on Blob {{ oid text }} }}'
+            for i, path in enumerate(paths)
+        )
+
+    def _graphql_file_blobs(self, repository: dict, paths: List[str]) -> Dict[str, Tuple[str, str]]:
+        """Map each path to (blob SHA, content) from a repository queried with _graphql_file_fields"""
+        contents = {}
+        for i, path in enumerate(paths):
+            blob = repository.get(f"f{i}")
+            # Missing files come back as null, binary blobs with a null text
+            if blob and blob.get('text') is not None:
+                contents[path] = (blob['oid'], blob['text'])
+        return contents
+
+    def prefetch_repository_files(self, repositories: List[Repository], repos_per_query: int = 50) -> int:
+        """
+        Fetch the candidate files of many repositories with one GraphQL request per group
+        
+        Each repository becomes an aliased `repository(owner:, name:)` field holding
+        the same file fields as _graphql_fetch_files, so a group of repositories
+        costs one round-trip instead of one per repository. analyze_repository uses
+        the prefetched files instead of fetching them itself. Empty and unchanged
+        repositories are skipped, as analyze_repository doesn't read their files.
+        
+        Args:
+            repositories: Repositories about to be analyzed
+            repos_per_query: Maximum number of repositories per query
+            
+        Returns:
+            Number of repositories whose files were prefetched
+        """
+        pending = [repo for repo in repositories if repo.size != 0 and not self._has_reusable_findings(repo)]
+        
+        prefetched = 0
+        for start in range(0, len(pending), repos_per_query):
+            group = pending[start:start + repos_per_query]
+            fields = " ".join(
+                f'r{j}: repository(owner: {json.dumps(repo.full_name.split("/", 1)[0])}, name: {json.dumps(repo.name)}) '
+                f'{{ {self._graphql_file_fields(repo.default_branch, self.candidate_files)} }}'
+                for j, repo in enumerate(group)
+            )
+            data = self._graphql_request(
+                group[0]._requester, f"query {{ {fields} }}", {},
+                f"GraphQL fetch of candidate files from {len(group)} repositories"
+            )
+            if data is None:
+                # GraphQL is unavailable - each repository falls back to its own fetch
+                break
+            
+            for j, repo in enumerate(group):
+                repository = data.get(f"r{j}")
+                if repository is not None:
+                    self.prefetched_files[repo.full_name] = self._graphql_file_blobs(repository, self.candidate_files)
+                    prefetched += 1
+        
+        if self.verbose:
+            logging.debug(f"Prefetched candidate files for {prefetched}/{len(pending)} repositories via GraphQL")
+        return prefetched
+
+    def _has_reusable_findings(self, repo: Repository) -> bool:
+        """
+        Check whether stored findings of a repository can be reused instead of analyzing it
+        
+        Findings are reused only while pushed_at and the default branch match the
+        stored version, and only if pushed_at was listed live rather than read from
+        the repository list cache.
+        
+        Args:
+            repo: GitHub Repository object
+            
+        Returns:
+            True if the stored findings are current
+        """
+        if not repo.pushed_at or self.repository_list_cached:
+            return False
+        return self.repo_results.get(repo.name) == (str(repo.pushed_at), repo.default_branch)
+
+    def _detect_cached(self, repo: Repository, detector: Tuple[str, str], file_path: str, file_contents: Dict[str, Optional[str]], shas: Dict[str, str], tree: Optional[Dict[str, str]], extract):
+        """
+        Run a detector on a file, reusing the result recorded for the same blob SHA
+        
+        Args:
+            repo: GitHub Repository object
+            detector: Key identifying the detector, e.g. ('build', 'maven')
+            file_path: Path to the file within the repository
+            file_contents: Per-repository file cache shared by all detectors; values
+                may be pending futures, and None marks a file that couldn't be read
+                (updated in place)
+            shas: Blob SHA per existing candidate path
+            tree: Optional {path: sha} listing used for on-demand fetches
+            extract: Callable that runs the detector on the file content
+            
+        Returns:
+            The detector result, or None if the file doesn't exist or nothing was found
+        """
+        sha = shas.get(file_path)
+        key = (detector, file_path)
+        if sha is not None:
+            cached = self.blob_results.get(sha)
+            if cached is not None and key in cached:
+                return cached[key]
+            if file_path not in file_contents:
+                # The blob was skipped as already analyzed, but not by this detector.
+                # Misses are recorded as None so no file is requested twice per repository.
+                file_contents[file_path] = self._get_file_content(repo, file_path, tree)
+        
+        content = file_contents.get(file_path)
+        if isinstance(content, Future):
+            # Still downloading when it was queued - wait for this file only
+            content = file_contents[file_path] = content.result()
+        if not content:
+            return None
+        
+        result = extract(content)
+        if sha is not None:
+            self.blob_results.setdefault(sha, {})[key] = result
+        return result
+
+    def _fetch_files_concurrently(self, repo: Repository, paths: List[str], tree: Optional[Dict[str, str]] = None) -> Dict[str, Future]:
+        """
+        Start fetching several files from a repository in parallel
+        
+        Each file is an independent HTTPS request, so issuing them concurrently makes
+        the wall-clock cost per repository roughly one round-trip instead of one per file.
+        The fetches are not awaited here: detectors resolve each file's future when
+        they reach it, so parsing the first files overlaps with downloading the rest.
+        
+        Args:
+            repo: GitHub Repository object
+            paths: File paths to fetch
+            tree: Optional {path: sha} listing used to skip files that don't exist
+            
+        Returns:
+            Dictionary mapping each path to a future of its content (None if it couldn't be read)
+        """
+        if tree is not None:
+            paths = [path for path in paths if path in tree]
+        
+        return {path: self.fetch_executor.submit(self._get_file_content, repo, path, tree) for path in paths}
+
+    def _list_repo_tree(self, repo: Repository) -> Optional[Dict[str, str]]:
+        """
+        List all files on the default branch using a single Git Trees API call
+        
+        Args:
+            repo: GitHub Repository object
+            
+        Returns:
+            Dictionary mapping file path to blob SHA, or None if the tree could not
+            be listed completely (callers then fall back to per-file fetching)
+        """
+        try:
+            self._make_api_call(f"Get tree for {repo.name}")
+            data = self._conditional_get(
+                repo,
+                f"{repo.url}/git/trees/{repo.default_branch}",
+                ('tree', repo.full_name, repo.default_branch),
+                parameters={"recursive": "1"}
+            )
+        except GithubException as e:
+            if self.verbose:
+                logging.debug(f"Could not list tree for {repo.name}: {str(e)}")
+            return None
+        
+        if not isinstance(data, dict) or not isinstance(data.get('tree'), list):
+            # No body (a 304 without a cache entry) or an error payload
+            if self.verbose:
+                logging.debug(f"No tree in the response for {repo.name}, falling back to per-file fetching")
+            return None
+        
+        if data.get('truncated'):
+            # Very large repositories return a partial tree - don't trust misses
+            if self.verbose:
+                logging.debug(f"Tree listing truncated for {repo.name}, falling back to per-file fetching")
+            return None
+        
+        tree = {item['path']: item['sha'] for item in data['tree'] if item.get('type') == 'blob'}
+        if self.verbose:
+            logging.debug(f"Listed {len(tree)} files in {repo.name}")
+        return tree
+
+    def _get_blob_content(self, repo: Repository, sha: str) -> Optional[str]:
+        """
+        Get the decoded content of a blob by SHA using the Git Blobs API
+        
+        Args:
+            repo: GitHub Repository object
+            sha: SHA of the blob to fetch
+            
+        Returns:
+            Blob content as string, or None if it can't be read
+        """
+        self._make_api_call(f"Get blob {sha} from {repo.name}")
+        response_headers, data = _request_json(repo._requester, "GET", f"{repo.url}/git/blobs/{sha}")
+        self._record_rate_limit(response_headers)
+        raw = data.get('content', '')
+        if data.get('encoding') == 'base64':
+            return base64.b64decode(raw).decode('utf-8', errors='ignore')
+        return raw
+
+    def _get_file_content(self, repo: Repository, file_path: str, tree: Optional[Dict[str, str]] = None) -> Optional[str]:
         """
         Get file content from repository
         
         This method fetches the content of a specific file from a repository.
-        It handles the GitHub API call and decodes the content properly.
+        It handles the GitHub API call and decodes the content properly. When a
+        tree listing is supplied, missing files are skipped without an API call
+        and existing files are fetched directly by blob SHA.
         
         Args:
             repo: GitHub Repository object
             file_path: Path to the file within the repository
+            tree: Optional {path: sha} listing from _list_repo_tree
             
         Returns:
             File content as string, or None if file doesn't exist or can't be read
         """
+        if tree is not None:
+            sha = tree.get(file_path)
+            if sha is None:
+                return None
+            try:
+                decoded_content = self._get_blob_content(repo, sha)
+                if self.verbose and decoded_content is not None:
+                    logging.debug(f"Successfully retrieved {file_path} from {repo.name} ({len(decoded_content)} characters)")
+                return decoded_content
+            except Exception as e:
+                self._record_fetch_error(repo, e)
+                if self.verbose:
+                    logging.debug(f"Could not retrieve {file_path} from {repo.name}: {str(e)}")
+                return None
+        
         try:
             self._make_api_call(f"Get file {file_path} from {repo.name}")
-            content = repo.get_contents(file_path, ref=repo.default_branch)
-            if hasattr(content, 'decoded_content'):
-                decoded_content = content.decoded_content.decode('utf-8', errors='ignore')
+            content = self._conditional_get(
+                repo,
+                f"{repo.url}/contents/{file_path}",
+                ('contents', repo.full_name, repo.default_branch, file_path),
+                parameters={"ref": repo.default_branch}
+            )
+            # Directories come back as a list - only files carry content
+            if isinstance(content, dict) and content.get('encoding') == 'base64':
+                decoded_content = base64.b64decode(content.get('content', '')).decode('utf-8', errors='ignore')
                 if self.verbose:
                     logging.debug(f"Successfully retrieved {file_path} from {repo.name} ({len(decoded_content)} characters)")
                 return decoded_content
         except Exception as e:
             # File doesn't exist or can't be read - this is expected for many files
+            self._record_fetch_error(repo, e)
             if self.verbose:
                 logging.debug(f"Could not retrieve {file_path} from {repo.name}: {str(e)}")
         return None
 
-    def _get_cache_path(self, cache_type: str) -> str:
+    def _record_fetch_error(self, repo: Repository, error: Exception):
+        """
+        Note a failed file fetch unless the file simply doesn't exist
+        
+        Args:
+            repo: GitHub Repository object the file was fetched from
+            error: Exception raised by the fetch
+        """
+        if isinstance(error, GithubException) and error.status == 404:
+            return
+        with self.failed_fetches_lock:
+            self.failed_fetches.add(repo.full_name)
+
+    def _conditional_get(self, repo: Repository, url: str, cache_key: tuple, parameters: Optional[Dict[str, str]] = None):
+        """
+        Issue a GET request revalidated with If-None-Match against the ETag cache
+        
+        Args:
+            repo: GitHub Repository object whose requester is used
+            url: API URL to fetch
+            cache_key: Key identifying the resource in the ETag cache
+            parameters: Optional query parameters
+            
+        Returns:
+            Decoded JSON response, served from the cache on 304 Not Modified
+            
+        Raises:
+            GithubException: If the request fails
+        """
+        cached = self.etag_cache.get(cache_key)
+        request_headers = {'If-None-Match': cached[0]} if cached else None
+        
+        response_headers, data = _request_json(repo._requester, "GET", url, parameters=parameters, headers=request_headers)
+        self._record_rate_limit(response_headers)
+        
+        # A 304 has no body; reuse the cached response. It doesn't count against
+        # the rate limit, so it isn't counted as an API call either.
+        if data is None and cached:
+            with self.api_calls_lock:
+                self.api_calls_made -= 1
+            if self.verbose:
+                logging.debug(f"Not modified, using cached response for {url}")
+            return cached[1]
+        
+        etag = response_headers.get('etag')
+        if etag:
+            self.etag_cache.put(cache_key, etag, data)
+        return data
+
+    def _load_persistent_cache(self, cache_type: str) -> Optional[dict]:
+        """
+        Load a cache that stays valid across runs (ETags, per-blob results)
+        
+        Unlike repository lists these entries don't expire by age: ETags are
+        revalidated with the server and blob results are keyed by content SHA.
+        
+        Args:
+            cache_type: Type of cache to load
+            
+        Returns:
+            Cached dictionary, or None if caching is disabled or nothing is cached
+        """
+        if not self.use_cache:
+            return None
+        
+        cache_path = self._get_cache_path(cache_type)
+        if not os.path.exists(cache_path):
+            return None
+        
+        try:
+            with open(cache_path, 'rb') as f:
+                cached_data = pickle.load(f)
+            if self.verbose:
+                logging.debug(f"Loaded {len(cached_data)} {cache_type} entries from cache: {cache_path}")
+            return cached_data
+        except Exception as e:
+            if self.verbose:
+                logging.warning(f"Failed to load {cache_type} cache from {cache_path}: {str(e)}")
+            return None
+
+    def _save_persistent_cache(self, cache_type: str, data: dict):
+        """
+        Save a cache that stays valid across runs
+        
+        Args:
+            cache_type: Type of cache to save
+            data: Dictionary to persist
+        """
+        if not self.use_cache or not data:
+            return
+        
+        try:
+            cache_path = self._get_cache_path(cache_type)
+            with open(cache_path, 'wb') as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            self._write_cache_meta(cache_path, None)
+            if self.verbose:
+                logging.debug(f"Saved {len(data)} {cache_type} entries to cache: {cache_path}")
+        except Exception as e:
+            if self.verbose:
+                logging.warning(f"Failed to save {cache_type} cache: {str(e)}")
+
+    def _write_cache_meta(self, cache_path: str, repo_count: Optional[int]):
+        """
+        Write the small JSON sidecar next to a cache file
+        
+        The cache manager reads the repository count from the sidecar, so listing
+        caches never has to unpickle them.
+        
+        Args:
+            cache_path: Path of the cache file just written
+            repo_count: Number of cached repositories, or None for non-list caches
+        """
+        with open(cache_path + '.meta', 'w') as f:
+            json.dump({'count': repo_count, 'written': time.time()}, f)
+
+    def _save_analysis_caches(self):
+        """Persist the blob result cache and commit the repository results so the next run can reuse them"""
+        self._save_persistent_cache('blob_results', {'fingerprint': self.patterns_fingerprint, 'results': self.blob_results})
+        self.repo_result_store.commit()
+
+    def _get_cache_path(self, cache_type: str, extension: str = '.pkl') -> str:
         """
         Get the cache file path for a specific cache type
         
         Args:
             cache_type: Type of cache (e.g., 'all_repos', 'jenkins_repos')
+            extension: File extension of the cache
             
         Returns:
             Full path to the cache file
@@ -1102,8 +2293,25 @@ class SimpleBuildAnalyzer:
             os.makedirs(self.cache_dir)
         
         safe_org_name = self.org_name.replace('/', '_').replace('\\', '_')
-        return os.path.join(self.cache_dir, f"{safe_org_name}_{cache_type}.pkl")
+        return os.path.join(self.cache_dir, f"{safe_org_name}_{cache_type}{extension}")
     
+    def _repository_from_raw(self, raw: dict) -> Repository:
+        """
+        Build a Repository from the subset of its raw API data kept by the caches
+        
+        Github.create_from_raw_data marks objects complete, so attributes missing from
+        the subset would silently read as None. The repository is created incomplete
+        instead: the kept fields are read without any API call, and reading any other
+        attribute fetches the full repository once from its 'url'.
+        
+        Args:
+            raw: Raw repository fields, including at least 'url'
+            
+        Returns:
+            Lazily completable Repository object
+        """
+        return Repository.Repository(self.org._requester, {}, raw, completed=False)
+
     def _load_from_cache(self, cache_type: str) -> Optional[List[Repository]]:
         """
         Load repository list from cache if available and fresh
@@ -1119,28 +2327,39 @@ class SimpleBuildAnalyzer:
         
         cache_path = self._get_cache_path(cache_type)
         
-        if not os.path.exists(cache_path):
+        # A single stat both detects a missing file and yields its age, so expired
+        # caches are rejected without ever being opened or unpickled
+        try:
+            cache_mtime = os.stat(cache_path).st_mtime
+        except FileNotFoundError:
             if self.verbose:
                 logging.debug(f"Cache file not found: {cache_path}")
             return None
         
         try:
             # Check if cache is still fresh
-            cache_age = time.time() - os.path.getmtime(cache_path)
+            cache_age = time.time() - cache_mtime
             if cache_age > self.cache_duration:
                 if self.verbose:
                     logging.debug(f"Cache expired (age: {cache_age:.0f}s > {self.cache_duration}s): {cache_path}")
                 return None
             
-            # Load cached repositories
+            # Load cached repositories. Entries are plain API dicts which are rehydrated
+            # into Repository objects without any API call; older caches may still
+            # hold pickled Repository objects.
             with open(cache_path, 'rb') as f:
                 cached_data = pickle.load(f)
+            cached_data = [
+                self._repository_from_raw(repo) if isinstance(repo, dict) else repo
+                for repo in cached_data
+            ]
             
             if self.verbose:
                 logging.info(f"Loaded {len(cached_data)} repositories from cache: {cache_path}")
                 logging.debug(f"Cache age: {cache_age:.0f} seconds")
             
             console.print(f"[green]Loaded {len(cached_data)} repositories from cache[/green]")
+            self.repository_list_cached = True
             return cached_data
             
         except Exception as e:
@@ -1162,8 +2381,16 @@ class SimpleBuildAnalyzer:
         try:
             cache_path = self._get_cache_path(cache_type)
             
+            # Store only the needed fields of each repository's raw API data as a plain
+            # dict - pickling Repository objects drags in the requester state and breaks
+            # across PyGithub versions, and the full payload is mostly URL templates
+            cached_data = [
+                {field: repo._rawData[field] for field in _CACHED_REPOSITORY_FIELDS if field in repo._rawData}
+                for repo in repositories
+            ]
             with open(cache_path, 'wb') as f:
-                pickle.dump(repositories, f)
+                pickle.dump(cached_data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            self._write_cache_meta(cache_path, len(cached_data))
             
             if self.verbose:
                 logging.info(f"Saved {len(repositories)} repositories to cache: {cache_path}")
@@ -1175,34 +2402,33 @@ class SimpleBuildAnalyzer:
                 logging.warning(f"Failed to save cache to {cache_path}: {str(e)}")
             console.print(f"[yellow]Warning: Failed to save cache: {str(e)}[/yellow]")
 
-    def _extract_version(self, content: str, patterns: List[str]) -> Optional[str]:
+    def _extract_version(self, content: str, patterns: CompiledPatterns) -> Optional[str]:
         """
         Extract version from content using regex patterns
         
         This method applies regex patterns to extract version information from file content.
         It handles patterns with multiple capture groups (like Jenkins tool configurations)
-        and returns the most relevant version found.
+        and returns the most relevant version found. Patterns are tried in priority
+        order and later patterns are only searched if earlier ones yield nothing valid.
         
         Args:
             content: File content to search
-            patterns: List of regex patterns to try
+            patterns: Compiled regex patterns to try
             
         Returns:
             Extracted version string, or None if no version found
         """
-        for pattern in patterns:
-            match = re.search(pattern, content, re.IGNORECASE | re.MULTILINE | re.DOTALL)
-            if match:
-                # Handle patterns with multiple groups (like Jenkins tool config)
-                if len(match.groups()) > 1:
-                    # Return the last non-None group (usually the version)
-                    for group in reversed(match.groups()):
-                        if group and self._is_valid_version(group.strip()):
-                            return group.strip()
-                else:
-                    extracted = match.group(1).strip()
-                    if self._is_valid_version(extracted):
-                        return extracted
+        for _, groups in patterns.first_matches(content):
+            # Handle patterns with multiple groups (like Jenkins tool config)
+            if len(groups) > 1:
+                # Return the last non-None group (usually the version)
+                for group in reversed(groups):
+                    if group and self._is_valid_version(group.strip()):
+                        return group.strip()
+            else:
+                extracted = groups[0].strip()
+                if self._is_valid_version(extracted):
+                    return extracted
         return None
 
     def _is_valid_version(self, version_str: str) -> bool:
@@ -1226,25 +2452,17 @@ class SimpleBuildAnalyzer:
             return False
         
         # Skip if it contains obvious non-version text
-        invalid_patterns = [
-            r'\b(def|import|apply|plugin|group|version|repos|subprojects|allprojects)\b',
-            r'[{}]',  # Curly braces
-            r'^\s*$',  # Empty or whitespace only
-            r'^[^0-9]',  # Doesn't start with a number
-            r'[<>]',  # XML-like tags
-        ]
-        
-        for pattern in invalid_patterns:
-            if re.search(pattern, cleaned, re.IGNORECASE):
+        for pattern in _INVALID_VERSION_PATTERNS:
+            if pattern.search(cleaned):
                 return False
         
         # Check if it contains at least one digit and looks like a version
-        if re.search(r'\d', cleaned) and re.match(r'^[\d.+\-a-zA-Z_]+$', cleaned):
+        if _DIGIT_PATTERN.search(cleaned) and _VERSION_CHARS_PATTERN.match(cleaned):
             return True
         
         return False
 
-    def _extract_java_version(self, content: str, patterns: List[str], build_tool: str, file_path: str, repo_name: str, branch: str) -> Optional[JavaVersion]:
+    def _extract_java_version(self, content: str, patterns: CompiledPatterns, build_tool: str, file_path: str, repo_name: str, branch: str) -> Optional[JavaVersion]:
         """
         Extract Java version information from content using patterns
         
@@ -1255,7 +2473,8 @@ class SimpleBuildAnalyzer:
         
         Args:
             content: File content to search
-            patterns: List of regex patterns to try
+            patterns: Compiled regex patterns tagged with kinds 'source', 'target',
+                'java.version' or 'compiler'
             build_tool: Which build tool this is for (maven/gradle)
             file_path: Path to the file being analyzed
             repo_name: Name of the repository
@@ -1271,38 +2490,45 @@ class SimpleBuildAnalyzer:
         # Track what we found for better detection method description
         found_sources = []
         
-        for pattern in patterns:
-            if self.verbose:
-                logging.debug(f"Trying pattern: {pattern}")
-            match = re.search(pattern, content, re.IGNORECASE | re.MULTILINE | re.DOTALL)
-            if match:
-                extracted = match.group(1).strip()
-                if self.verbose:
-                    logging.debug(f"Pattern matched. Extracted value: '{extracted}' from file: {file_path}")
-                # Skip placeholder values that don't represent actual versions
-                if self._is_placeholder_version(extracted):
+        # Prefer the structured parser for this file type; None means the content
+        # could not be parsed and the regex patterns are used instead
+        parser = self.java_parsers.get(os.path.basename(file_path))
+        candidates = parser(content) if parser else None
+        if candidates is None:
+            candidates = []
+            for index, groups in patterns.first_matches(content):
+                if groups[0] is not None:
+                    candidates.append((patterns.kinds[index], groups[0].strip()))
                     if self.verbose:
-                        logging.debug(f"Skipped placeholder value: '{extracted}'")
-                    continue
-                
-                # Determine what type of version this is based on pattern content
-                if 'source' in pattern.lower() and 'target' not in pattern.lower():
-                    if not source_compat:  # Only set if not already found
-                        source_compat = extracted
-                        found_sources.append('source compatibility')
-                elif 'target' in pattern.lower():
-                    if not target_compat:  # Only set if not already found
-                        target_compat = extracted
-                        found_sources.append('target compatibility')
-                elif 'java.version' in pattern.lower():
-                    if not version:  # Only set if not already found
-                        version = extracted
-                        found_sources.append('java.version property')
-                else:
-                    # Default to version if we can't determine type
-                    if not version:  # Only set if not already found
-                        version = extracted
-                        found_sources.append('compiler configuration')
+                        logging.debug(f"Pattern #{index} ({patterns.kinds[index]}) matched. Extracted value: '{candidates[-1][1]}' from file: {file_path}")
+        elif self.verbose:
+            logging.debug(f"Parsed {file_path} structurally. Extracted values: {candidates}")
+        
+        for kind, extracted in candidates:
+            # Skip placeholder values that don't represent actual versions
+            if self._is_placeholder_version(extracted):
+                if self.verbose:
+                    logging.debug(f"Skipped placeholder value: '{extracted}'")
+                continue
+            
+            # Record the value according to the kind of setting that matched
+            if kind == 'source':
+                if not source_compat:  # Only set if not already found
+                    source_compat = extracted
+                    found_sources.append('source compatibility')
+            elif kind == 'target':
+                if not target_compat:  # Only set if not already found
+                    target_compat = extracted
+                    found_sources.append('target compatibility')
+            elif kind == 'java.version':
+                if not version:  # Only set if not already found
+                    version = extracted
+                    found_sources.append('java.version property')
+            else:
+                # Default to version if we can't determine type
+                if not version:  # Only set if not already found
+                    version = extracted
+                    found_sources.append('compiler configuration')
         
         # If we found any Java version information, create the object
         if version or source_compat or target_compat:
@@ -1312,24 +2538,97 @@ class SimpleBuildAnalyzer:
             
             # Clean up version strings (remove 'VERSION_' prefix, etc.)
             if primary_version and primary_version.startswith('VERSION_'):
-                primary_version = primary_version.replace('VERSION_', '')
+                primary_version = primary_version[len('VERSION_'):]
             
             # Create a more descriptive detection method
             detection_method = f"Found in {build_tool} configuration"
             if found_sources:
                 detection_method += f" ({', '.join(found_sources)})"
             
-            return JavaVersion(
-                version=primary_version,
-                source_compatibility=source_compat,
-                target_compatibility=target_compat,
-                file_path=file_path,
-                repository=repo_name,
-                branch=branch,
-                detection_method=detection_method
-            )
+            return JavaVersion(
+                version=primary_version,
+                source_compatibility=source_compat,
+                target_compatibility=target_compat,
+                file_path=file_path,
+                repository=repo_name,
+                branch=branch,
+                detection_method=detection_method
+            )
+        
+        return None
+
+    def _parse_pom_java_settings(self, content: str) -> Optional[List[Tuple[str, str]]]:
+        """
+        Read Java settings from a parsed pom.xml
+        
+        Looks up the java.version and maven.compiler.source/target properties and
+        the maven-compiler-plugin configuration, in that order of priority. Element
+        lookups use the {*} wildcard so the POM namespace doesn't matter.
+        
+        Args:
+            content: pom.xml content
+            
+        Returns:
+            List of (kind, value) pairs, or None if the document isn't well-formed XML
+        """
+        try:
+            root = ElementTree.fromstring(content)
+        except ElementTree.ParseError:
+            return None
+        
+        settings = [
+            ('java.version', root.findtext('.//{*}java.version')),
+            ('source', root.findtext('.//{*}maven.compiler.source')),
+            ('target', root.findtext('.//{*}maven.compiler.target'))
+        ]
+        for plugin in root.iterfind('.//{*}plugin'):
+            if (plugin.findtext('{*}artifactId') or '').strip() == 'maven-compiler-plugin':
+                settings.append(('source', plugin.findtext('{*}configuration/{*}source')))
+                settings.append(('target', plugin.findtext('{*}configuration/{*}target')))
+                break
+        
+        return [(kind, value.strip()) for kind, value in settings if value and value.strip()]
+
+    def _parse_properties(self, content: str) -> Dict[str, str]:
+        """
+        Parse a Java properties file (key=value or key: value per line) in a single pass
+        
+        Args:
+            content: Properties file content
+            
+        Returns:
+            Dictionary of property values; the first definition of a key wins
+        """
+        properties = {}
+        for line in content.splitlines():
+            line = line.strip()
+            if not line or line[0] in '#!':
+                continue
+            separator = min((i for i in (line.find('='), line.find(':')) if i > 0), default=-1)
+            if separator > 0:
+                properties.setdefault(line[:separator].strip(), line[separator + 1:].strip())
+        return properties
+
+    def _parse_properties_java_settings(self, content: str) -> List[Tuple[str, str]]:
+        """
+        Read Java settings from a gradle.properties file
         
-        return None
+        Args:
+            content: gradle.properties content
+            
+        Returns:
+            List of (kind, value) pairs in order of priority
+        """
+        properties = self._parse_properties(content)
+        settings = []
+        for key, kind in (('sourceCompatibility', 'source'), ('targetCompatibility', 'target'),
+                          ('java.version', 'java.version'), ('org.gradle.java.home', 'compiler')):
+            value = properties.get(key, '').strip('\'"')
+            if value.startswith('JavaVersion.VERSION_'):
+                value = value[len('JavaVersion.VERSION_'):]
+            if value:
+                settings.append((kind, value))
+        return settings
 
     def _is_placeholder_version(self, version_str: str) -> bool:
         """
@@ -1344,21 +2643,12 @@ class SimpleBuildAnalyzer:
         if not version_str:
             return True
         
-        # Common placeholder patterns
-        placeholder_patterns = [
-            r'^\$\{.*\}$',  # ${java.version}, ${version.java}, etc.
-            r'^\$[a-zA-Z_][a-zA-Z0-9_.]*$',  # $java.version, $version.java, etc. (without numbers)
-            r'^[a-zA-Z_][a-zA-Z0-9_.]*$',  # javaVersion, versionJava, etc. (without numbers)
-            r'^\$\{[a-zA-Z_][a-zA-Z0-9_.]*\}$',  # ${java.version}, ${version.java}, etc.
-            r'^\$[a-zA-Z_][a-zA-Z0-9_.]*\.[a-zA-Z0-9_.]*$',  # $java.runtime.version, etc.
-        ]
-        
-        for pattern in placeholder_patterns:
-            if re.match(pattern, version_str):
+        for pattern in _PLACEHOLDER_PATTERNS:
+            if pattern.match(version_str):
                 return True
         
         # If it doesn't contain any digits, it's likely a placeholder
-        if not re.search(r'\d', version_str):
+        if not _DIGIT_PATTERN.search(version_str):
             return True
         
         # Additional checks for common placeholder-like strings
@@ -1367,7 +2657,7 @@ class SimpleBuildAnalyzer:
         
         return False
 
-    def _extract_plugin_version(self, content: str, patterns: List[str], build_tool: str, file_path: str, repo_name: str, branch: str) -> Optional[PluginVersion]:
+    def _extract_plugin_version(self, content: str, patterns: List[re.Pattern], build_tool: str, file_path: str, repo_name: str, branch: str) -> Optional[PluginVersion]:
         """
         Extract plugin version information from file content
         
@@ -1376,7 +2666,7 @@ class SimpleBuildAnalyzer:
         
         Args:
             content: File content to search in
-            patterns: List of regex patterns to search for
+            patterns: List of compiled regex patterns to search for
             build_tool: The build tool being analyzed (e.g., 'gradle')
             file_path: Path to the file being analyzed
             repo_name: Name of the repository
@@ -1386,7 +2676,7 @@ class SimpleBuildAnalyzer:
             PluginVersion object if found, None otherwise
         """
         for pattern in patterns:
-            match = re.search(pattern, content, re.IGNORECASE | re.MULTILINE)
+            match = pattern.search(content)
             if match:
                 extracted = match.group(1).strip()
                 if extracted:
@@ -1415,97 +2705,111 @@ class SimpleBuildAnalyzer:
             all_plugin_versions: List of all PluginVersion objects found across all repositories
             jenkins_only: Whether this was a Jenkins-only analysis
         """
-        console.print("\n" + "="*80)
-        console.print("[bold blue]BUILD TOOL, JAVA VERSION, AND PLUGIN VERSION ANALYSIS REPORT[/bold blue]")
-        console.print("="*80)
+        # Collect the summary into a list of lines and print it once - issuing
+        # hundreds of small console.print calls is dominated by Rich's per-call overhead
+        lines = [
+            "\n" + "="*80,
+            "[bold blue]BUILD TOOL, JAVA VERSION, AND PLUGIN VERSION ANALYSIS REPORT[/bold blue]",
+            "="*80,
+        ]
         
         # Show analysis mode
         if jenkins_only:
-            console.print("\n[bold green]ANALYSIS MODE: Jenkins-only[/bold green]")
-            console.print("-" * 30)
-            console.print("[green]Only repositories with Jenkinsfiles were analyzed[/green]")
-            console.print()
+            lines.append("\n[bold green]ANALYSIS MODE: Jenkins-only[/bold green]")
+            lines.append("-" * 30)
+            lines.append("[green]Only repositories with Jenkinsfiles were analyzed[/green]")
+            lines.append("")
         else:
-            console.print("\n[bold blue]ANALYSIS MODE: Full analysis[/bold blue]")
-            console.print("-" * 30)
-            console.print("[blue]All repositories were analyzed[/blue]")
-            console.print()
+            lines.append("\n[bold blue]ANALYSIS MODE: Full analysis[/bold blue]")
+            lines.append("-" * 30)
+            lines.append("[blue]All repositories were analyzed[/blue]")
+            lines.append("")
         
         # Important clarification
-        console.print("[bold yellow]IMPORTANT:[/bold yellow]")
-        console.print("[yellow]This report shows:[/yellow]")
-        console.print("[yellow]  • Build tool versions (Maven, Gradle) - the tools used to compile code[/yellow]")
-        console.print("[yellow]  • Java versions - the Java version the application is built with[/yellow]")
-        console.print("[yellow]  • Plugin versions - plugin versions found in gradle.properties files[/yellow]")
-        console.print()
+        lines.append("[bold yellow]IMPORTANT:[/bold yellow]")
+        lines.append("[yellow]This report shows:[/yellow]")
+        lines.append("[yellow]  • Build tool versions (Maven, Gradle) - the tools used to compile code[/yellow]")
+        lines.append("[yellow]  • Java versions - the Java version the application is built with[/yellow]")
+        lines.append("[yellow]  • Plugin versions - plugin versions found in gradle.properties files[/yellow]")
+        lines.append("")
         
         # Build Tools Summary
         if all_build_tools:
-            console.print("[bold green]BUILD TOOL VERSIONS FOUND:[/bold green]")
-            console.print("-" * 40)
+            lines.append("[bold green]BUILD TOOL VERSIONS FOUND:[/bold green]")
+            lines.append("-" * 40)
             
-            tool_summary = {}
+            # Index repositories by tool and version in a single pass
+            tool_summary = defaultdict(lambda: defaultdict(set))
             for tool in all_build_tools:
-                if tool.name not in tool_summary:
-                    tool_summary[tool.name] = {'versions': set(), 'repos': set()}
-                tool_summary[tool.name]['versions'].add(tool.version)
-                tool_summary[tool.name]['repos'].add(tool.repository)
-            
-            for tool_name, data in tool_summary.items():
-                console.print(f"\n[bold]{tool_name.upper()} BUILD TOOL VERSIONS:[/bold]")
-                for version in sorted(data['versions']):
-                    repos_with_version = [repo for repo in data['repos'] 
-                                        if any(t.version == version and t.repository == repo 
-                                              for t in all_build_tools if t.name == tool_name)]
-                    console.print(f"  [bold]Version: {version}[/bold] - Used in {len(repos_with_version)} repositories")
-                    for repo in sorted(repos_with_version):
-                        console.print(f"    • {repo}")
+                tool_summary[tool.name][tool.version].add(tool.repository)
+            
+            for tool_name, versions in tool_summary.items():
+                lines.append(f"\n[bold]{tool_name.upper()} BUILD TOOL VERSIONS:[/bold]")
+                for version in sorted(versions):
+                    repos_with_version = versions[version]
+                    lines.append(f"  [bold]Version: {version}[/bold] - Used in {len(repos_with_version)} repositories")
+                    lines.extend(f"    • {repo}" for repo in sorted(repos_with_version))
         
         # Java Versions Summary
         if all_java_versions:
-            console.print(f"\n[bold green]JAVA VERSIONS FOUND:[/bold green]")
-            console.print("-" * 40)
-            console.print("[dim]These are the Java versions the applications are built with[/dim]")
-            console.print()
+            lines.append(f"\n[bold green]JAVA VERSIONS FOUND:[/bold green]")
+            lines.append("-" * 40)
+            lines.append("[dim]These are the Java versions the applications are built with[/dim]")
+            lines.append("")
             
-            java_summary = {}
+            java_summary = defaultdict(set)
             for java in all_java_versions:
-                if java.version not in java_summary:
-                    java_summary[java.version] = {'repos': set()}
-                java_summary[java.version]['repos'].add(java.repository)
+                java_summary[java.version].add(java.repository)
             
-            for version in sorted(java_summary.keys()):
-                repos_with_version = list(java_summary[version]['repos'])
-                console.print(f"  [bold]Java Version: {version}[/bold] - Used in {len(repos_with_version)} repositories")
-                for repo in sorted(repos_with_version):
-                    console.print(f"    • {repo}")
+            for version in sorted(java_summary):
+                repos_with_version = java_summary[version]
+                lines.append(f"  [bold]Java Version: {version}[/bold] - Used in {len(repos_with_version)} repositories")
+                lines.extend(f"    • {repo}" for repo in sorted(repos_with_version))
         
         # Plugin Versions Summary
         if all_plugin_versions:
-            console.print(f"\n[bold green]PLUGIN VERSIONS FOUND:[/bold green]")
-            console.print("-" * 40)
-            console.print("[dim]These are plugin versions found in gradle.properties files[/dim]")
-            console.print()
+            lines.append(f"\n[bold green]PLUGIN VERSIONS FOUND:[/bold green]")
+            lines.append("-" * 40)
+            lines.append("[dim]These are plugin versions found in gradle.properties files[/dim]")
+            lines.append("")
             
-            plugin_summary = {}
+            plugin_summary = defaultdict(lambda: defaultdict(set))
             for plugin in all_plugin_versions:
-                if plugin.plugin_name not in plugin_summary:
-                    plugin_summary[plugin.plugin_name] = {'versions': set(), 'repos': set()}
-                plugin_summary[plugin.plugin_name]['versions'].add(plugin.version)
-                plugin_summary[plugin.plugin_name]['repos'].add(plugin.repository)
-            
-            for plugin_name, data in plugin_summary.items():
-                console.print(f"\n[bold]{plugin_name.upper()} PLUGIN VERSIONS:[/bold]")
-                for version in sorted(data['versions']):
-                    repos_with_version = [repo for repo in data['repos'] 
-                                        if any(p.version == version and p.repository == repo 
-                                              for p in all_plugin_versions if p.plugin_name == plugin_name)]
-                    console.print(f"  [bold]Version: {version}[/bold] - Used in {len(repos_with_version)} repositories")
-                    for repo in sorted(repos_with_version):
-                        console.print(f"    • {repo}")
-        
-        # Detailed table
-        if all_build_tools or all_java_versions or all_plugin_versions:
+                plugin_summary[plugin.plugin_name][plugin.version].add(plugin.repository)
+            
+            for plugin_name, versions in plugin_summary.items():
+                lines.append(f"\n[bold]{plugin_name.upper()} PLUGIN VERSIONS:[/bold]")
+                for version in sorted(versions):
+                    repos_with_version = versions[version]
+                    lines.append(f"  [bold]Version: {version}[/bold] - Used in {len(repos_with_version)} repositories")
+                    lines.extend(f"    • {repo}" for repo in sorted(repos_with_version))
+        
+        console.print("\n".join(lines))
+        
+        # Detailed table - collect plain row tuples first, then render in one go
+        rows = [
+            (tool.repository, "Build Tool", tool.name, tool.version, tool.file_path, tool.detection_method)
+            for tool in all_build_tools
+        ]
+        rows.extend(
+            (java.repository, "Java Version", "Java", java.version, java.file_path, java.detection_method)
+            for java in all_java_versions
+        )
+        rows.extend(
+            (plugin.repository, "Plugin Version", plugin.plugin_name, plugin.version, plugin.file_path, plugin.detection_method)
+            for plugin in all_plugin_versions or []
+        )
+        
+        if len(rows) > self.PLAIN_TABLE_THRESHOLD:
+            # Rich lays out every cell of a Table before printing, which dominates
+            # report time for very large organizations - emit a plain pipe-separated table
+            header = ("Repository", "Type", "Name", "Version", "Config File", "Detection Method")
+            console.print("\nDetailed Analysis", markup=False, highlight=False)
+            console.print(
+                "\n".join(" | ".join(str(cell) for cell in row) for row in [header, *rows]),
+                markup=False, highlight=False, soft_wrap=True
+            )
+        elif rows:
             table = Table(title="Detailed Analysis")
             table.add_column("Repository", style="cyan")
             table.add_column("Type", style="magenta")
@@ -1513,43 +2817,32 @@ class SimpleBuildAnalyzer:
             table.add_column("Version", style="yellow")
             table.add_column("Config File", style="blue")
             table.add_column("Detection Method", style="red")
-            
-            # Add build tools
-            for tool in all_build_tools:
-                table.add_row(
-                    tool.repository,
-                    "Build Tool",
-                    tool.name,
-                    tool.version,
-                    tool.file_path,
-                    tool.detection_method
-                )
-            
-            # Add Java versions
-            for java in all_java_versions:
-                table.add_row(
-                    java.repository,
-                    "Java Version",
-                    "Java",
-                    java.version,
-                    java.file_path,
-                    java.detection_method
-                )
-            
-            # Add plugin versions
-            for plugin in all_plugin_versions:
-                table.add_row(
-                    plugin.repository,
-                    "Plugin Version",
-                    plugin.plugin_name,
-                    plugin.version,
-                    plugin.file_path,
-                    plugin.detection_method
-                )
+            for row in rows:
+                table.add_row(*row)
             
             console.print(table)
 
-    def export_csv_report(self, all_build_tools: List[BuildTool], all_java_versions: List[JavaVersion], all_plugin_versions: List[PluginVersion], output_file: str, org_name: str, analysis_mode: str, total_repos: int, api_calls: int, max_workers: int):
+    def _write_report_file(self, output_file: str, content: str):
+        """
+        Write a fully formatted report to disk with as few syscalls as possible
+        
+        The content is encoded once and handed to os.write directly, bypassing
+        the text layer's chunked writes.
+        
+        Args:
+            output_file: Path of the file to write
+            content: Complete report content
+        """
+        data = memoryview(content.encode('utf-8'))
+        fd = os.open(output_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            while data:
+                written = os.write(fd, data)
+                data = data[written:]
+        finally:
+            os.close(fd)
+
+    def export_csv_report(self, all_build_tools: List[BuildTool], all_java_versions: List[JavaVersion], all_plugin_versions: List[PluginVersion], output_file: str, org_name: str, analysis_mode: str, total_repos: int, api_calls: int, max_workers: int, rows: Optional[ReportRows] = None):
         """
         Export analysis results to CSV format
         
@@ -1563,59 +2856,45 @@ class SimpleBuildAnalyzer:
             total_repos: Total repositories analyzed
             api_calls: Total API calls made
             max_workers: Number of parallel workers used
+            rows: Findings already flattened for another report format, if any
         """
         try:
-            with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.writer(csvfile)
-                
-                # Write header
-                writer.writerow(['Repository', 'Type', 'Name', 'Version', 'Source Compatibility', 'Target Compatibility', 'Config File', 'Detection Method'])
-                
-                # Write build tools
-                for tool in all_build_tools:
-                    writer.writerow([
-                        tool.repository,
-                        'Build Tool',
-                        tool.name,
-                        tool.version,
-                        '',  # No source compatibility for build tools
-                        '',  # No target compatibility for build tools
-                        tool.file_path,
-                        tool.detection_method
-                    ])
-                
-                # Write Java versions
-                for java in all_java_versions:
-                    writer.writerow([
-                        java.repository,
-                        'Java Version',
-                        'Java',
-                        java.version,
-                        java.source_compatibility,
-                        java.target_compatibility,
-                        java.file_path,
-                        java.detection_method
-                    ])
-                
-                # Write plugin versions
-                for plugin in all_plugin_versions:
-                    writer.writerow([
-                        plugin.repository,
-                        'Plugin Version',
-                        plugin.plugin_name,
-                        plugin.version,
-                        '',  # No source compatibility for plugins
-                        '',  # No target compatibility for plugins
-                        plugin.file_path,
-                        plugin.detection_method
-                    ])
+            # Format the whole report in memory and write it with a single call
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            
+            # Write header
+            writer.writerow(['Repository', 'Type', 'Name', 'Version', 'Source Compatibility', 'Target Compatibility', 'Config File', 'Detection Method'])
+            
+            if rows is None:
+                rows = ReportRows.from_findings(all_build_tools, all_java_versions, all_plugin_versions)
+            
+            # Write build tools (no source/target compatibility for build tools)
+            writer.writerows(
+                (repository, 'Build Tool', name, version, '', '', file_path, detection_method)
+                for repository, name, version, file_path, detection_method in rows.build_tools
+            )
+            
+            # Write Java versions
+            writer.writerows(
+                (repository, 'Java Version', 'Java', version, source_compatibility, target_compatibility, file_path, detection_method)
+                for repository, version, source_compatibility, target_compatibility, file_path, detection_method in rows.java_versions
+            )
+            
+            # Write plugin versions (no source/target compatibility for plugins)
+            writer.writerows(
+                (repository, 'Plugin Version', plugin_name, version, '', '', file_path, detection_method)
+                for repository, plugin_name, version, file_path, detection_method in rows.plugin_versions
+            )
+            
+            self._write_report_file(output_file, buffer.getvalue())
             
             console.print(f"\n[green]CSV report saved to: {output_file}[/green]")
             
         except Exception as e:
             console.print(f"[red]Error saving CSV report: {str(e)}[/red]")
 
-    def export_html_report(self, all_build_tools: List[BuildTool], all_java_versions: List[JavaVersion], all_plugin_versions: List[PluginVersion], output_file: str, org_name: str, analysis_mode: str, total_repos: int, api_calls: int, max_workers: int):
+    def export_html_report(self, all_build_tools: List[BuildTool], all_java_versions: List[JavaVersion], all_plugin_versions: List[PluginVersion], output_file: str, org_name: str, analysis_mode: str, total_repos: int, api_calls: int, max_workers: int, rows: Optional[ReportRows] = None):
         """
         Export analysis results to HTML format
         
@@ -1629,140 +2908,35 @@ class SimpleBuildAnalyzer:
             total_repos: Total repositories analyzed
             api_calls: Total API calls made
             max_workers: Number of parallel workers used
+            rows: Findings already flattened for another report format, if any
         """
         try:
-            # Generate summary data
-            tool_summary = {}
-            for tool in all_build_tools:
-                if tool.name not in tool_summary:
-                    tool_summary[tool.name] = {'versions': set(), 'repos': set()}
-                tool_summary[tool.name]['versions'].add(tool.version)
-                tool_summary[tool.name]['repos'].add(tool.repository)
-            
-            java_summary = {}
-            for java in all_java_versions:
-                if java.version not in java_summary:
-                    java_summary[java.version] = {'repos': set()}
-                java_summary[java.version]['repos'].add(java.repository)
-            
-            plugin_summary = {}
-            for plugin in all_plugin_versions:
-                if plugin.plugin_name not in plugin_summary:
-                    plugin_summary[plugin.plugin_name] = {'versions': set(), 'repos': set()}
-                plugin_summary[plugin.plugin_name]['versions'].add(plugin.version)
-                plugin_summary[plugin.plugin_name]['repos'].add(plugin.repository)
-            
-            # Generate HTML content
-            html_content = f"""<!DOCTYPE html>
+            if rows is None:
+                rows = ReportRows.from_findings(all_build_tools, all_java_versions, all_plugin_versions)
+            
+            # Generate HTML content, streaming each fragment straight to the file
+            # through a 1 MiB buffer instead of materializing the document in memory
+            with open(output_file, 'w', encoding='utf-8', buffering=1 << 20) as report_file:
+                write = report_file.write
+                # Repository names, paths and detection details are untrusted text
+                esc = _escape_html
+                # Format the timestamp once so the header and footer always agree
+                generated_date, generated_time = time.strftime('%Y-%m-%d %H:%M:%S').split(' ')
+                write(f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>BuildCheck Report - {org_name}</title>
-    <style>
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            line-height: 1.6;
-            margin: 0;
-            padding: 20px;
-            background-color: #f5f5f5;
-        }}
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-            background: white;
-            padding: 30px;
-            border-radius: 8px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }}
-        h1 {{
-            color: #2c3e50;
-            border-bottom: 3px solid #3498db;
-            padding-bottom: 10px;
-        }}
-        h2 {{
-            color: #34495e;
-            margin-top: 30px;
-        }}
-        .summary-stats {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 20px;
-            margin: 20px 0;
-        }}
-        .stat-card {{
-            background: #ecf0f1;
-            padding: 20px;
-            border-radius: 6px;
-            text-align: center;
-        }}
-        .stat-number {{
-            font-size: 2em;
-            font-weight: bold;
-            color: #3498db;
-        }}
-        .stat-label {{
-            color: #7f8c8d;
-            margin-top: 5px;
-        }}
-        table {{
-            width: 100%;
-            border-collapse: collapse;
-            margin: 20px 0;
-            background: white;
-        }}
-        th, td {{
-            padding: 12px;
-            text-align: left;
-            border-bottom: 1px solid #ddd;
-        }}
-        th {{
-            background-color: #3498db;
-            color: white;
-            font-weight: bold;
-        }}
-        tr:nth-child(even) {{
-            background-color: #f8f9fa;
-        }}
-        tr:hover {{
-            background-color: #e3f2fd;
-        }}
-        .version-badge {{
-            background: #27ae60;
-            color: white;
-            padding: 4px 8px;
-            border-radius: 12px;
-            font-size: 0.9em;
-            font-weight: bold;
-        }}
-        .repo-name {{
-            font-family: 'Courier New', monospace;
-            background: #f1f2f6;
-            padding: 2px 6px;
-            border-radius: 4px;
-        }}
-        .analysis-mode {{
-            background: #e8f5e8;
-            border: 1px solid #27ae60;
-            padding: 10px;
-            border-radius: 6px;
-            margin: 20px 0;
-        }}
-        .timestamp {{
-            color: #7f8c8d;
-            font-size: 0.9em;
-            text-align: center;
-            margin-top: 30px;
-        }}
-    </style>
-</head>
-<body>
+    <title>BuildCheck Report - {esc(org_name)}</title>
+""")
+                write(_HTML_STYLE)
+                write(f"""<body>
     <div class="container">
         <h1>🔍 BuildCheck Analysis Report</h1>
         <div class="analysis-mode">
-            <strong>Organization:</strong> {org_name}<br>
-            <strong>Analysis Mode:</strong> {analysis_mode}<br>
-            <strong>Generated:</strong> {time.strftime('%Y-%m-%d %H:%M:%S')}
+            <strong>Organization:</strong> {esc(org_name)}<br>
+            <strong>Analysis Mode:</strong> {esc(analysis_mode)}<br>
+            <strong>Generated:</strong> {generated_date} {generated_time}
         </div>
         
         <div class="summary-stats">
@@ -1771,15 +2945,15 @@ class SimpleBuildAnalyzer:
                 <div class="stat-label">Repositories Analyzed</div>
             </div>
             <div class="stat-card">
-                <div class="stat-number">{len(all_build_tools)}</div>
+                <div class="stat-number">{len(rows.build_tools)}</div>
                 <div class="stat-label">Build Tools Found</div>
             </div>
             <div class="stat-card">
-                <div class="stat-number">{len(all_java_versions)}</div>
+                <div class="stat-number">{len(rows.java_versions)}</div>
                 <div class="stat-label">Java Versions Found</div>
             </div>
             <div class="stat-card">
-                <div class="stat-number">{len(all_plugin_versions)}</div>
+                <div class="stat-number">{len(rows.plugin_versions)}</div>
                 <div class="stat-label">Plugin Versions Found</div>
             </div>
             <div class="stat-card">
@@ -1790,141 +2964,117 @@ class SimpleBuildAnalyzer:
                 <div class="stat-number">{max_workers}</div>
                 <div class="stat-label">Parallel Workers</div>
             </div>
-        </div>"""
-            
-            # Add build tools section
-            if all_build_tools:
-                html_content += f"""
-        <h2>🛠️ Build Tool Versions</h2>
-        <table>
-            <thead>
-                <tr>
-                    <th>Repository</th>
-                    <th>Build Tool</th>
-                    <th>Version</th>
-                    <th>Config File</th>
-                    <th>Detection Method</th>
-                </tr>
-            </thead>
-            <tbody>"""
-                
-                for tool in all_build_tools:
-                    html_content += f"""
-                <tr>
-                    <td><span class="repo-name">{tool.repository}</span></td>
-                    <td><strong>{tool.name.title()}</strong></td>
-                    <td><span class="version-badge">{tool.version}</span></td>
-                    <td><code>{tool.file_path}</code></td>
-                    <td>{tool.detection_method}</td>
-                </tr>"""
-                
-                html_content += """
-            </tbody>
-        </table>"""
-            
-            # Add Java versions section
-            if all_java_versions:
-                html_content += f"""
-        <h2>☕ Java Versions</h2>
-        <table>
-            <thead>
-                <tr>
-                    <th>Repository</th>
-                    <th>Java Version</th>
-                    <th>Source Compatibility</th>
-                    <th>Target Compatibility</th>
-                    <th>Config File</th>
-                    <th>Detection Method</th>
-                </tr>
-            </thead>
-            <tbody>"""
-                
-                for java in all_java_versions:
-                    html_content += f"""
-                <tr>
-                    <td><span class="repo-name">{java.repository}</span></td>
-                    <td><span class="version-badge">{java.version}</span></td>
-                    <td>{java.source_compatibility or '-'}</td>
-                    <td>{java.target_compatibility or '-'}</td>
-                    <td><code>{java.file_path}</code></td>
-                    <td>{java.detection_method}</td>
-                </tr>"""
-                
-                html_content += """
-            </tbody>
-        </table>"""
+        </div>""")
             
-            # Add plugin versions section
-            if all_plugin_versions:
-                html_content += f"""
-        <h2>🔌 Plugin Versions</h2>
-        <table>
-            <thead>
-                <tr>
-                    <th>Repository</th>
-                    <th>Plugin Name</th>
-                    <th>Version</th>
-                    <th>Config File</th>
-                    <th>Detection Method</th>
-                </tr>
-            </thead>
-            <tbody>"""
-                
-                for plugin in all_plugin_versions:
-                    html_content += f"""
-                <tr>
-                    <td><span class="repo-name">{plugin.repository}</span></td>
-                    <td><strong>{plugin.plugin_name}</strong></td>
-                    <td><span class="version-badge">{plugin.version}</span></td>
-                    <td><code>{plugin.file_path}</code></td>
-                    <td>{plugin.detection_method}</td>
-                </tr>"""
+                report_file.writelines(self._render_html_tables(rows))
                 
-                html_content += """
-            </tbody>
-        </table>"""
-            
-            # Close HTML
-            html_content += f"""
+                # Close HTML
+                write(f"""
         <div class="timestamp">
-            Report generated by BuildCheck on {time.strftime('%Y-%m-%d at %H:%M:%S')}
+            Report generated by BuildCheck on {generated_date} at {generated_time}
         </div>
     </div>
 </body>
-</html>"""
-            
-            # Write HTML file
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(html_content)
+</html>""")
             
             console.print(f"\n[green]HTML report saved to: {output_file}[/green]")
             
         except Exception as e:
             console.print(f"[red]Error saving HTML report: {str(e)}[/red]")
 
+    def _render_html_tables(self, rows: ReportRows):
+        """
+        Render the build tool, Java version and plugin version tables of the HTML report
+        
+        Args:
+            rows: The findings flattened into report rows
+            
+        Yields:
+            HTML fragments, in document order
+        """
+        # Repository names, paths and detection details are untrusted text
+        esc = _escape_html
+        
+        # Add build tools section
+        if rows.build_tools:
+            yield _HTML_BUILD_TOOL_TABLE_HEAD
+        
+            row = _HTML_BUILD_TOOL_ROW.format
+            for repository, name, version, file_path, detection_method in rows.build_tools:
+                yield row(repository=esc(repository), name=esc(_title(name)), version=esc(version),
+                          file_path=esc(file_path), detection_method=esc(detection_method))
+        
+            yield _HTML_TABLE_END
+    
+        # Add Java versions section
+        if rows.java_versions:
+            yield _HTML_JAVA_VERSION_TABLE_HEAD
+        
+            row = _HTML_JAVA_VERSION_ROW.format
+            for repository, version, source_compatibility, target_compatibility, file_path, detection_method in rows.java_versions:
+                yield row(repository=esc(repository), version=esc(version),
+                          source_compatibility=esc(source_compatibility or '-'),
+                          target_compatibility=esc(target_compatibility or '-'),
+                          file_path=esc(file_path), detection_method=esc(detection_method))
+        
+            yield _HTML_TABLE_END
+    
+        # Add plugin versions section
+        if rows.plugin_versions:
+            yield _HTML_PLUGIN_VERSION_TABLE_HEAD
+        
+            row = _HTML_PLUGIN_VERSION_ROW.format
+            for repository, plugin_name, version, file_path, detection_method in rows.plugin_versions:
+                yield row(repository=esc(repository), name=esc(plugin_name), version=esc(version),
+                          file_path=esc(file_path), detection_method=esc(detection_method))
+        
+            yield _HTML_TABLE_END
+
     def _get_repository_metadata_bulk(self, repo_names: List[str]) -> Dict[str, dict]:
         """
         Get metadata for multiple repositories in bulk to reduce API calls
         
-        This method fetches basic metadata (archived status, size, etc.) for multiple
-        repositories in a single API call using the search API, which is more efficient
-        than individual repository calls.
+        This method fetches basic metadata (archived status, size) for multiple
+        repositories in a single GraphQL query per batch, falling back to the search
+        API and then to individual repository calls.
         
         Args:
             repo_names: List of repository names to get metadata for
             
         Returns:
-            Dictionary mapping repo names to their metadata
+            Dictionary mapping repo names to their metadata; 'repository' is None
+            when the metadata came from GraphQL
         """
         if not repo_names:
             return {}
         
         metadata = {}
         
-        # Use search API to get repository metadata in bulk
-        # This is more efficient than individual calls
+        # One GraphQL query per batch of 100, with an aliased repository field per
+        # name, instead of a search API call. GraphQL returns only the fields we ask
+        # for, so entries carry no Repository object and callers keep their own.
         for i in range(0, len(repo_names), 100):  # Process in batches of 100
             batch = repo_names[i:i+100]
+            fields = " ".join(
+                f'r{j}: repository(owner: $owner, name: {json.dumps(name)}) {{ isArchived diskUsage }}'
+                for j, name in enumerate(batch)
+            )
+            data = self._graphql_request(
+                self.org._requester, f"query($owner: String!) {{ {fields} }}", {"owner": self.org_name},
+                f"Get metadata for {len(batch)} repositories"
+            )
+            if data is not None:
+                for j, name in enumerate(batch):
+                    node = data.get(f"r{j}")
+                    if node:
+                        metadata[name] = {
+                            'archived': node['isArchived'],
+                            'size': node['diskUsage'] or 0,
+                            'repository': None
+                        }
+                continue
+            
+            # GraphQL unavailable - fall back to the search API for this batch
             search_query = f"org:{self.org_name} {' '.join([f'repo:{self.org_name}/{name}' for name in batch])}"
             
             try:
@@ -1985,9 +3135,24 @@ class SimpleBuildAnalyzer:
             empty_repos = 0
             excluded_repos = 0
             
-            # Use pagination to handle large organizations efficiently
-            page = 1
-            per_page = 100  # Maximum allowed by GitHub API
+            # Learn the number of pages up front (one small request), then fetch the
+            # pages - and their bulk metadata - concurrently instead of one by one
+            paginated_repos = self.org.get_repos()
+            self._make_api_call("Count organization repositories")
+            page_count = math.ceil(paginated_repos.totalCount / self.github.per_page)
+            
+            def fetch_page(page: int):
+                self._make_api_call(f"Get organization repositories page {page + 1}")
+                page_repos = list(paginated_repos.get_page(page))
+                # The listing already carries archived/size for each repository, so the
+                # bulk metadata lookup is only needed for entries that came back without
+                # them - and never for repositories that are excluded anyway
+                missing = [
+                    repo.name for repo in page_repos
+                    if ('archived' not in repo._rawData or 'size' not in repo._rawData)
+                    and not self._should_exclude_repository(repo.name)
+                ]
+                return page_repos, self._get_repository_metadata_bulk(missing) if missing else {}
             
             with Progress(
                 SpinnerColumn(),
@@ -1997,74 +3162,58 @@ class SimpleBuildAnalyzer:
                 console=console
             ) as progress:
                 task = progress.add_task(
-                    f"Fetching repositories (page {page})...", 
-                    total=None  # We don't know total yet
+                    f"Fetching repositories ({page_count} pages)...", 
+                    total=page_count
                 )
                 
-                while True:
-                    # Fetch repositories with pagination
-                    self._make_api_call(f"Get organization repositories page {page}")
-                    page_repos = list(self.org.get_repos().get_page(page - 1))  # GitHub uses 0-based indexing
-                    
-                    if not page_repos:
-                        break  # No more repositories
-                    
-                    # Get repository names for this page
-                    repo_names = [repo.name for repo in page_repos]
-                    
-                    # Get metadata in bulk for this page
-                    metadata = self._get_repository_metadata_bulk(repo_names)
-                    
-                    # Process repositories in this page
-                    for repo in page_repos:
-                        total_repos += 1
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    # map() yields pages in order, so repositories keep the listing order
+                    for page_repos, metadata in executor.map(fetch_page, range(page_count)):
+                        # Process repositories in this page
+                        for repo in page_repos:
+                            total_repos += 1
                         
-                        # Use metadata if available, otherwise fall back to repo object
-                        if repo.name in metadata:
-                            repo_meta = metadata[repo.name]
-                            is_archived = repo_meta['archived']
-                            repo_size = repo_meta['size']
-                            repo_obj = repo_meta['repository']
-                        else:
-                            is_archived = repo.archived
-                            repo_size = repo.size
-                            repo_obj = repo
+                            # Check exclusions first - they need only the name, so excluded
+                            # repositories never cost a metadata lookup
+                            if self._should_exclude_repository(repo.name):
+                                excluded_repos += 1
+                                if self.verbose:
+                                    logging.debug(f"Skipping excluded repository: {repo.name}")
+                                continue
                         
-                        # Skip archived and empty repos
-                        if is_archived:
-                            archived_repos += 1
-                            if self.verbose:
-                                logging.debug(f"Skipping archived repository: {repo.name}")
-                            continue
+                            # Use metadata if available, otherwise fall back to repo object
+                            if repo.name in metadata:
+                                repo_meta = metadata[repo.name]
+                                is_archived = repo_meta['archived']
+                                repo_size = repo_meta['size']
+                                repo_obj = repo_meta['repository'] or repo
+                            else:
+                                # Read the listing payload directly - attribute access on a
+                                # partially loaded Repository can trigger a lazy completion call
+                                data = repo._rawData
+                                is_archived = data['archived'] if 'archived' in data else repo.archived
+                                repo_size = data['size'] if 'size' in data else repo.size
+                                repo_obj = repo
                         
-                        if repo_size == 0:
-                            empty_repos += 1
-                            if self.verbose:
-                                logging.debug(f"Skipping empty repository: {repo.name}")
-                            continue
+                            # Skip archived and empty repos
+                            if is_archived:
+                                archived_repos += 1
+                                if self.verbose:
+                                    logging.debug(f"Skipping archived repository: {repo.name}")
+                                continue
                         
-                        # Check if repository should be excluded
-                        if self._should_exclude_repository(repo.name):
-                            excluded_repos += 1
-                            if self.verbose:
-                                logging.debug(f"Skipping excluded repository: {repo.name}")
-                            continue
+                            if repo_size == 0:
+                                empty_repos += 1
+                                if self.verbose:
+                                    logging.debug(f"Skipping empty repository: {repo.name}")
+                                continue
                         
-                        repos.append(repo_obj)
-                        if self.verbose:
-                            logging.debug(f"Added repository for analysis: {repo.name} (size: {repo_size} bytes)")
-                    
-                    # Update progress
-                    progress.update(task, description=f"Fetched {total_repos} repositories (found: {len(repos)}, skipped: {archived_repos + empty_repos + excluded_repos})")
-                    
-                    # If we got fewer repos than requested, we've reached the end
-                    if len(page_repos) < per_page:
-                        break
-                    
-                    page += 1
+                            repos.append(repo_obj)
+                            if self.verbose:
+                                logging.debug(f"Added repository for analysis: {repo.name} (size: {repo_size} bytes)")
                     
-                    # Add a small delay between pages to be respectful
-                    time.sleep(0.1)
+                        # Update progress
+                        progress.update(task, advance=1, description=f"Fetched {total_repos} repositories (found: {len(repos)}, skipped: {archived_repos + empty_repos + excluded_repos})")
             
             if total_repos == 0:
                 console.print("[yellow]No repositories found in the organization[/yellow]")
@@ -2196,6 +3345,8 @@ def main(org: str, repo: str, token: str, output: str, csv: str, html: str, jenk
         console.print("[red]Error: GitHub token is required. Set GITHUB_TOKEN environment variable, use --token option, or configure in config file.[/red]")
         return
     
+    analyzer = None
+    result_store = None
     try:
         # Setup logging
         logger = setup_logging(verbose)
@@ -2257,29 +3408,39 @@ def main(org: str, repo: str, token: str, output: str, csv: str, html: str, jenk
         if clear_cache:
             console.print(f"[bold red]Clearing cache in {cache_dir}...[/bold red]")
             if os.path.exists(cache_dir):
-                for cache_file in os.listdir(cache_dir):
-                    if cache_file.endswith('.pkl'):
-                        try:
-                            os.remove(os.path.join(cache_dir, cache_file))
-                            console.print(f"[green]Cleared {cache_file}[/green]")
-                        except Exception as e:
-                            console.print(f"[red]Error clearing {cache_file}: {str(e)}[/red]")
-                console.print("[green]Cache cleared.[/green]")
+                # scandir yields the entry type with the name, avoiding a stat per file
+                with os.scandir(cache_dir) as entries:
+                    cache_paths = [entry.path for entry in entries if entry.name.endswith(CACHE_FILE_SUFFIXES) and entry.is_file()]
+                
+                def remove_cache_file(path: str) -> Optional[str]:
+                    try:
+                        os.remove(path)
+                        return None
+                    except Exception as e:
+                        return f"{os.path.basename(path)}: {str(e)}"
+                
+                # Overlap the unlink syscalls, which dominate on slow or network disks
+                with ThreadPoolExecutor(max_workers=16) as executor:
+                    errors = [error for error in executor.map(remove_cache_file, cache_paths) if error]
+                for error in errors:
+                    console.print(f"[red]Error clearing {error}[/red]")
+                console.print(f"[green]Cache cleared ({len(cache_paths) - len(errors)} files removed).[/green]")
             else:
                 console.print("[yellow]Cache directory does not exist.[/yellow]")
             return # Exit after clearing cache
 
         # Display initial rate limit status for monitoring
         try:
-            rate_limit = analyzer.github.get_rate_limit()
-            console.print(f"[blue]GitHub API Rate Limit: {rate_limit.core.remaining}/{rate_limit.core.limit} requests remaining[/blue]")
-            reset_timestamp = rate_limit.core.reset.timestamp()
-            console.print(f"[blue]Rate limit resets at: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(reset_timestamp))}[/blue]")
+            # Read from the headers of the organization lookup - no extra request
+            rate_limit = analyzer.get_rate_limit_status()
+            console.print(f"[blue]GitHub API Rate Limit: {rate_limit.remaining}/{rate_limit.limit} requests remaining[/blue]")
+            reset_time = rate_limit.reset.strftime('%Y-%m-%d %H:%M:%S')
+            console.print(f"[blue]Rate limit resets at: {reset_time}[/blue]")
             
             if verbose:
                 logger.info(f"Initial rate limit status:")
-                logger.info(f"  - Remaining requests: {rate_limit.core.remaining}/{rate_limit.core.limit}")
-                logger.info(f"  - Reset time: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(reset_timestamp))}")
+                logger.info(f"  - Remaining requests: {rate_limit.remaining}/{rate_limit.limit}")
+                logger.info(f"  - Reset time: {reset_time}")
         except Exception as e:
             console.print(f"[yellow]Warning: Could not check rate limit: {str(e)}[/yellow]")
             if verbose:
@@ -2317,27 +3478,35 @@ def main(org: str, repo: str, token: str, output: str, csv: str, html: str, jenk
         else:
             # Use individual analysis (original method)
             console.print(f"[bold blue]Using individual analysis mode for {len(repos)} repositories[/bold blue]")
-            all_build_tools, all_java_versions, all_plugin_versions = analyzer.analyze_repositories_individual(repos)
+            # Stream findings to disk so they are not all pinned in memory
+            result_store = ResultStore()
+            all_build_tools, all_java_versions, all_plugin_versions = analyzer.analyze_repositories_individual(repos, result_store)
         
         # Generate and display the analysis report
         analyzer.generate_report(all_build_tools, all_java_versions, all_plugin_versions, jenkins_only)
         
-        # Display final statistics for monitoring and verification
-        console.print(f"\n[bold green]Analysis Complete![/bold green]")
-        console.print(f"[blue]Total repositories analyzed: {len(repos)}[/blue]")
-        console.print(f"[blue]Total build tools found: {len(all_build_tools)}[/blue]")
-        console.print(f"[blue]Total Java versions found: {len(all_java_versions)}[/blue]")
-        console.print(f"[blue]Total plugin versions found: {len(all_plugin_versions)}[/blue]")
-        console.print(f"[blue]Total API calls made: {analyzer.api_calls_made}[/blue]")
-        console.print(f"[blue]Parallel workers used: {max_workers}[/blue]")
+        # Display final statistics for monitoring and verification, rendered as a
+        # single table instead of one console write per line
+        stats_table = Table(title="Analysis Complete!", title_style="bold green", show_header=False)
+        stats_table.add_column("Metric", style="blue")
+        stats_table.add_column("Value", style="blue")
+        stats_table.add_row("Total repositories analyzed", str(len(repos)))
+        stats_table.add_row("Total build tools found", str(len(all_build_tools)))
+        stats_table.add_row("Total Java versions found", str(len(all_java_versions)))
+        stats_table.add_row("Total plugin versions found", str(len(all_plugin_versions)))
+        stats_table.add_row("Total API calls made", str(analyzer.api_calls_made))
+        stats_table.add_row("Parallel workers used", str(max_workers))
         
         # Show excluded repositories if any
         if config_obj and (config_obj.exclusions.repositories or config_obj.exclusions.patterns):
-            console.print(f"\n[bold yellow]Repository Exclusions Applied:[/bold yellow]")
+            stats_table.add_section()
             if config_obj.exclusions.repositories:
-                console.print(f"[yellow]Excluded repositories: {', '.join(config_obj.exclusions.repositories)}[/yellow]")
+                stats_table.add_row("[yellow]Excluded repositories[/yellow]", f"[yellow]{', '.join(config_obj.exclusions.repositories)}[/yellow]")
             if config_obj.exclusions.patterns:
-                console.print(f"[yellow]Exclusion patterns: {', '.join(config_obj.exclusions.patterns)}[/yellow]")
+                stats_table.add_row("[yellow]Exclusion patterns[/yellow]", f"[yellow]{', '.join(config_obj.exclusions.patterns)}[/yellow]")
+        
+        console.print()
+        console.print(stats_table)
         
         if verbose:
             logger.info(f"Analysis completed successfully:")
@@ -2350,13 +3519,13 @@ def main(org: str, repo: str, token: str, output: str, csv: str, html: str, jenk
         
         # Show remaining API calls for monitoring
         try:
-            final_rate_limit = analyzer.github.get_rate_limit()
-            console.print(f"[blue]Remaining API calls: {final_rate_limit.core.remaining}/{final_rate_limit.core.limit}[/blue]")
+            final_rate_limit = analyzer.get_rate_limit_status()
+            console.print(f"[blue]Remaining API calls: {final_rate_limit.remaining}/{final_rate_limit.limit}[/blue]")
             
             if verbose:
                 logger.info(f"Final rate limit status:")
-                logger.info(f"  - Remaining requests: {final_rate_limit.core.remaining}/{final_rate_limit.core.limit}")
-                logger.info(f"  - Requests used: {final_rate_limit.core.limit - final_rate_limit.core.remaining}")
+                logger.info(f"  - Remaining requests: {final_rate_limit.remaining}/{final_rate_limit.limit}")
+                logger.info(f"  - Requests used: {final_rate_limit.limit - final_rate_limit.remaining}")
         except Exception as e:
             if verbose:
                 logger.warning(f"Could not check final rate limit: {str(e)}")
@@ -2369,75 +3538,77 @@ def main(org: str, repo: str, token: str, output: str, csv: str, html: str, jenk
         else:
             analysis_mode = 'full_analysis'
         
+        # Flatten the findings once for every requested export format
+        report_rows = ReportRows.from_findings(all_build_tools, all_java_versions, all_plugin_versions) if output or csv or html else None
+        
         # Save JSON report if requested
         # This provides structured data for further analysis or integration
-        if output:
+        def export_json_report():
+            # Each record is zipped from its report row and a shared key tuple
+            build_tool_keys = ('repository', 'build_tool', 'build_tool_version', 'file_path', 'detection_method')
+            java_version_keys = ('repository', 'java_version', 'source_compatibility', 'target_compatibility', 'file_path', 'detection_method')
+            plugin_version_keys = ('repository', 'plugin_name', 'plugin_version', 'file_path', 'detection_method')
+            
             report_data = {
                 'organization': org,
                 'target_repository': repo if repo else None,
                 'analysis_mode': analysis_mode,
-                'build_tools': [
-                    {
-                        'repository': tool.repository,
-                        'build_tool': tool.name,
-                        'build_tool_version': tool.version,
-                        'file_path': tool.file_path,
-                        'detection_method': tool.detection_method
-                    }
-                    for tool in all_build_tools
-                ],
-                'java_versions': [
-                    {
-                        'repository': java.repository,
-                        'java_version': java.version,
-                        'source_compatibility': java.source_compatibility,
-                        'target_compatibility': java.target_compatibility,
-                        'file_path': java.file_path,
-                        'detection_method': java.detection_method
-                    }
-                    for java in all_java_versions
-                ],
-                'plugin_versions': [
-                    {
-                        'repository': plugin.repository,
-                        'plugin_name': plugin.plugin_name,
-                        'plugin_version': plugin.version,
-                        'file_path': plugin.file_path,
-                        'detection_method': plugin.detection_method
-                    }
-                    for plugin in all_plugin_versions
-                ],
+                'build_tools': [dict(zip(build_tool_keys, row)) for row in report_rows.build_tools],
+                'java_versions': [dict(zip(java_version_keys, row)) for row in report_rows.java_versions],
+                'plugin_versions': [dict(zip(plugin_version_keys, row)) for row in report_rows.plugin_versions],
                 'summary': {
                     'total_repositories_analyzed': len(repos),
-                    'total_build_tools_found': len(all_build_tools),
-                    'total_java_versions_found': len(all_java_versions),
-                    'total_plugin_versions_found': len(all_plugin_versions),
+                    'total_build_tools_found': len(report_rows.build_tools),
+                    'total_java_versions_found': len(report_rows.java_versions),
+                    'total_plugin_versions_found': len(report_rows.plugin_versions),
                     'api_calls_made': analyzer.api_calls_made,
                     'parallel_workers_used': max_workers
                 }
             }
             
-            with open(output, 'w') as f:
-                json.dump(report_data, f, indent=2)
+            # Encode the whole report in one pass with compact separators and hand
+            # it to disk in a single write instead of json.dump's many small chunks.
+            # The report is plain acyclic data, so the encoder's cycle tracking is skipped.
+            analyzer._write_report_file(output, json.dumps(report_data, separators=(',', ':'), check_circular=False))
             
             console.print(f"\n[green]JSON report saved to: {output}[/green]")
         
-        # Export CSV report if requested
-        if csv:
-            analyzer.export_csv_report(
-                all_build_tools, all_java_versions, all_plugin_versions,
-                csv, org_name, analysis_mode, len(repos), analyzer.api_calls_made, max_workers
-            )
-        
-        # Export HTML report if requested
-        if html:
-            analyzer.export_html_report(
-                all_build_tools, all_java_versions, all_plugin_versions,
-                html, org_name, analysis_mode, len(repos), analyzer.api_calls_made, max_workers
-            )
+        # Run the requested exports concurrently: file writes release the GIL, so
+        # the formats overlap their I/O instead of queueing behind each other
+        with ThreadPoolExecutor(max_workers=3) as export_executor:
+            exports = []
+            if output:
+                exports.append(export_executor.submit(export_json_report))
+            
+            # Export CSV report if requested
+            if csv:
+                exports.append(export_executor.submit(
+                    analyzer.export_csv_report,
+                    all_build_tools, all_java_versions, all_plugin_versions,
+                    csv, org_name, analysis_mode, len(repos), analyzer.api_calls_made, max_workers,
+                    rows=report_rows
+                ))
+            
+            # Export HTML report if requested
+            if html:
+                exports.append(export_executor.submit(
+                    analyzer.export_html_report,
+                    all_build_tools, all_java_versions, all_plugin_versions,
+                    html, org_name, analysis_mode, len(repos), analyzer.api_calls_made, max_workers,
+                    rows=report_rows
+                ))
+            
+            # Surface any export error before the result store is closed
+            for export in exports:
+                export.result()
     
     except Exception as e:
         console.print(f"[red]Error: {str(e)}[/red]")
+    finally:
+        if result_store:
+            result_store.close()
+        if analyzer is not None:
+            analyzer.close()
 
 # Alias for compatibility with tests and legacy code
 BuildAnalyzer = SimpleBuildAnalyzer
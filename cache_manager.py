@@ -7,24 +7,61 @@ It provides functions to list, clear, and inspect cache files.
 """
 
 import os
+import json
 import pickle
 import click
 import time
+from concurrent.futures import ThreadPoolExecutor
 from rich.console import Console
 from rich.table import Table
 from rich import print as rprint
 
 console = Console()
 
-def list_cache_files(cache_dir: str = ".cache"):
-    """List all cache files with their details"""
+# Rough pickled size of one cached repository, used by `list --fast` to estimate
+# the repository count of caches written without a count sidecar
+ESTIMATED_BYTES_PER_REPO = 2048
+
+# Files removed by `clear`: pickled caches (whose .meta sidecars go with them)
+# and the SQLite HTTP cache with its write-ahead log files
+CLEARED_SUFFIXES = ('.pkl', '.sqlite', '.sqlite-wal', '.sqlite-shm')
+
+def _probe_repo_count(file_path: str, file_size: int, fast: bool):
+    """Get the repository count of a cache file for display"""
+    # Read the count from the JSON sidecar written with the cache; only caches
+    # written without one have to be unpickled (or, in fast mode, estimated)
+    try:
+        with open(file_path + '.meta') as f:
+            repo_count = json.load(f)['count']
+        return "N/A" if repo_count is None else repo_count
+    except Exception:
+        pass
+    
+    if fast:
+        return f"~{file_size // ESTIMATED_BYTES_PER_REPO}"
+    
+    try:
+        with open(file_path, 'rb') as f:
+            cached_data = pickle.load(f)
+        return len(cached_data) if isinstance(cached_data, list) else "N/A"
+    except Exception:
+        return "Error"
+
+def list_cache_files(cache_dir: str = ".cache", fast: bool = False):
+    """List all cache files with their details
+    
+    With fast=True, caches without a count sidecar are never unpickled; their
+    repository count is estimated from the file size instead.
+    """
     if not os.path.exists(cache_dir):
         console.print(f"[yellow]Cache directory '{cache_dir}' does not exist[/yellow]")
         return
     
-    cache_files = [f for f in os.listdir(cache_dir) if f.endswith('.pkl')]
+    # scandir entries carry their full path and cache their stat result
+    with os.scandir(cache_dir) as entries:
+        cache_entries = sorted((entry for entry in entries if entry.name.endswith('.pkl')), key=lambda entry: entry.name)
     
-    if not cache_files:
+    if not cache_entries:
         console.print(f"[yellow]No cache files found in '{cache_dir}'[/yellow]")
         return
     
@@ -36,10 +73,21 @@ def list_cache_files(cache_dir: str = ".cache"):
     table.add_column("Age", style="blue")
     table.add_column("Repositories", style="red")
     
-    for cache_file in sorted(cache_files):
-        file_path = os.path.join(cache_dir, cache_file)
-        file_size = os.path.getsize(file_path)
-        file_age = time.time() - os.path.getmtime(file_path)
+    def probe(entry):
+        # One stat per file for both size and age, plus the repository count
+        stat = entry.stat()
+        return entry.name, stat, _probe_repo_count(entry.path, stat.st_size, fast)
+    
+    # Stat and probe the files concurrently - on network mounts the per-file
+    # round-trips dominate, and overlapping them costs nothing on local disks
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        probed = list(executor.map(probe, cache_entries))
+    
+    now = time.time()
+    for cache_file, stat, repo_count in probed:
+        file_size = stat.st_size
+        # Whole seconds, so the age formatting below is integer-only
+        file_age = int(now - stat.st_mtime)
         
         # Parse filename to extract org and type
         parts = cache_file.replace('.pkl', '').split('_')
@@ -50,27 +98,20 @@ def list_cache_files(cache_dir: str = ".cache"):
             org_name = "unknown"
             cache_type = "unknown"
         
-        # Try to load cache to get repository count
-        try:
-            with open(file_path, 'rb') as f:
-                cached_data = pickle.load(f)
-                repo_count = len(cached_data) if isinstance(cached_data, list) else "N/A"
-        except Exception:
-            repo_count = "Error"
-        
         # Format age
         if file_age < 60:
-            age_str = f"{file_age:.0f}s"
+            age_str = f"{file_age}s"
         elif file_age < 3600:
-            age_str = f"{file_age/60:.0f}m"
+            age_str = f"{(file_age + 30) // 60}m"
         else:
-            age_str = f"{file_age/3600:.1f}h"
+            tenths = (file_age + 180) // 360
+            age_str = f"{tenths // 10}.{tenths % 10}h"
         
         table.add_row(
             cache_file,
             org_name,
             cache_type,
-            f"{file_size:,} bytes",
+            format(file_size, ',') + " bytes",
             age_str,
             str(repo_count)
         )
@@ -83,27 +124,48 @@ def clear_cache(cache_dir: str = ".cache", org: str = None):
         console.print(f"[yellow]Cache directory '{cache_dir}' does not exist[/yellow]")
         return
     
-    cache_files = [f for f in os.listdir(cache_dir) if f.endswith('.pkl')]
+    prefix = org.replace('/', '_').replace('\\', '_') if org else ''
     
-    if org:
-        # Clear only files for specific organization
-        cache_files = [f for f in cache_files if f.startswith(org.replace('/', '_').replace('\\', '_'))]
+    # scandir yields names and entry types without a stat call per file
+    with os.scandir(cache_dir) as entries:
+        cache_entries = [
+            entry for entry in entries
+            if entry.name.endswith(CLEARED_SUFFIXES) and entry.name.startswith(prefix) and entry.is_file()
+        ]
     
-    if not cache_files:
+    if not cache_entries:
         console.print(f"[yellow]No cache files to clear[/yellow]")
         return
     
-    cleared_count = 0
-    for cache_file in cache_files:
+    # Collect outcomes and report once - printing per file makes terminal I/O dominate
+    cleared = []
+    failures = []
+    for entry in cache_entries:
         try:
-            file_path = os.path.join(cache_dir, cache_file)
-            os.remove(file_path)
-            console.print(f"[green]Cleared {cache_file}[/green]")
-            cleared_count += 1
+            os.remove(entry.path)
+            cleared.append(entry.name)
         except Exception as e:
-            console.print(f"[red]Error clearing {cache_file}: {str(e)}[/red]")
+            failures.append((entry.name, str(e)))
+            continue
+        try:
+            os.remove(entry.path + '.meta')
+        except FileNotFoundError:
+            pass
+    
+    # Name every cleared file again, but in a single render instead of one
+    # flushed console write per file
+    if cleared:
+        console.print('\n'.join(f"[green]Cleared {name}[/green]" for name in cleared))
+    
+    if failures:
+        table = Table(title="Cache files that could not be cleared")
+        table.add_column("File", style="cyan")
+        table.add_column("Error", style="red")
+        for name, error in failures:
+            table.add_row(name, error)
+        console.print(table)
     
-    console.print(f"[green]Cleared {cleared_count} cache files[/green]")
+    console.print(f"[green]Cleared {len(cleared)} cache files[/green]")
 
 def inspect_cache(cache_dir: str = ".cache", cache_file: str = None):
     """Inspect a specific cache file"""
@@ -112,7 +174,10 @@ def inspect_cache(cache_dir: str = ".cache", cache_file: str = None):
         return
     
     file_path = os.path.join(cache_dir, cache_file)
-    if not os.path.exists(file_path):
+    # One stat answers existence, size and age
+    try:
+        stat = os.stat(file_path)
+    except FileNotFoundError:
         console.print(f"[red]Cache file '{cache_file}' not found[/red]")
         return
     
@@ -121,13 +186,15 @@ def inspect_cache(cache_dir: str = ".cache", cache_file: str = None):
             cached_data = pickle.load(f)
         
         console.print(f"[bold blue]Cache File: {cache_file}[/bold blue]")
-        console.print(f"[blue]Size: {os.path.getsize(file_path):,} bytes[/blue]")
-        console.print(f"[blue]Age: {time.time() - os.path.getmtime(file_path):.0f} seconds[/blue]")
+        console.print(f"[blue]Size: {stat.st_size:,} bytes[/blue]")
+        console.print(f"[blue]Age: {time.time() - stat.st_mtime:.0f} seconds[/blue]")
         
         if isinstance(cached_data, list):
             console.print(f"[green]Contains {len(cached_data)} repositories:[/green]")
             for i, repo in enumerate(cached_data[:10]):  # Show first 10
-                console.print(f"  {i+1}. {repo.name}")
+                # Entries are raw API dicts; older caches hold Repository objects
+                name = repo.get('name') if isinstance(repo, dict) else repo.name
+                console.print(f"  {i+1}. {name}")
             if len(cached_data) > 10:
                 console.print(f"  ... and {len(cached_data) - 10} more")
         else:
@@ -141,11 +208,12 @@ def cli():
     """Cache Manager for BuildCheck"""
     pass
 
-@cli.command()
+@cli.command(name='list')
 @click.option('--cache-dir', default='.cache', help='Cache directory (default: .cache)')
-def list(cache_dir):
+@click.option('--fast', is_flag=True, help='Estimate repository counts from file size instead of loading caches')
+def list_command(cache_dir, fast):
     """List all cache files"""
-    list_cache_files(cache_dir)
+    list_cache_files(cache_dir, fast)
 
 @cli.command()
 @click.option('--cache-dir', default='.cache', help='Cache directory (default: .cache)')
@@ -8,15 +8,53 @@ without having to pass numerous command line arguments.
 """
 
 import os
+import sys
+import copy
+import functools
 import yaml
 import re
 import fnmatch
 from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 
+# Prefer libyaml's C parser and emitter when PyYAML was built with them
+try:
+    from yaml import CSafeLoader as _YAMLLoader, CSafeDumper as _YAMLDumper
+except ImportError:
+    from yaml import SafeLoader as _YAMLLoader, SafeDumper as _YAMLDumper
 
-@dataclass
+# Characters that make a glob more than a literal string
+_GLOB_CHARS = re.compile(r'[*?\[]')
+
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@functools.lru_cache(maxsize=32)
+def _load_yaml(path: str, mtime_ns: int, size: int) -> Any:
+    """
+    Parse a YAML file, memoized per path, modification time and size
+    
+    A changed file gets a new mtime (or, on filesystems with coarse timestamps,
+    usually a new size) and is parsed again; repeated loads of an unchanged
+    file within the process are free.
+    
+    Args:
+        path: Resolved path of the YAML file, so symlinks share one entry
+        mtime_ns: Modification time of the file, part of the cache key
+        size: Size of the file in bytes, part of the cache key
+        
+    Returns:
+        Parsed YAML data
+    """
+    # Hand the parser the binary stream: it reads in chunks and decodes the
+    # UTF-8 itself, with no text-layer decode or full str copy in between
+    with open(path, 'rb') as f:
+        return yaml.load(f, Loader=_YAMLLoader)
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class ParallelismConfig:
     """Configuration for parallel processing settings"""
     max_workers: int = 8
@@ -24,7 +62,7 @@ class ParallelismConfig:
     optimized: bool = False
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class APIOptimizationConfig:
     """Configuration for API optimization settings"""
     predict_api_calls: bool = True
@@ -45,21 +83,78 @@ class APIOptimizationConfig:
             }
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ExclusionConfig:
     """Configuration for repository exclusions"""
     repositories: List[str]
     patterns: List[str]
+    _exact: frozenset = field(init=False, repr=False, compare=False)
+    _prefixes: tuple = field(init=False, repr=False, compare=False)
+    _suffixes: tuple = field(init=False, repr=False, compare=False)
+    _pattern_re: Optional[re.Pattern] = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self):
+        self._compile()
 
-@dataclass
+    def __setattr__(self, name: str, value: Any):
+        object.__setattr__(self, name, value)
+        # Keep the compiled matchers in step when the exclusion lists are replaced
+        if name in ('repositories', 'patterns') and hasattr(self, '_pattern_re'):
+            self._compile()
+
+    def _compile(self):
+        """
+        Precompile the exclusions into a set lookup, affix tuples and a single regex
+        
+        Plain 'prefix*' and '*suffix' globs - the common case - become tuples for
+        one C-level str.startswith/endswith call each. fnmatch.fnmatch translates
+        its glob on every call; unioning the remaining translated patterns lets
+        one regex match test all of them at once.
+        """
+        self._exact = frozenset(self.repositories)
+        prefixes = []
+        suffixes = []
+        complex_patterns = []
+        for pattern in self.patterns:
+            if pattern.endswith('*') and not _GLOB_CHARS.search(pattern[:-1]):
+                prefixes.append(pattern[:-1])
+            elif pattern.startswith('*') and not _GLOB_CHARS.search(pattern[1:]):
+                suffixes.append(pattern[1:])
+            else:
+                complex_patterns.append(pattern)
+        self._prefixes = tuple(prefixes)
+        self._suffixes = tuple(suffixes)
+        self._pattern_re = (
+            re.compile('|'.join(f'(?:{fnmatch.translate(pattern)})' for pattern in complex_patterns))
+            if complex_patterns else None
+        )
+
+    def matches(self, repo_name: str) -> bool:
+        """
+        Check a repository name against the exact names and patterns
+        
+        Args:
+            repo_name: Name of the repository to check
+            
+        Returns:
+            True if the repository is excluded, False otherwise
+        """
+        return (
+            repo_name in self._exact
+            or repo_name.startswith(self._prefixes)
+            or repo_name.endswith(self._suffixes)
+            or (self._pattern_re is not None and self._pattern_re.match(repo_name) is not None)
+        )
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class AnalysisConfig:
     """Configuration for analysis mode settings"""
     jenkins_only: bool = False
     single_repository: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class CachingConfig:
     """Configuration for caching settings"""
     enabled: bool = True
@@ -67,7 +162,7 @@ class CachingConfig:
     duration: int = 3600
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class OutputConfig:
     """Configuration for output settings"""
     json_report: Optional[str] = None
@@ -76,7 +171,7 @@ class OutputConfig:
     verbose: bool = False
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class BuildCheckConfig:
     """Main configuration class that holds all BuildCheck settings"""
     organization: str
@@ -98,16 +193,7 @@ class BuildCheckConfig:
         Returns:
             True if repository should be excluded, False otherwise
         """
-        # Check exact repository names
-        if repo_name in self.exclusions.repositories:
-            return True
-        
-        # Check pattern-based exclusions
-        for pattern in self.exclusions.patterns:
-            if fnmatch.fnmatch(repo_name, pattern):
-                return True
-        
-        return False
+        return self.exclusions.matches(repo_name)
 
 
 class ConfigManager:
@@ -137,12 +223,14 @@ class ConfigManager:
             yaml.YAMLError: If config file has invalid YAML
             ValueError: If required fields are missing or invalid
         """
-        if not os.path.exists(self.config_file):
+        try:
+            stat = os.stat(self.config_file)
+        except FileNotFoundError:
             raise FileNotFoundError(f"Configuration file not found: {self.config_file}")
         
         try:
-            with open(self.config_file, 'r') as f:
-                config_data = yaml.safe_load(f)
+            # Copy the memoized data so callers never share mutable parts of it
+            config_data = copy.deepcopy(_load_yaml(os.path.realpath(self.config_file), stat.st_mtime_ns, stat.st_size))
         except yaml.YAMLError as e:
             raise yaml.YAMLError(f"Invalid YAML in configuration file: {e}")
         
@@ -150,6 +238,28 @@ class ConfigManager:
         self.config = self._validate_and_create_config(config_data)
         return self.config
     
+    def load_config_from_stream(self, stream) -> BuildCheckConfig:
+        """
+        Load configuration from an open YAML stream instead of the configuration file
+        
+        Args:
+            stream: Text or binary file-like object containing the YAML configuration
+            
+        Returns:
+            BuildCheckConfig object with all settings
+            
+        Raises:
+            yaml.YAMLError: If the stream has invalid YAML
+            ValueError: If required fields are missing or invalid
+        """
+        try:
+            config_data = yaml.load(stream, Loader=_YAMLLoader)
+        except yaml.YAMLError as e:
+            raise yaml.YAMLError(f"Invalid YAML in configuration: {e}")
+        
+        self.config = self._validate_and_create_config(config_data)
+        return self.config
+    
     def _validate_and_create_config(self, config_data: Dict[str, Any]) -> BuildCheckConfig:
         """
         Validate configuration data and create BuildCheckConfig object
@@ -316,7 +426,7 @@ class ConfigManager:
         }
         
         with open(self.config_file, 'w') as f:
-            yaml.dump(default_config, f, default_flow_style=False, indent=2)
+            yaml.dump(default_config, f, Dumper=_YAMLDumper, default_flow_style=False, indent=2)
     
     def validate_repository_exclusions(self, repo_names: List[str]) -> Dict[str, List[str]]:
         """
@@ -331,11 +441,14 @@ class ConfigManager:
         if self.config is None:
             self.config = self.load_config()
         
+        # One pass with the bound matcher; ExclusionConfig.matches is the single
+        # definition of what is excluded
+        matches = self.config.exclusions.matches
         excluded = []
         included = []
         
         for repo_name in repo_names:
-            if self.config.should_exclude_repository(repo_name):
+            if matches(repo_name):
                 excluded.append(repo_name)
             else:
                 included.append(repo_name)
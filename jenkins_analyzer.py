@@ -3,20 +3,26 @@
 Jenkins-specific analyzer for detailed pipeline analysis
 """
 
+import hashlib
 import re
+import sys
 import yaml
-from typing import Dict, List, Optional
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
-@dataclass
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_OPTIONS)
 class JenkinsStage:
     """Represents a Jenkins pipeline stage"""
     name: str
-    tools: List[str]
-    artifacts: List[str]
-    repositories: List[str]
+    tools: Tuple[str, ...]
+    artifacts: Tuple[str, ...]
+    repositories: Tuple[str, ...]
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class JenkinsPipeline:
     """Represents a complete Jenkins pipeline"""
     repository: str
@@ -27,22 +33,29 @@ class JenkinsPipeline:
 class JenkinsAnalyzer:
     """Specialized analyzer for Jenkins pipelines"""
     
+    # Entries kept in the least-recently-used pipeline and stage result caches
+    ANALYSIS_CACHE_SIZE = 1024
+    STAGE_CACHE_SIZE = 4096
+    
     def __init__(self):
-        self.tool_patterns = {
+        # Tool patterns only test for a match and run case-sensitively against
+        # lowercased stage content, so they are written in lowercase here. (Calling
+        # .lower() on pattern source would also turn escapes like \S into \s.)
+        tool_patterns = {
             'maven': [
                 r'sh\s+[\'"](mvn|mvnw)[^"\']*[\'"]',
                 r'tool\s+[\'"](maven)[\'"]',
-                r'withMaven\s*{'
+                r'withmaven\s*{'
             ],
             'gradle': [
                 r'sh\s+[\'"](gradle|gradlew)[^"\']*[\'"]',
                 r'tool\s+[\'"](gradle)[\'"]',
-                r'withGradle\s*{'
+                r'withgradle\s*{'
             ],
             'grunt': [
                 r'sh\s+[\'"](grunt)[^"\']*[\'"]',
                 r'tool\s+[\'"](grunt)[\'"]',
-                r'withGrunt\s*{',
+                r'withgrunt\s*{',
                 r'grunt\s+--version',
                 r'grunt\s+build',
                 r'grunt\s+test'
@@ -58,7 +71,7 @@ class JenkinsAnalyzer:
             'docker': [
                 r'sh\s+[\'"](docker)[^"\']*[\'"]',
                 r'docker\.build\s*[\'"]([^"\']+)[\'"]',
-                r'docker\.withRegistry\s*[\'"]([^"\']+)[\'"]'
+                r'docker\.withregistry\s*[\'"]([^"\']+)[\'"]'
             ],
             'npm': [
                 r'sh\s+[\'"](npm|yarn)[^"\']*[\'"]',
@@ -66,35 +79,110 @@ class JenkinsAnalyzer:
             ]
         }
         
-        self.artifact_patterns = [
-            r'archiveArtifacts\s*[\'"]([^"\']+)[\'"]',
-            r'publishArtifacts\s*[\'"]([^"\']+)[\'"]',
-            r'artifactoryPublish\s*[\'"]([^"\']+)[\'"]',
-            r'grunt\s+build.*?[\'"]([^"\']+)[\'"]',
-            r'packer\s+build.*?[\'"]([^"\']+)[\'"]'
+        # Each pattern is paired with a lowercase literal it cannot match without
+        artifact_patterns = [
+            ('archiveartifacts', r'archiveArtifacts\s*[\'"]([^"\']+)[\'"]'),
+            ('publishartifacts', r'publishArtifacts\s*[\'"]([^"\']+)[\'"]'),
+            ('artifactorypublish', r'artifactoryPublish\s*[\'"]([^"\']+)[\'"]'),
+            ('grunt', r'grunt\s+build.*?[\'"]([^"\']+)[\'"]'),
+            ('packer', r'packer\s+build.*?[\'"]([^"\']+)[\'"]')
         ]
         
-        self.repository_patterns = [
-            r'repository\s*[\'"]([^"\']+)[\'"]',
-            r'artifactory\s*[\'"]([^"\']+)[\'"]',
-            r'credentialsId\s*[\'"]([^"\']+)[\'"]',
-            r'artifactory_url\s*[\'"]([^"\']+)[\'"]',
-            r'artifactory_repo\s*[\'"]([^"\']+)[\'"]'
+        repository_patterns = [
+            ('repository', r'repository\s*[\'"]([^"\']+)[\'"]'),
+            ('artifactory', r'artifactory\s*[\'"]([^"\']+)[\'"]'),
+            ('credentialsid', r'credentialsId\s*[\'"]([^"\']+)[\'"]'),
+            ('artifactory_url', r'artifactory_url\s*[\'"]([^"\']+)[\'"]'),
+            ('artifactory_repo', r'artifactory_repo\s*[\'"]([^"\']+)[\'"]')
+        ]
+        
+        # Compile every pattern once rather than going through re's pattern cache
+        # for each search over each stage. Tool patterns are already lowercase and
+        # run without IGNORECASE; the others keep IGNORECASE to capture text in its
+        # original case.
+        self.tool_patterns = {
+            tool_name: [re.compile(pattern) for pattern in patterns]
+            for tool_name, patterns in tool_patterns.items()
+        }
+        self.artifact_patterns = [(hint, re.compile(pattern, re.IGNORECASE)) for hint, pattern in artifact_patterns]
+        self.repository_patterns = [(hint, re.compile(pattern, re.IGNORECASE)) for hint, pattern in repository_patterns]
+        
+        # Lowercase literals at least one of which every pattern for a tool needs;
+        # a stage containing none of them can skip that tool's regexes
+        self.tool_hints = {
+            'maven': ('mvn', 'maven'),
+            'gradle': ('gradle',),
+            'grunt': ('grunt',),
+            'packer': ('packer',),
+            'docker': ('docker',),
+            'npm': ('npm', 'yarn', 'nodejs')
+        }
+        
+        # Flattened (tool, hints, bound search methods) for _extract_tools, so the
+        # per-stage loop does no dict lookups or attribute resolution
+        self.tool_checks = [
+            (tool_name, self.tool_hints[tool_name], tuple(pattern.search for pattern in patterns))
+            for tool_name, patterns in self.tool_patterns.items()
         ]
+        
+        # Stage headers - stage 'name' { or stage('name') { - and the tokens that
+        # matter while scanning for the end of a stage body
+        self.stage_header_pattern = re.compile(r'stage\s*\(?\s*[\'"]([^\'"]+)[\'"]\s*\)?\s*\{')
+        self.block_token_pattern = re.compile(r"'''|\"\"\"|[{}'\"\\]|//|/\*")
+        
+        # Analysis results keyed by a digest of the Jenkinsfile, since template
+        # pipelines are copied across many repositories. Both caches are bounded
+        # LRUs so an org-wide run doesn't keep a result for every file it sees.
+        self.analysis_cache = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        
+        # (tools, artifacts, repositories) keyed by a digest of the stage body, for
+        # templated stages repeated within and across Jenkinsfiles
+        self.stage_cache = OrderedDict()
 
     def analyze_jenkinsfile(self, content: str, repository: str) -> JenkinsPipeline:
         """Analyze a Jenkinsfile for tools and artifacts"""
+        key = hashlib.blake2b(content.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+        cached = self.analysis_cache.get(key)
+        if cached is None:
+            self.cache_misses += 1
+            cached = self.analysis_cache[key] = self._analyze_content(content)
+            if len(self.analysis_cache) > self.ANALYSIS_CACHE_SIZE:
+                self.analysis_cache.popitem(last=False)
+        else:
+            self.cache_hits += 1
+            self.analysis_cache.move_to_end(key)
+        
+        stages, tools_used, artifactory_repos = cached
+        return JenkinsPipeline(
+            repository=repository,
+            stages=list(stages),
+            tools_used=list(tools_used),
+            artifactory_repos=list(artifactory_repos)
+        )
+
+    def _analyze_content(self, content: str) -> Tuple[Tuple[JenkinsStage, ...], Tuple[str, ...], Tuple[str, ...]]:
+        """Analyze Jenkinsfile content, returning (stages, tools used, artifactory repos)"""
         stages = []
-        tools_used = []
-        artifactory_repos = []
+        tools_used = set()
+        artifactory_repos = set()
         
         # Extract stages
-        stage_matches = re.findall(r'stage\s*[\'"]([^"\']+)[\'"]\s*{([^}]+)}', content, re.DOTALL)
-        
-        for stage_name, stage_content in stage_matches:
-            stage_tools = self._extract_tools(stage_content)
-            stage_artifacts = self._extract_artifacts(stage_content)
-            stage_repos = self._extract_repositories(stage_content)
+        for stage_name, stage_content in self._extract_stages(content):
+            key = hashlib.blake2b(stage_content.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+            extracted = self.stage_cache.get(key)
+            if extracted is None:
+                extracted = self.stage_cache[key] = (
+                    self._extract_tools(stage_content),
+                    self._extract_artifacts(stage_content),
+                    self._extract_repositories(stage_content)
+                )
+                if len(self.stage_cache) > self.STAGE_CACHE_SIZE:
+                    self.stage_cache.popitem(last=False)
+            else:
+                self.stage_cache.move_to_end(key)
+            stage_tools, stage_artifacts, stage_repos = extracted
             
             stages.append(JenkinsStage(
                 name=stage_name,
@@ -103,42 +191,106 @@ class JenkinsAnalyzer:
                 repositories=stage_repos
             ))
             
-            tools_used.extend(stage_tools)
-            artifactory_repos.extend(stage_repos)
+            tools_used.update(stage_tools)
+            artifactory_repos.update(stage_repos)
         
-        # Remove duplicates
-        tools_used = list(set(tools_used))
-        artifactory_repos = list(set(artifactory_repos))
+        return tuple(stages), tuple(tools_used), tuple(artifactory_repos)
+
+    def _extract_stages(self, content: str) -> List[Tuple[str, str]]:
+        """
+        Extract (name, body) for each top-level stage in a Jenkinsfile
         
-        return JenkinsPipeline(
-            repository=repository,
-            stages=stages,
-            tools_used=tools_used,
-            artifactory_repos=artifactory_repos
-        )
+        Only stage headers are matched with a regex; each body then runs to its
+        matching close brace, so closures, maps and ${...} interpolation inside a
+        stage no longer cut it short. Stages nested in another stage's body are
+        part of that body.
+        """
+        stages = []
+        pos = 0
+        while True:
+            header = self.stage_header_pattern.search(content, pos)
+            if header is None:
+                return stages
+            body_end = self._find_block_end(content, header.end())
+            stages.append((header.group(1), content[header.end():body_end]))
+            pos = body_end + 1
 
-    def _extract_tools(self, content: str) -> List[str]:
+    def _find_block_end(self, content: str, start: int) -> int:
+        """
+        Find the brace closing a block whose opening brace ends just before start
+        
+        A single forward scan jumping between braces, quotes, escapes and comments;
+        braces inside strings (single, double or triple quoted) and comments are ignored.
+        
+        Returns:
+            Index of the closing brace, or len(content) if the block is unterminated
+        """
+        depth = 1
+        quote = None
+        pos = start
+        while True:
+            token = self.block_token_pattern.search(content, pos)
+            if token is None:
+                return len(content)
+            char = token.group()
+            pos = token.end()
+            if quote:
+                if char == '\\':
+                    pos += 1  # Skip the escaped character
+                elif char == quote:
+                    quote = None
+                elif char[0] == quote:
+                    # A triple quote token closing a single-quoted string: close at
+                    # its first character and rescan the rest
+                    quote = None
+                    pos = token.start() + 1
+            elif char == '{':
+                depth += 1
+            elif char == '}':
+                depth -= 1
+                if depth == 0:
+                    return token.start()
+            elif char == '//':
+                line_end = content.find('\n', pos)
+                pos = len(content) if line_end == -1 else line_end
+            elif char == '/*':
+                comment_end = content.find('*/', pos)
+                pos = len(content) if comment_end == -1 else comment_end + 2
+            elif char != '\\':
+                quote = char
+
+    def _extract_tools(self, content: str) -> Tuple[str, ...]:
         """Extract build tools from content"""
+        lowered = content.lower()
         tools = []
-        for tool_name, patterns in self.tool_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, content, re.IGNORECASE):
+        # Plain loops with break/else instead of any() over generators - this runs
+        # once per stage and generator setup dominated its cost
+        for tool_name, hints, searches in self.tool_checks:
+            for hint in hints:
+                if hint in lowered:
+                    break
+            else:
+                continue
+            for search in searches:
+                if search(lowered):
                     tools.append(tool_name)
                     break
-        return tools
+        return tuple(tools)
 
-    def _extract_artifacts(self, content: str) -> List[str]:
+    def _extract_artifacts(self, content: str) -> Tuple[str, ...]:
         """Extract artifact patterns from content"""
+        lowered = content.lower()
         artifacts = []
-        for pattern in self.artifact_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            artifacts.extend(matches)
-        return artifacts
+        for hint, pattern in self.artifact_patterns:
+            if hint in lowered:
+                artifacts.extend(pattern.findall(content))
+        return tuple(artifacts)
 
-    def _extract_repositories(self, content: str) -> List[str]:
+    def _extract_repositories(self, content: str) -> Tuple[str, ...]:
         """Extract repository references from content"""
+        lowered = content.lower()
         repos = []
-        for pattern in self.repository_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            repos.extend(matches)
-        return repos 
\ No newline at end of file
+        for hint, pattern in self.repository_patterns:
+            if hint in lowered:
+                repos.extend(pattern.findall(content))
+        return tuple(repos) 
\ No newline at end of file
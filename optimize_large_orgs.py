@@ -18,6 +18,7 @@ Usage:
 import os
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from build_check import SimpleBuildAnalyzer, console
 
 def analyze_large_organization(org_name: str, token: str, use_cache: bool = True):
@@ -43,20 +44,22 @@ def analyze_large_organization(org_name: str, token: str, use_cache: bool = True
         cache_dir=".cache"
     )
     
-    # Check initial rate limit
+    # Save the analysis caches and release the analyzer's workers and caches
+    # however the run ends, as main() in build_check does
     try:
-        rate_limit = analyzer.github.get_rate_limit()
-        console.print(f"[blue]Initial API calls remaining: {rate_limit.core.remaining}/{rate_limit.core.limit}[/blue]")
+        # Check initial rate limit
+        try:
+            rate_limit = analyzer.get_rate_limit_status()
+            console.print(f"[blue]Initial API calls remaining: {rate_limit.remaining}/{rate_limit.limit}[/blue]")
+            
+            if rate_limit.remaining < 1000:
+                console.print("[red]Warning: Low API calls remaining. Consider running later.[/red]")
+                return
+        except Exception as e:
+            console.print(f"[yellow]Could not check rate limit: {str(e)}[/yellow]")
+        
+        start_time = time.monotonic()
         
-        if rate_limit.core.remaining < 1000:
-            console.print("[red]Warning: Low API calls remaining. Consider running later.[/red]")
-            return
-    except Exception as e:
-        console.print(f"[yellow]Could not check rate limit: {str(e)}[/yellow]")
-    
-    start_time = time.time()
-    
-    try:
         # Use optimized repository fetching
         console.print("[bold green]Using optimized repository fetching...[/bold green]")
         repos = analyzer.get_repositories_optimized()
@@ -80,21 +83,31 @@ def analyze_large_organization(org_name: str, token: str, use_cache: bool = True
             batch = repos[i:i+batch_size]
             console.print(f"[blue]Processing batch {i//batch_size + 1}/{(len(repos) + batch_size - 1)//batch_size}[/blue]")
             
-            for repo in batch:
-                try:
-                    build_tools, java_versions, plugin_versions = analyzer.analyze_repository(repo)
-                    all_build_tools.extend(build_tools)
-                    all_java_versions.extend(java_versions)
-                    all_plugin_versions.extend(plugin_versions)
-                except Exception as e:
-                    console.print(f"[red]Error analyzing {repo.name}: {str(e)}[/red]")
+            # Fetch the build files of the whole batch in one GraphQL request rather
+            # than one request per repository
+            analyzer.prefetch_repository_files(batch)
+            
+            # Each analysis waits on GitHub API responses, so overlap them across
+            # the analyzer's workers
+            with ThreadPoolExecutor(max_workers=analyzer.max_workers) as executor:
+                futures = {executor.submit(analyzer.analyze_repository, repo): repo for repo in batch}
+                for future in as_completed(futures):
+                    try:
+                        build_tools, java_versions, plugin_versions = future.result()
+                        all_build_tools.extend(build_tools)
+                        all_java_versions.extend(java_versions)
+                        all_plugin_versions.extend(plugin_versions)
+                    except Exception as e:
+                        console.print(f"[red]Error analyzing {futures[future].name}: {str(e)}[/red]")
             
-            # Check rate limit after each batch
+            # Check rate limit after each batch. The headers of the last response
+            # answer this for free; the rate limit endpoint is only asked to
+            # confirm before pausing.
             try:
-                rate_limit = analyzer.github.get_rate_limit()
-                console.print(f"[blue]API calls remaining: {rate_limit.core.remaining}[/blue]")
+                rate_limit = analyzer.get_rate_limit_status()
+                console.print(f"[blue]API calls remaining: {rate_limit.remaining}[/blue]")
                 
-                if rate_limit.core.remaining < 100:
+                if rate_limit.remaining < 100 and analyzer.github.get_rate_limit().core.remaining < 100:
                     console.print("[red]Rate limit approaching. Pausing...[/red]")
                     time.sleep(60)  # Wait 1 minute
             except Exception as e:
@@ -104,22 +117,24 @@ def analyze_large_organization(org_name: str, token: str, use_cache: bool = True
         console.print("[bold blue]Generating report...[/bold blue]")
         analyzer.generate_report(all_build_tools, all_java_versions, all_plugin_versions)
         
-        end_time = time.time()
-        total_time = end_time - start_time
+        total_time = time.monotonic() - start_time
         
         console.print(f"[green]Analysis completed in {total_time:.1f} seconds[/green]")
         console.print(f"[green]Total API calls made: {analyzer.api_calls_made}[/green]")
         
         # Final rate limit check
         try:
-            final_rate_limit = analyzer.github.get_rate_limit()
-            console.print(f"[blue]Final API calls remaining: {final_rate_limit.core.remaining}[/blue]")
+            final_rate_limit = analyzer.get_rate_limit_status()
+            console.print(f"[blue]Final API calls remaining: {final_rate_limit.remaining}[/blue]")
         except Exception as e:
             console.print(f"[yellow]Could not check final rate limit: {str(e)}[/yellow]")
         
     except Exception as e:
         console.print(f"[red]Error during analysis: {str(e)}[/red]")
         raise
+    finally:
+        analyzer._save_analysis_caches()
+        analyzer.close()
 
 if __name__ == "__main__":
     import argparse
@@ -41,6 +41,10 @@ while [[ $# -gt 0 ]]; do
             PYTEST_OPTS="$PYTEST_OPTS -m slow"
             shift
             ;;
+        --parallel|-n)
+            PYTEST_OPTS="$PYTEST_OPTS -n auto"
+            shift
+            ;;
         --help|-h)
             echo "Usage: $0 [options]"
             echo ""
@@ -50,12 +54,14 @@ while [[ $# -gt 0 ]]; do
             echo "  --unit              Run only unit tests"
             echo "  --integration       Run only integration tests"
             echo "  --slow              Run only slow tests"
+            echo "  --parallel, -n      Run tests in parallel across all CPU cores"
             echo "  --help, -h          Show this help message"
             echo ""
             echo "Examples:"
             echo "  $0                    # Run all tests"
             echo "  $0 --coverage         # Run tests with coverage"
             echo "  $0 --unit --verbose   # Run unit tests with verbose output"
+            echo "  $0 --parallel         # Run tests in parallel"
             exit 0
             ;;
         *)
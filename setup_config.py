@@ -11,11 +11,26 @@ import sys
 import click
 from pathlib import Path
 
-try:
-    from config_manager import ConfigManager, create_default_config_file
-except ImportError:
-    print("Error: config_manager module not found. Please ensure it's in the same directory.")
-    sys.exit(1)
+
+def _load_config_manager(config_file: str):
+    """Create a ConfigManager, importing config_manager only once a command runs"""
+    try:
+        from config_manager import ConfigManager
+    except ImportError:
+        print("Error: config_manager module not found. Please ensure it's in the same directory.")
+        sys.exit(1)
+    return ConfigManager(config_file)
+
+
+def _dump_yaml(data: dict, stream):
+    """Write data as YAML, importing PyYAML only once a configuration file is written"""
+    import yaml
+    # Prefer libyaml's C emitter when PyYAML was built with it
+    try:
+        from yaml import CSafeDumper as YAMLDumper
+    except ImportError:
+        from yaml import SafeDumper as YAMLDumper
+    yaml.dump(data, stream, Dumper=YAMLDumper, default_flow_style=False, indent=2)
 
 
 @click.command()
@@ -44,7 +59,7 @@ def setup(org: str, config: str, jenkins_only: bool, max_workers: int, verbose:
     
     try:
         # Create the configuration manager
-        config_manager = ConfigManager(config)
+        config_manager = _load_config_manager(config)
         
         # Create default config structure
         config_data = {
@@ -86,9 +101,8 @@ def setup(org: str, config: str, jenkins_only: bool, max_workers: int, verbose:
         }
         
         # Write the configuration file
-        import yaml
         with open(config, 'w') as f:
-            yaml.dump(config_data, f, default_flow_style=False, indent=2)
+            _dump_yaml(config_data, f)
         
         print(f"✅ Configuration file created: {config}")
         print(f"📋 Organization: {org}")
@@ -128,7 +142,7 @@ def show_config(config: str):
         return
     
     try:
-        config_manager = ConfigManager(config)
+        config_manager = _load_config_manager(config)
         config_obj = config_manager.load_config()
         
         print(f"📋 Configuration: {config}")
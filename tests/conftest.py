@@ -3,12 +3,22 @@ Shared pytest configuration and fixtures for BuildCheck tests
 """
 
 import os
+import time
 import pytest
+from collections import namedtuple
+from types import SimpleNamespace
 from dotenv import load_dotenv
 
 # Load environment variables for all tests
 load_dotenv()
 
+# Skips whole modules whose every test needs a token, at collection time and
+# without resolving the github_token fixture per test
+requires_github_token = pytest.mark.skipif(
+    not os.environ.get('GITHUB_TOKEN'),
+    reason="GITHUB_TOKEN environment variable is required for tests"
+)
+
 
 @pytest.fixture(scope="session")
 def github_token():
@@ -25,37 +35,26 @@ def test_org():
     return "octocat"  # GitHub's test organization
 
 
-@pytest.fixture(scope="function")
-def cache_cleanup():
-    """Function-scoped fixture to clean up cache before and after tests"""
-    cache_dir = ".cache"
-    
-    # Clean up before test
-    if os.path.exists(cache_dir):
-        for file in os.listdir(cache_dir):
-            if file.endswith('.pkl'):
-                os.remove(os.path.join(cache_dir, file))
-    
-    yield
-    
-    # Clean up after test
-    if os.path.exists(cache_dir):
-        for file in os.listdir(cache_dir):
-            if file.endswith('.pkl'):
-                os.remove(os.path.join(cache_dir, file))
-
-
-@pytest.fixture(scope="function")
+# Lightweight stand-in for a PyGithub Repository. Unlike Mock(name=...), which
+# reserves `name` for the mock itself, it sets .name and fails on typos.
+FakeRepo = namedtuple('FakeRepo', ['name', 'default_branch', 'archived'], defaults=['main', False])
+
+# Optimization-related attributes every SimpleBuildAnalyzer should expose
+EXPECTED_ANALYZER_ATTRS = frozenset({'rate_limit_delay', 'api_calls_made', 'max_workers'})
+
+# Rate limit headers of a mock API response, with the reset computed once per run
+RATE_LIMIT_HEADERS = {
+    'X-RateLimit-Remaining': '4999',
+    'X-RateLimit-Limit': '5000',
+    'X-RateLimit-Reset': str(int(time.time()) + 3600)
+}
+
+
+@pytest.fixture(scope="module")
 def mock_api_response():
-    """Function-scoped fixture to provide a mock API response"""
-    from unittest.mock import MagicMock
-    
-    mock_response = MagicMock()
-    mock_response.json.return_value = [{"name": "test-repo"}]
-    mock_response.status_code = 200
-    mock_response.headers = {
-        'X-RateLimit-Remaining': '4999',
-        'X-RateLimit-Limit': '5000',
-        'X-RateLimit-Reset': '1234567890'
-    }
-    return mock_response 
\ No newline at end of file
+    """Module-scoped mock API response, shared because tests only read it"""
+    return SimpleNamespace(
+        json=lambda: [{"name": "test-repo"}],
+        status_code=200,
+        headers=RATE_LIMIT_HEADERS
+    )
@@ -5,7 +5,8 @@ Tests for API optimization features in BuildCheck
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 import sys
-import os
+
+from tests.conftest import EXPECTED_ANALYZER_ATTRS, FakeRepo
 
 # Import the modules to test
 try:
@@ -43,7 +44,7 @@ class TestAPIOptimization:
         
         return mock_gh
     
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def test_org(self):
         """Fixture to provide test organization"""
         return "test-org"
@@ -101,11 +102,11 @@ class TestAPIOptimization:
     
     def test_analysis_plan_creation(self, optimizer):
         """Test analysis plan creation"""
-        # Create mock repositories
-        mock_repos = [Mock(name=f'repo-{i}', default_branch='main') for i in range(10)]
+        # Create fake repositories
+        repos = [FakeRepo(name=f'repo-{i}') for i in range(10)]
         
         # Create analysis plan
-        plan = optimizer.create_analysis_plan(mock_repos, jenkins_only=False)
+        plan = optimizer.create_analysis_plan(repos, jenkins_only=False)
         
         # Check plan structure
         assert 'total_repositories' in plan
@@ -195,21 +196,23 @@ class TestAPIOptimization:
         # Should return a reasonable estimate
         assert isinstance(size_estimate, int)
         assert size_estimate >= 0
+    
+    def test_repeated_lookups_reuse_recent_results(self, optimizer, mock_github):
+        """Test that rate limit and size lookups are not repeated within their TTL"""
+        for _ in range(3):
+            optimizer._get_rate_limit_remaining()
+            optimizer.get_organization_size_estimate()
+        
+        assert mock_github.get_rate_limit.call_count == 1
+        assert mock_github.search_repositories.call_count == 1
+        assert optimizer.api_calls_made == 1, "Cached estimates should not count as API calls"
 
 
 @pytest.mark.skipif(not BUILD_CHECK_AVAILABLE, reason="BuildCheck module not available")
 class TestBuildCheckOptimizationIntegration:
     """Test class for BuildCheck integration with API optimization"""
     
-    @pytest.fixture
-    def github_token(self):
-        """Fixture to provide GitHub token for tests"""
-        token = os.getenv('GITHUB_TOKEN')
-        if not token:
-            pytest.skip("GITHUB_TOKEN environment variable is required")
-        return token
-    
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def test_org(self):
         """Fixture to provide test organization"""
         return "test-org"
@@ -224,8 +227,8 @@ class TestBuildCheckOptimizationIntegration:
         )
         
         # Should have optimization-related attributes
-        assert hasattr(analyzer, 'rate_limit_delay')
-        assert hasattr(analyzer, 'api_calls_made')
+        missing = EXPECTED_ANALYZER_ATTRS - set(dir(analyzer))
+        assert not missing, missing
     
     def test_optimized_api_calls(self, github_token, test_org):
         """Test that API calls are optimized"""
@@ -235,9 +238,8 @@ class TestBuildCheckOptimizationIntegration:
         assert analyzer.api_calls_made == 0
         
         # Verify analyzer has optimization-related attributes
-        assert hasattr(analyzer, 'rate_limit_delay')
-        assert hasattr(analyzer, 'api_calls_made')
-        assert hasattr(analyzer, 'max_workers')
+        missing = EXPECTED_ANALYZER_ATTRS - set(dir(analyzer))
+        assert not missing, missing
 
 
 if __name__ == '__main__':
@@ -2,30 +2,45 @@
 Tests for the main build_check module functionality
 """
 
-import os
+import sqlite3
+import threading
+import time
 import pytest
+from datetime import datetime
 from unittest.mock import patch, MagicMock
-from dotenv import load_dotenv
 
 # Import the modules to test
-from build_check import BuildAnalyzer, SimpleBuildAnalyzer
+from build_check import BuildAnalyzer, SimpleBuildAnalyzer, CompiledPatterns, ResultStore, HttpCache, ReportRows, BuildTool, JavaVersion, _request_json
 
-# Load environment variables for tests
-load_dotenv()
+
+@pytest.fixture
+def make_analyzer():
+    """Factory fixture for analyzers that don't contact GitHub, closed after the test"""
+    analyzers = []
+    
+    def make(**kwargs):
+        with patch('build_check.Github'):
+            analyzer = SimpleBuildAnalyzer("token", "test-org", **kwargs)
+        # A full budget from the rate limit endpoint, so API calls aren't throttled
+        analyzer.github.get_rate_limit.return_value.core = MagicMock(remaining=5000, limit=5000, reset=datetime.fromtimestamp(time.time() + 3600))
+        analyzers.append(analyzer)
+        return analyzer
+    
+    yield make
+    for analyzer in analyzers:
+        analyzer.close()
+
+
+@pytest.fixture
+def analyzer(make_analyzer):
+    """Fixture to provide an analyzer without contacting GitHub"""
+    return make_analyzer()
 
 
 class TestBuildAnalyzer:
     """Test class for BuildAnalyzer functionality"""
     
-    @pytest.fixture
-    def github_token(self):
-        """Fixture to provide GitHub token for tests"""
-        token = os.getenv('GITHUB_TOKEN')
-        if not token:
-            pytest.skip("GITHUB_TOKEN environment variable is required")
-        return token
-    
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def test_org(self):
         """Fixture to provide test organization"""
         return "test-org"
@@ -95,15 +110,7 @@ class TestBuildAnalyzer:
 class TestSimpleBuildAnalyzer:
     """Test class for SimpleBuildAnalyzer functionality"""
     
-    @pytest.fixture
-    def github_token(self):
-        """Fixture to provide GitHub token for tests"""
-        token = os.getenv('GITHUB_TOKEN')
-        if not token:
-            pytest.skip("GITHUB_TOKEN environment variable is required")
-        return token
-    
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def test_org(self):
         """Fixture to provide test organization"""
         return "test-org"
@@ -230,16 +237,398 @@ class TestIntegration:
         assert hasattr(analyzer, '_make_api_call'), "Should have _make_api_call method"
     
     @pytest.mark.slow
-    def test_cache_integration(self, github_token, test_org, cache_cleanup):
+    def test_cache_integration(self, github_token, test_org, tmp_path):
         """Test that caching works in a real scenario"""
         # This test would normally make real API calls and test caching
         # For now, we'll test the basic structure
-        analyzer1 = SimpleBuildAnalyzer(github_token, test_org, use_cache=True)
-        analyzer2 = SimpleBuildAnalyzer(github_token, test_org, use_cache=True)
+        analyzer1 = SimpleBuildAnalyzer(github_token, test_org, use_cache=True, cache_dir=str(tmp_path))
+        analyzer2 = SimpleBuildAnalyzer(github_token, test_org, use_cache=True, cache_dir=str(tmp_path))
         
         assert analyzer1.use_cache is True, "First analyzer should use cache"
         assert analyzer2.use_cache is True, "Second analyzer should use cache"
 
 
+
+class TestCompiledPatterns:
+    """Test class for precompiled pattern matching"""
+    
+    def test_first_matches_returns_groups_per_pattern(self):
+        """Test that each pattern's own capture groups are returned in pattern order"""
+        patterns = CompiledPatterns.compile([r'a=(\d+)', r'b=(\w+)-(\w+)'], 0)
+        
+        matches = list(patterns.first_matches("b=x-y a=1 a=2"))
+        
+        assert matches == [(0, ('1',)), (1, ('x', 'y'))], "Only the first match of each pattern should be kept"
+    
+    def test_first_matches_overlapping_patterns(self):
+        """Test that a match of one pattern doesn't hide text from a later pattern"""
+        patterns = CompiledPatterns.compile([r"maven\s*'([^']+)'", r'\b(3\.[\d.]+)\b'], 0)
+        
+        matches = list(patterns.first_matches("maven 'Maven 3.8.1'"))
+        
+        assert matches == [(0, ('Maven 3.8.1',)), (1, ('3.8.1',))], "Both patterns should match the same text"
+    
+    def test_first_matches_no_match(self):
+        """Test that content without matches yields an empty result"""
+        patterns = CompiledPatterns.compile([r'a=(\d+)'], 0, ['source'])
+        
+        assert list(patterns.first_matches("nothing here")) == [], "No patterns should match"
+        assert patterns.kinds == ['source'], "Kinds should be kept per pattern"
+
+
+class TestVersionExtraction:
+    """Test class for build tool version extraction from file content"""
+    
+    @pytest.mark.parametrize("tool, content, expected", [
+        ('maven', "pipeline {\n  tools {\n    maven 'Maven 3.8.1'\n  }\n}", '3.8.1'),
+        ('gradle', "pipeline {\n  tools {\n    gradle 'Gradle 7.4.2'\n  }\n}", '7.4.2'),
+        ('gradle', "distributionUrl=https\\://services.gradle.org/distributions/gradle-7.4.2-bin.zip", '7.4.2'),
+        ('maven', "distributionUrl=https://repo.maven.apache.org/maven2/org/apache/maven/apache-maven/3.9.6/apache-maven-3.9.6-bin.zip", '3.9.6'),
+    ])
+    def test_extract_version(self, analyzer, tool, content, expected):
+        """Test that versions are found even when an earlier pattern matches the same text"""
+        assert analyzer._extract_version(content, analyzer.build_tools[tool]['compiled']) == expected
+
+
+class TestResultStore:
+    """Test class for the on-disk findings store"""
+    
+    def test_views_round_trip_findings(self):
+        """Test that stored findings come back in insertion order as dataclasses"""
+        store = ResultStore()
+        maven = BuildTool("maven", "3.8.6", "pom.xml", "repo1", "main", "Found in pom.xml")
+        gradle = BuildTool("gradle", "8.4", "build.gradle", "repo2", "main", "Found in build.gradle")
+        java = JavaVersion("17", "17", None, "pom.xml", "repo1", "main", "Found in maven configuration")
+        
+        store.add([maven], [java], [])
+        store.add([gradle], [], [])
+        build_tools, java_versions, plugin_versions = store.views()
+        
+        assert len(build_tools) == 2, "Both build tools should be stored"
+        assert list(build_tools) == [maven, gradle], "Findings should keep insertion order"
+        assert list(java_versions) == [java], "None values should survive the round trip"
+        assert not plugin_versions, "Empty tables should be falsy"
+        store.close()
+    
+    def test_repository_findings_persist_across_runs(self, tmp_path):
+        """Test that per-repository findings are replaced and read back from a persistent store"""
+        path = str(tmp_path / "repo_results.sqlite")
+        old = BuildTool("maven", "3.6.0", "pom.xml", "repo1", "main", "Found in pom.xml")
+        maven = BuildTool("maven", "3.8.6", "pom.xml", "repo1", "main", "Found in pom.xml")
+        java = JavaVersion("17", "17", None, "pom.xml", "repo1", "main", "Found in maven configuration")
+        
+        store = ResultStore(path)
+        store.store_repository("repo1", ("2024-01-01", "main"), "fp", [old], [], [])
+        store.store_repository("repo1", ("2024-02-01", "main"), "fp", [maven], [java], [])
+        store.commit()
+        store.close()
+        
+        store = ResultStore(path)
+        assert store.repository_versions("fp") == {"repo1": ("2024-02-01", "main")}
+        assert store.repository_versions("other") == {}, "Findings of other patterns should not be reused"
+        assert store.repository_findings("repo1") == ([maven], [java], []), "Re-analysis should replace earlier findings"
+        store.close()
+
+
+class TestHttpCache:
+    """Test class for the SQLite conditional request cache"""
+    
+    def test_entries_persist_across_connections(self, tmp_path):
+        """Test that stored ETags and bodies are read back by a later run"""
+        path = str(tmp_path / "http.sqlite")
+        cache = HttpCache(path)
+        cache.put(('tree', 'test-org/repo', 'main'), '"abc"', {'tree': [{'path': 'pom.xml'}]})
+        cache.close()
+        
+        reopened = HttpCache(path)
+        
+        assert reopened.get(('tree', 'test-org/repo', 'main')) == ('"abc"', {'tree': [{'path': 'pom.xml'}]})
+        assert reopened.get(('tree', 'test-org/other', 'main')) is None
+
+
+class TestRequestJson:
+    """Test class for decoding API responses"""
+    
+    @pytest.fixture
+    def requester(self):
+        """Fixture to provide a requester that raises PyGithub's exceptions"""
+        from github.Requester import Requester
+        requester = MagicMock()
+        requester.createException = Requester.createException
+        return requester
+    
+    def test_decodes_response_body(self, requester):
+        """Test that raw response bodies are decoded, and empty ones become None"""
+        requester.requestJson.return_value = (200, {'etag': '"abc"'}, '{"tree": [{"path": "pom.xml", "size": 512}]}')
+        assert _request_json(requester, "GET", "/repos/o/r/git/trees/main") == ({'etag': '"abc"'}, {'tree': [{'path': 'pom.xml', 'size': 512}]})
+        
+        requester.requestJson.return_value = (304, {}, '')
+        assert _request_json(requester, "GET", "/repos/o/r/git/trees/main") == ({}, None)
+    
+    def test_error_status_raises(self, requester):
+        """Test that error responses raise the matching GithubException"""
+        from github import UnknownObjectException
+        requester.requestJson.return_value = (404, {}, '{"message": "Not Found"}')
+        
+        with pytest.raises(UnknownObjectException):
+            _request_json(requester, "GET", "/repos/o/missing")
+
+
+class TestReportRows:
+    """Test class for the shared report rows"""
+    
+    def test_rows_follow_report_column_order(self):
+        """Test that findings are flattened in the column order of the reports"""
+        tool = BuildTool("maven", "3.9.6", "pom.xml", "repo", "main", "Found in pom.xml")
+        java = JavaVersion("17", "17", None, "pom.xml", "repo", "main", "Found in pom.xml")
+        
+        rows = ReportRows.from_findings([tool], [java], [])
+        
+        assert rows.build_tools == [("repo", "maven", "3.9.6", "pom.xml", "Found in pom.xml")]
+        assert rows.java_versions == [("repo", "17", "17", None, "pom.xml", "Found in pom.xml")]
+        assert rows.plugin_versions == []
+
+
+class TestStructuredParsers:
+    """Test class for the structured pom.xml and properties parsers"""
+    
+    def test_pom_with_namespace(self, analyzer):
+        """Test that Java settings are read from a namespaced pom.xml"""
+        pom = (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<project xmlns="http://maven.apache.org/POM/4.0.0">'
+            '<properties><java.version>17</java.version></properties>'
+            '<build><plugins><plugin><artifactId>maven-compiler-plugin</artifactId>'
+            '<configuration><source>11</source><target>11</target></configuration>'
+            '</plugin></plugins></build></project>'
+        )
+        
+        settings = analyzer._parse_pom_java_settings(pom)
+        
+        assert settings == [('java.version', '17'), ('source', '11'), ('target', '11')], "Properties should take priority over plugin configuration"
+    
+    def test_malformed_pom_falls_back_to_patterns(self, analyzer):
+        """Test that unparseable XML is left to the regex patterns"""
+        assert analyzer._parse_pom_java_settings("<project><properties>") is None, "Malformed XML should not be parsed"
+    
+    def test_properties_java_settings(self, analyzer):
+        """Test that gradle.properties values are read in a single pass"""
+        content = "# comment\njava.version = 17\nsourceCompatibility=JavaVersion.VERSION_1_8\n"
+        
+        settings = analyzer._parse_properties_java_settings(content)
+        
+        assert settings == [('source', '1_8'), ('java.version', '17')], "Properties should be parsed with prefixes removed"
+
+
+class TestRepositoryCache:
+    """Test class for the repository list cache format"""
+    
+    def test_cache_stores_trimmed_raw_data(self, make_analyzer, tmp_path):
+        """Test that only the fields used by the analysis are cached and rehydrated"""
+        analyzer = make_analyzer(use_cache=True, cache_dir=str(tmp_path))
+        repo = MagicMock()
+        repo._rawData = {
+            'name': 'repo', 'full_name': 'test-org/repo', 'url': 'https://api.github.com/repos/test-org/repo',
+            'default_branch': 'main', 'archived': False, 'size': 42, 'hooks_url': 'unused'
+        }
+        
+        analyzer._save_to_cache([repo], 'all_repos')
+        cached = analyzer._load_from_cache('all_repos')
+        
+        assert [cached_repo._rawData for cached_repo in cached] == [{key: value for key, value in repo._rawData.items() if key != 'hooks_url'}]
+        assert cached[0].name == 'repo' and cached[0].size == 42
+        analyzer.org._requester.requestJsonAndCheck.assert_not_called()
+    
+    def test_rehydrated_repository_completes_dropped_fields(self, analyzer):
+        """Test that fields not kept by the cache are fetched on first use instead of reading None"""
+        raw = {'name': 'repo', 'full_name': 'test-org/repo', 'url': 'https://api.github.com/repos/test-org/repo', 'default_branch': 'main'}
+        requester = analyzer.org._requester
+        requester.requestJsonAndCheck.return_value = ({}, {**raw, 'language': 'Java'})
+        
+        repo = analyzer._repository_from_raw(raw)
+        
+        assert repo.default_branch == 'main'
+        requester.requestJsonAndCheck.assert_not_called()
+        assert repo.language == 'Java', "Dropped fields should be completed from the repository URL"
+        requester.requestJsonAndCheck.assert_called_once_with("GET", raw['url'])
+
+
+class TestPrefetchRepositoryFiles:
+    """Test class for fetching the candidate files of many repositories at once"""
+    
+    def test_prefetch_groups_repositories_into_one_query(self, analyzer):
+        """Test that one query covers the group and empty repositories are skipped"""
+        repos = []
+        for name, size in (("app", 10), ("empty", 0), ("gone", 5)):
+            repo = MagicMock(full_name=f"test-org/{name}", default_branch="main", size=size, pushed_at=None)
+            repo.name = name
+            repos.append(repo)
+        pom_index = analyzer.candidate_files.index('pom.xml')
+        data = {"r0": {f"f{pom_index}": {"oid": "abc", "text": "<project/>"}}, "r1": None}
+        
+        with patch.object(analyzer, '_graphql_request', return_value=data) as request:
+            prefetched = analyzer.prefetch_repository_files(repos)
+        
+        assert request.call_count == 1
+        assert 'r2:' not in request.call_args[0][1], "Empty repositories should not be queried"
+        assert prefetched == 1
+        assert analyzer.prefetched_files == {"test-org/app": {"pom.xml": ("abc", "<project/>")}}
+    
+    def test_graphql_listing_builds_repositories(self, analyzer):
+        """Test that listing repositories through GraphQL fetches metadata only"""
+        analyzer.org._requester.base_url = "https://api.github.com"
+        nodes = [
+            {
+                "databaseId": 1, "name": name, "nameWithOwner": f"test-org/{name}", "isArchived": archived,
+                "diskUsage": 10, "pushedAt": "2024-01-01T00:00:00Z", "defaultBranchRef": {"name": "main"}
+            }
+            for name, archived in (("app", False), ("old", True))
+        ]
+        data = {"organization": {"repositories": {"pageInfo": {"hasNextPage": False, "endCursor": None}, "nodes": nodes}}}
+        
+        with patch.object(analyzer, '_graphql_request', return_value=data) as request:
+            pages = list(analyzer._graphql_repository_pages())
+        
+        assert [[repo._rawData['name'] for repo in page] for page in pages] == [["app", "old"]]
+        assert pages[0][0]._rawData['url'] == "https://api.github.com/repos/test-org/app"
+        assert 'object(expression' not in request.call_args[0][1], "Files should not be fetched while listing"
+        assert analyzer.prefetched_files == {}
+    
+    def test_analysis_prefetches_next_batch_during_current(self, analyzer):
+        """Test that the next batch is prefetched while one is analyzed, and nothing is kept afterwards"""
+        analyzer.PREFETCH_BATCH_SIZE = 2
+        repos = []
+        for i in range(5):
+            repo = MagicMock(full_name=f"test-org/repo{i}")
+            repo.name = f"repo{i}"
+            repos.append(repo)
+        prefetched = [threading.Event() for _ in range(3)]
+        overlapped = []
+        
+        def prefetch(batch):
+            analyzer.prefetched_files.update((repo.full_name, {}) for repo in batch)
+            prefetched[repos.index(batch[0]) // 2].set()
+        
+        def analyze(repo):
+            next_batch = repos.index(repo) // 2 + 1
+            if next_batch < len(prefetched):
+                overlapped.append(prefetched[next_batch].wait(timeout=5))
+            return [], [], []
+        
+        with patch.object(analyzer, 'prefetch_repository_files', side_effect=prefetch) as prefetch_files, \
+             patch.object(analyzer, 'analyze_repository_parallel', side_effect=analyze):
+            analyzer.analyze_repositories_individual(repos)
+        
+        assert [call.args[0] for call in prefetch_files.call_args_list] == [repos[0:2], repos[2:4], repos[4:5]]
+        assert overlapped == [True] * 4, "The next batch should be prefetched while the current one is analyzed"
+        assert analyzer.prefetched_files == {}, "Unconsumed entries should be dropped after each batch"
+
+class TestRateLimitStatus:
+    """Test class for tracking the REST and GraphQL rate limits from response headers"""
+    
+    @staticmethod
+    def headers(resource, remaining):
+        return {'x-ratelimit-resource': resource, 'x-ratelimit-remaining': str(remaining), 'x-ratelimit-limit': '5000', 'x-ratelimit-reset': str(int(time.time()) + 3600)}
+    
+    def test_graphql_responses_dont_overwrite_rest_budget(self, analyzer):
+        """Test that the REST status is read from REST responses only"""
+        analyzer._record_rate_limit(self.headers('core', 4000))
+        analyzer._record_rate_limit(self.headers('graphql', 12))
+        
+        assert analyzer.get_rate_limit_status().remaining == 4000
+        assert analyzer.graphql_rate_limit.remaining == 12
+        analyzer.github.get_rate_limit.assert_not_called()
+    
+    def test_endpoint_is_asked_before_any_rest_response(self, analyzer):
+        """Test that the rate limit endpoint is used once when no REST headers have been seen"""
+        assert analyzer.get_rate_limit_status().remaining == 5000
+        assert analyzer.get_rate_limit_status().remaining == 5000
+        analyzer.github.get_rate_limit.assert_called_once()
+    
+    def test_low_budget_paces_calls_across_workers(self, analyzer):
+        """Test that calls made at the same moment are given successive slots, not the same delay"""
+        analyzer._record_rate_limit({**self.headers('core', 10), 'x-ratelimit-reset': str(int(time.time()) + 10)})
+        
+        with patch('build_check.time.monotonic', return_value=100.0), patch('build_check.time.sleep') as sleep:
+            for _ in range(3):
+                analyzer._check_rate_limit()
+        
+        delays = [call.args[0] for call in sleep.call_args_list]
+        assert len(delays) == 2, "The first call should not wait"
+        assert delays[1] == pytest.approx(2 * delays[0], abs=0.01) and 0.8 < delays[0] <= 1.0
+
+
+class TestRepositoryResultReuse:
+    """Test class for storing and reusing the findings of unchanged repositories"""
+    
+    @pytest.fixture
+    def repo(self):
+        """Fixture to provide a pushed repository whose files are fetched one by one"""
+        repo = MagicMock(full_name="test-org/app", default_branch="main", size=10, pushed_at="2024-01-01 00:00:00")
+        repo.name = "app"
+        return repo
+    
+    @pytest.mark.parametrize("status, stored", [(404, True), (500, False)], ids=["not-found", "server-error"])
+    def test_findings_are_stored_only_after_complete_fetches(self, analyzer, repo, status, stored):
+        """Test that findings are kept for reuse when files are missing, but not when a fetch failed"""
+        from github.Requester import Requester
+        error = Requester.createException(status, {}, {"message": "error"})
+        
+        with patch.object(analyzer, '_graphql_fetch_files', return_value=None), \
+             patch.object(analyzer, '_list_repo_tree', return_value=None), \
+             patch.object(analyzer, '_conditional_get', side_effect=error):
+            assert analyzer.analyze_repository(repo) == ([], [], [])
+        
+        assert ("app" in analyzer.repo_results) is stored
+        assert analyzer.failed_fetches == set()
+    
+    def test_findings_are_not_reused_from_a_cached_listing(self, analyzer, repo):
+        """Test that pushed_at read from the repository list cache doesn't make findings reusable"""
+        analyzer.repo_results["app"] = (str(repo.pushed_at), repo.default_branch)
+        assert analyzer._has_reusable_findings(repo)
+        
+        analyzer.repository_list_cached = True
+        
+        assert not analyzer._has_reusable_findings(repo), "A cached listing may predate the last push"
+
+
+class TestAnalyzerClose:
+    """Test class for releasing the analyzer's workers and caches"""
+    
+    def test_close_releases_workers_and_caches(self, analyzer):
+        """Test that close shuts down the fetch executor and closes both SQLite caches"""
+        analyzer.close()
+        
+        with pytest.raises(RuntimeError):
+            analyzer.fetch_executor.submit(print)
+        with pytest.raises(sqlite3.ProgrammingError):
+            analyzer.etag_cache.get(('tree', 'test-org/app', 'main'))
+        with pytest.raises(sqlite3.ProgrammingError):
+            analyzer.repo_result_store.repository_findings('app')
+
+
+class TestRepositoryTree:
+    """Test class for listing a repository's files with the Git Trees API"""
+    
+    @pytest.fixture
+    def repo(self):
+        """Fixture to provide a repository with the attributes the tree request reads"""
+        repo = MagicMock(full_name="test-org/app", default_branch="main", url="https://api.github.com/repos/test-org/app")
+        repo.name = "app"
+        return repo
+    
+    def test_tree_lists_blobs(self, analyzer, repo):
+        """Test that only blobs are returned, keyed by path"""
+        data = {"tree": [{"path": "pom.xml", "sha": "abc", "type": "blob"}, {"path": "src", "sha": "def", "type": "tree"}]}
+        
+        with patch.object(analyzer, '_conditional_get', return_value=data):
+            assert analyzer._list_repo_tree(repo) == {"pom.xml": "abc"}
+    
+    @pytest.mark.parametrize("data", [None, {"message": "Git Repository is empty."}, []], ids=["no-body", "error-payload", "unexpected-type"])
+    def test_tree_without_body_falls_back(self, analyzer, repo, data):
+        """Test that a response without a tree makes callers fall back to per-file fetches"""
+        with patch.object(analyzer, '_conditional_get', return_value=data):
+            assert analyzer._list_repo_tree(repo) is None
+
 if __name__ == '__main__':
     pytest.main([__file__]) 
\ No newline at end of file
@@ -3,9 +3,9 @@
 Tests for the configuration manager module
 """
 
-import pytest
-import tempfile
+import io
 import os
+import pytest
 import yaml
 from unittest.mock import patch
 
@@ -15,6 +15,7 @@ try:
         ConfigManager, 
         BuildCheckConfig, 
         ParallelismConfig, 
+        APIOptimizationConfig, 
         ExclusionConfig, 
         AnalysisConfig, 
         CachingConfig, 
@@ -23,163 +24,156 @@ try:
 except ImportError:
     pytest.skip("config_manager module not available", allow_module_level=True)
 
+# Use libyaml's C parser and emitter when PyYAML was built with them
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
+
+def _config_stream(config_data: dict) -> io.StringIO:
+    """Serialize config_data into an in-memory YAML stream"""
+    return io.StringIO(yaml.dump(config_data, Dumper=SafeDumper))
+
+
+def _write_config(tmp_path_factory, name: str, config_data: dict) -> str:
+    """Write config_data once to a YAML file in a fresh temporary directory"""
+    config_file = tmp_path_factory.mktemp(name) / "config.yaml"
+    with open(config_file, 'w') as f:
+        yaml.dump(config_data, f, Dumper=SafeDumper)
+    return str(config_file)
+
+
+@pytest.fixture(scope="module")
+def valid_config_path(tmp_path_factory):
+    """Module-scoped fixture providing a complete, valid configuration file"""
+    return _write_config(tmp_path_factory, "valid", {
+        'organization': 'test-org',
+        'parallelism': {
+            'max_workers': 4,
+            'rate_limit_delay': 0.1,
+            'optimized': True
+        },
+        'exclusions': {
+            'repositories': ['test-repo'],
+            'patterns': ['test-*']
+        },
+        'analysis': {
+            'jenkins_only': True,
+            'single_repository': None
+        },
+        'caching': {
+            'enabled': False,
+            'directory': '/tmp/cache',
+            'duration': 1800
+        },
+        'output': {
+            'json_report': 'test.json',
+            'verbose': True
+        }
+    })
+
+
+@pytest.fixture(scope="module")
+def defaults_config_path(tmp_path_factory):
+    """Module-scoped fixture providing a configuration file with only the organization"""
+    return _write_config(tmp_path_factory, "defaults", {
+        'organization': 'test-org'
+    })
+
 
 class TestConfigManager:
     """Test cases for the configuration manager"""
     
-    def test_create_default_config(self):
+    def test_create_default_config(self, tmp_path):
         """Test creating a default configuration file"""
-        config_file = tempfile.mktemp(suffix='.yaml')
+        config_file = tmp_path / "config.yaml"
         
-        try:
-            config_manager = ConfigManager(config_file)
-            config_manager.create_default_config()
-            
-            # Verify file was created
-            assert os.path.exists(config_file)
-            
-            # Verify file contains valid YAML
-            with open(config_file, 'r') as f:
-                config_data = yaml.safe_load(f)
-            
-            assert 'organization' in config_data
-            assert config_data['organization'] == 'your-org-name'
-            assert 'parallelism' in config_data
-            assert 'exclusions' in config_data
-            assert 'analysis' in config_data
-            assert 'caching' in config_data
-            assert 'output' in config_data
-            
-        finally:
-            if os.path.exists(config_file):
-                os.unlink(config_file)
-    
-    def test_load_valid_config(self):
-        """Test loading a valid configuration file"""
-        config_data = {
-            'organization': 'test-org',
-            'parallelism': {
-                'max_workers': 4,
-                'rate_limit_delay': 0.1,
-                'optimized': True
-            },
-            'exclusions': {
-                'repositories': ['test-repo'],
-                'patterns': ['test-*']
-            },
-            'analysis': {
-                'jenkins_only': True,
-                'single_repository': None
-            },
-            'caching': {
-                'enabled': False,
-                'directory': '/tmp/cache',
-                'duration': 1800
-            },
-            'output': {
-                'json_report': 'test.json',
-                'verbose': True
-            }
-        }
+        config_manager = ConfigManager(str(config_file))
+        config_manager.create_default_config()
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml.dump(config_data, f)
-            config_file = f.name
+        # Verify file was created
+        assert config_file.exists()
         
-        try:
-            config_manager = ConfigManager(config_file)
-            config = config_manager.load_config()
-            
-            assert config.organization == 'test-org'
-            assert config.parallelism.max_workers == 4
-            assert config.parallelism.rate_limit_delay == 0.1
-            assert config.parallelism.optimized is True
-            assert config.exclusions.repositories == ['test-repo']
-            assert config.exclusions.patterns == ['test-*']
-            assert config.analysis.jenkins_only is True
-            assert config.caching.enabled is False
-            assert config.caching.directory == '/tmp/cache'
-            assert config.output.json_report == 'test.json'
-            assert config.output.verbose is True
-            
-        finally:
-            if os.path.exists(config_file):
-                os.unlink(config_file)
-    
-    def test_load_config_with_defaults(self):
-        """Test loading configuration with missing optional fields"""
-        config_data = {
-            'organization': 'test-org'
-        }
+        # Verify file contains valid YAML
+        with open(config_file, 'r') as f:
+            config_data = yaml.load(f, Loader=SafeLoader)
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml.dump(config_data, f)
-            config_file = f.name
-        
-        try:
-            config_manager = ConfigManager(config_file)
-            config = config_manager.load_config()
-            
-            # Should use defaults for missing fields
-            assert config.organization == 'test-org'
-            assert config.parallelism.max_workers == 8
-            assert config.parallelism.rate_limit_delay == 0.05
-            assert config.parallelism.optimized is False
-            assert config.exclusions.repositories == []
-            assert config.exclusions.patterns == []
-            assert config.analysis.jenkins_only is False
-            assert config.caching.enabled is True
-            assert config.output.verbose is False
-            
-        finally:
-            if os.path.exists(config_file):
-                os.unlink(config_file)
+        assert 'organization' in config_data
+        assert config_data['organization'] == 'your-org-name'
+        assert 'parallelism' in config_data
+        assert 'exclusions' in config_data
+        assert 'analysis' in config_data
+        assert 'caching' in config_data
+        assert 'output' in config_data
     
-    def test_load_config_missing_organization(self):
-        """Test loading configuration without required organization field"""
-        config_data = {
-            'parallelism': {'max_workers': 4}
-        }
+    def test_load_valid_config(self, valid_config_path):
+        """Test loading a valid configuration file"""
+        config_manager = ConfigManager(valid_config_path)
+        config = config_manager.load_config()
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml.dump(config_data, f)
-            config_file = f.name
+        assert config.organization == 'test-org'
+        assert config.parallelism.max_workers == 4
+        assert config.parallelism.rate_limit_delay == 0.1
+        assert config.parallelism.optimized is True
+        assert config.exclusions.repositories == ['test-repo']
+        assert config.exclusions.patterns == ['test-*']
+        assert config.analysis.jenkins_only is True
+        assert config.caching.enabled is False
+        assert config.caching.directory == '/tmp/cache'
+        assert config.output.json_report == 'test.json'
+        assert config.output.verbose is True
+    
+    def test_load_config_with_defaults(self, defaults_config_path):
+        """Test loading configuration with missing optional fields"""
+        config_manager = ConfigManager(defaults_config_path)
+        config = config_manager.load_config()
         
-        try:
-            config_manager = ConfigManager(config_file)
-            with pytest.raises(ValueError, match="'organization' is required"):
-                config_manager.load_config()
-        finally:
-            if os.path.exists(config_file):
-                os.unlink(config_file)
+        # Should use defaults for missing fields
+        assert config.organization == 'test-org'
+        assert config.parallelism.max_workers == 8
+        assert config.parallelism.rate_limit_delay == 0.05
+        assert config.parallelism.optimized is False
+        assert config.exclusions.repositories == []
+        assert config.exclusions.patterns == []
+        assert config.analysis.jenkins_only is False
+        assert config.caching.enabled is True
+        assert config.output.verbose is False
     
-    def test_load_config_invalid_parallelism(self):
-        """Test loading configuration with invalid parallelism settings"""
-        config_data = {
+    @pytest.mark.parametrize("config_data, error", [
+        pytest.param({'parallelism': {'max_workers': 4}}, "'organization' is required", id="missing-organization"),
+        pytest.param({
             'organization': 'test-org',
             'parallelism': {
                 'max_workers': 20,  # Invalid: too high
                 'rate_limit_delay': -0.1  # Invalid: negative
             }
-        }
+        }, "max_workers must be between 1 and 16", id="invalid-parallelism"),
+    ])
+    def test_load_config_rejects_invalid(self, config_data, error):
+        """Test that configurations missing required fields or with invalid settings are rejected"""
+        with pytest.raises(ValueError, match=error):
+            ConfigManager().load_config_from_stream(_config_stream(config_data))
+    
+    def test_load_config_sees_rewrite_with_same_mtime(self, tmp_path):
+        """Test that a rewritten file is parsed again even if its mtime is unchanged"""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("organization: test-org\n")
+        mtime_ns = config_file.stat().st_mtime_ns
+        assert ConfigManager(str(config_file)).load_config().organization == 'test-org'
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml.dump(config_data, f)
-            config_file = f.name
+        # Rewrite the file and restore the old mtime, as coarse timestamps would
+        config_file.write_text("organization: other-org\n")
+        os.utime(config_file, ns=(mtime_ns, mtime_ns))
         
-        try:
-            config_manager = ConfigManager(config_file)
-            with pytest.raises(ValueError, match="max_workers must be between 1 and 16"):
-                config_manager.load_config()
-        finally:
-            if os.path.exists(config_file):
-                os.unlink(config_file)
+        assert ConfigManager(str(config_file)).load_config().organization == 'other-org'
     
     def test_should_exclude_repository(self):
         """Test repository exclusion logic"""
         config = BuildCheckConfig(
             organization='test-org',
             parallelism=ParallelismConfig(),
+            api_optimization=APIOptimizationConfig(),
             exclusions=ExclusionConfig(
                 repositories=['exact-repo'],
                 patterns=['test-*', '*-demo']
@@ -204,6 +198,7 @@ class TestConfigManager:
         config_manager.config = BuildCheckConfig(
             organization='test-org',
             parallelism=ParallelismConfig(),
+            api_optimization=APIOptimizationConfig(),
             exclusions=ExclusionConfig(
                 repositories=['exact-repo'],
                 patterns=['test-*']
@@ -232,6 +227,7 @@ class TestBuildCheckConfig:
         config = BuildCheckConfig(
             organization='test-org',
             parallelism=ParallelismConfig(),
+            api_optimization=APIOptimizationConfig(),
             exclusions=ExclusionConfig(repositories=[], patterns=[]),
             analysis=AnalysisConfig(),
             caching=CachingConfig(),
@@ -247,6 +243,7 @@ class TestBuildCheckConfig:
         config = BuildCheckConfig(
             organization='test-org',
             parallelism=ParallelismConfig(),
+            api_optimization=APIOptimizationConfig(),
             exclusions=ExclusionConfig(
                 repositories=['legacy-app'],
                 patterns=['*-infra', 'terraform-*', 'demo-*', 'test-*']
@@ -263,6 +260,29 @@ class TestBuildCheckConfig:
         assert config.should_exclude_repository('demo-app') is True    # demo-* pattern
         assert config.should_exclude_repository('test-repo') is True   # test-* pattern
         assert config.should_exclude_repository('production-app') is False  # No match
+    
+    def test_exclusions_mixed_affix_and_glob_patterns(self):
+        """Test that plain prefix/suffix globs and other globs are all honoured together"""
+        exclusions = ExclusionConfig(repositories=[], patterns=['test-*', '*-demo', 'svc-?-[ab]*', 'a*b'])
+        
+        assert exclusions.matches('test-repo') is True
+        assert exclusions.matches('my-demo') is True
+        assert exclusions.matches('svc-1-alpha') is True
+        assert exclusions.matches('alphab') is True
+        assert exclusions.matches('svc-12-alpha') is False
+        assert exclusions.matches('demo-test') is False
+    
+    def test_exclusions_recompiled_when_replaced(self):
+        """Test that replacing the exclusion lists refreshes the compiled matchers"""
+        exclusions = ExclusionConfig(repositories=[], patterns=['test-*'])
+        assert exclusions.matches('test-repo') is True
+        
+        exclusions.patterns = ['demo-*']
+        exclusions.repositories = ['exact-repo']
+        
+        assert exclusions.matches('test-repo') is False
+        assert exclusions.matches('demo-app') is True
+        assert exclusions.matches('exact-repo') is True
 
 
 if __name__ == '__main__':
@@ -5,7 +5,7 @@ Test script for CSV and HTML export functionality
 
 import os
 import tempfile
-from build_check import BuildTool, JavaVersion, PluginVersion
+from build_check import BuildTool, JavaVersion, PluginVersion, _escape_html as esc
 
 class MockAnalyzer:
     """Mock analyzer for testing export functions without GitHub connection"""
@@ -20,44 +20,23 @@ class MockAnalyzer:
                 # Write header
                 writer.writerow(['Repository', 'Type', 'Name', 'Version', 'Source Compatibility', 'Target Compatibility', 'Config File', 'Detection Method'])
                 
-                # Write build tools
-                for tool in all_build_tools:
-                    writer.writerow([
-                        tool.repository,
-                        'Build Tool',
-                        tool.name,
-                        tool.version,
-                        '',  # No source compatibility for build tools
-                        '',  # No target compatibility for build tools
-                        tool.file_path,
-                        tool.detection_method
-                    ])
+                # Write build tools (no source/target compatibility for build tools)
+                writer.writerows(
+                    (tool.repository, 'Build Tool', tool.name, tool.version, '', '', tool.file_path, tool.detection_method)
+                    for tool in all_build_tools
+                )
                 
                 # Write Java versions
-                for java in all_java_versions:
-                    writer.writerow([
-                        java.repository,
-                        'Java Version',
-                        'Java',
-                        java.version,
-                        java.source_compatibility,
-                        java.target_compatibility,
-                        java.file_path,
-                        java.detection_method
-                    ])
+                writer.writerows(
+                    (java.repository, 'Java Version', 'Java', java.version, java.source_compatibility, java.target_compatibility, java.file_path, java.detection_method)
+                    for java in all_java_versions
+                )
                 
-                # Write plugin versions
-                for plugin in all_plugin_versions:
-                    writer.writerow([
-                        plugin.repository,
-                        'Plugin Version',
-                        plugin.plugin_name,
-                        plugin.version,
-                        '',  # No source compatibility for plugins
-                        '',  # No target compatibility for plugins
-                        plugin.file_path,
-                        plugin.detection_method
-                    ])
+                # Write plugin versions (no source/target compatibility for plugins)
+                writer.writerows(
+                    (plugin.repository, 'Plugin Version', plugin.plugin_name, plugin.version, '', '', plugin.file_path, plugin.detection_method)
+                    for plugin in all_plugin_versions
+                )
             
             print(f"✅ CSV report saved to: {output_file}")
             
@@ -68,13 +47,14 @@ class MockAnalyzer:
         """Export analysis results to HTML format"""
         import time
         try:
-            # Generate HTML content
-            html_content = f"""<!DOCTYPE html>
+            # Generate HTML content as a list of fragments - += would copy the
+            # whole document so far for every row
+            parts = [f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>BuildCheck Report - {org_name}</title>
+    <title>BuildCheck Report - {esc(org_name)}</title>
     <style>
         body {{
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
@@ -176,8 +156,8 @@ class MockAnalyzer:
     <div class="container">
         <h1>🔍 BuildCheck Analysis Report</h1>
         <div class="analysis-mode">
-            <strong>Organization:</strong> {org_name}<br>
-            <strong>Analysis Mode:</strong> {analysis_mode}<br>
+            <strong>Organization:</strong> {esc(org_name)}<br>
+            <strong>Analysis Mode:</strong> {esc(analysis_mode)}<br>
             <strong>Generated:</strong> {time.strftime('%Y-%m-%d %H:%M:%S')}
         </div>
         
@@ -206,11 +186,11 @@ class MockAnalyzer:
                 <div class="stat-number">{max_workers}</div>
                 <div class="stat-label">Parallel Workers</div>
             </div>
-        </div>"""
+        </div>"""]
             
             # Add build tools section
             if all_build_tools:
-                html_content += f"""
+                parts.append(f"""
         <h2>🛠️ Build Tool Versions</h2>
         <table>
             <thead>
@@ -222,25 +202,25 @@ class MockAnalyzer:
                     <th>Detection Method</th>
                 </tr>
             </thead>
-            <tbody>"""
+            <tbody>""")
                 
                 for tool in all_build_tools:
-                    html_content += f"""
+                    parts.append(f"""
                 <tr>
-                    <td><span class="repo-name">{tool.repository}</span></td>
-                    <td><strong>{tool.name.title()}</strong></td>
-                    <td><span class="version-badge">{tool.version}</span></td>
-                    <td><code>{tool.file_path}</code></td>
-                    <td>{tool.detection_method}</td>
-                </tr>"""
+                    <td><span class="repo-name">{esc(tool.repository)}</span></td>
+                    <td><strong>{esc(tool.name.title())}</strong></td>
+                    <td><span class="version-badge">{esc(tool.version)}</span></td>
+                    <td><code>{esc(tool.file_path)}</code></td>
+                    <td>{esc(tool.detection_method)}</td>
+                </tr>""")
                 
-                html_content += """
+                parts.append("""
             </tbody>
-        </table>"""
+        </table>""")
             
             # Add Java versions section
             if all_java_versions:
-                html_content += f"""
+                parts.append(f"""
         <h2>☕ Java Versions</h2>
         <table>
             <thead>
@@ -253,26 +233,26 @@ class MockAnalyzer:
                     <th>Detection Method</th>
                 </tr>
             </thead>
-            <tbody>"""
+            <tbody>""")
                 
                 for java in all_java_versions:
-                    html_content += f"""
+                    parts.append(f"""
                 <tr>
-                    <td><span class="repo-name">{java.repository}</span></td>
-                    <td><span class="version-badge">{java.version}</span></td>
-                    <td>{java.source_compatibility or '-'}</td>
-                    <td>{java.target_compatibility or '-'}</td>
-                    <td><code>{java.file_path}</code></td>
-                    <td>{java.detection_method}</td>
-                </tr>"""
+                    <td><span class="repo-name">{esc(java.repository)}</span></td>
+                    <td><span class="version-badge">{esc(java.version)}</span></td>
+                    <td>{esc(java.source_compatibility or '-')}</td>
+                    <td>{esc(java.target_compatibility or '-')}</td>
+                    <td><code>{esc(java.file_path)}</code></td>
+                    <td>{esc(java.detection_method)}</td>
+                </tr>""")
                 
-                html_content += """
+                parts.append("""
             </tbody>
-        </table>"""
+        </table>""")
             
             # Add plugin versions section
             if all_plugin_versions:
-                html_content += f"""
+                parts.append(f"""
         <h2>🔌 Plugin Versions</h2>
         <table>
             <thead>
@@ -284,34 +264,34 @@ class MockAnalyzer:
                     <th>Detection Method</th>
                 </tr>
             </thead>
-            <tbody>"""
+            <tbody>""")
                 
                 for plugin in all_plugin_versions:
-                    html_content += f"""
+                    parts.append(f"""
                 <tr>
-                    <td><span class="repo-name">{plugin.repository}</span></td>
-                    <td><strong>{plugin.plugin_name}</strong></td>
-                    <td><span class="version-badge">{plugin.version}</span></td>
-                    <td><code>{plugin.file_path}</code></td>
-                    <td>{plugin.detection_method}</td>
-                </tr>"""
+                    <td><span class="repo-name">{esc(plugin.repository)}</span></td>
+                    <td><strong>{esc(plugin.plugin_name)}</strong></td>
+                    <td><span class="version-badge">{esc(plugin.version)}</span></td>
+                    <td><code>{esc(plugin.file_path)}</code></td>
+                    <td>{esc(plugin.detection_method)}</td>
+                </tr>""")
                 
-                html_content += """
+                parts.append("""
             </tbody>
-        </table>"""
+        </table>""")
             
             # Close HTML
-            html_content += f"""
+            parts.append(f"""
         <div class="timestamp">
             Report generated by BuildCheck on {time.strftime('%Y-%m-%d at %H:%M:%S')}
         </div>
     </div>
 </body>
-</html>"""
+</html>""")
             
             # Write HTML file
             with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(html_content)
+                f.writelines(parts)
             
             print(f"✅ HTML report saved to: {output_file}")
             
@@ -0,0 +1,129 @@
+"""
+Tests for the Jenkins pipeline analyzer
+"""
+
+import pytest
+
+# Import the modules to test
+from jenkins_analyzer import JenkinsAnalyzer
+
+
+class TestStageExtraction:
+    """Test class for splitting a Jenkinsfile into stage bodies"""
+
+    @pytest.fixture
+    def analyzer(self):
+        """Fixture to provide a Jenkins analyzer"""
+        return JenkinsAnalyzer()
+
+    def test_nested_blocks(self, analyzer):
+        """Test that a stage body runs to its own closing brace past nested blocks"""
+        content = (
+            "pipeline {\n"
+            "  stages {\n"
+            "    stage('Build') {\n"
+            "      steps {\n"
+            "        script { if (env.X) { sh 'mvn package' } }\n"
+            "      }\n"
+            "    }\n"
+            "    stage('Test') { steps { sh 'gradle test' } }\n"
+            "  }\n"
+            "}\n"
+        )
+
+        stages = analyzer._extract_stages(content)
+
+        assert [name for name, _ in stages] == ['Build', 'Test']
+        assert "sh 'mvn package' } }" in stages[0][1], "Nested blocks should stay inside the stage body"
+        assert 'gradle' not in stages[0][1], "The next stage should not be part of the body"
+
+    @pytest.mark.parametrize("body", [
+        " sh 'echo }' ",
+        ' sh "echo ${env.X} }" ',
+        " sh '''echo it's }''' ",
+        ' sh """echo "quoted" }""" ',
+        " sh 'echo \\' }' ",
+    ], ids=["single", "double", "triple-single", "triple-double", "escaped-quote"])
+    def test_braces_inside_strings_are_ignored(self, analyzer, body):
+        """Test that braces inside quoted strings don't end the stage"""
+        content = f"stage('Build') {{{body}}}\nstage('Next') {{ }}"
+
+        assert analyzer._extract_stages(content) == [('Build', body), ('Next', ' ')]
+
+    @pytest.mark.parametrize("body", [
+        " // closing } in a line comment\n sh 'mvn' \n",
+        " /* a } and a { in\n a block comment */ sh 'mvn' ",
+    ], ids=["line-comment", "block-comment"])
+    def test_braces_inside_comments_are_ignored(self, analyzer, body):
+        """Test that braces inside comments don't end the stage"""
+        content = f"stage('Build') {{{body}}}\nstage('Next') {{ }}"
+
+        assert analyzer._extract_stages(content) == [('Build', body), ('Next', ' ')]
+
+    def test_unterminated_block(self, analyzer):
+        """Test that an unterminated stage runs to the end of the content"""
+        content = "stage('Build') { steps { sh 'mvn package'"
+
+        assert analyzer._extract_stages(content) == [('Build', " steps { sh 'mvn package'")]
+
+
+
+class TestStageContents:
+    """Test class for the tools, artifacts and repositories found in a stage"""
+
+    @pytest.fixture
+    def analyzer(self):
+        """Fixture to provide a Jenkins analyzer"""
+        return JenkinsAnalyzer()
+
+    def test_repeated_matches_are_kept_per_stage(self, analyzer):
+        """Test that every artifact and repository match of a stage is reported, as findall does"""
+        content = (
+            "stage('Publish') {\n"
+            "  archiveArtifacts 'target/*.jar'\n"
+            "  archiveArtifacts 'target/*.jar'\n"
+            "  repository 'libs-release'\n"
+            "  artifactory 'libs-release'\n"
+            "}\n"
+        )
+
+        pipeline = analyzer.analyze_jenkinsfile(content, 'repo')
+
+        assert pipeline.stages[0].artifacts == ('target/*.jar', 'target/*.jar')
+        assert pipeline.stages[0].repositories == ('libs-release', 'libs-release')
+        assert pipeline.artifactory_repos == ['libs-release'], "Pipeline-level repositories should be unique"
+
+    def test_mixed_case_tool_steps(self, analyzer):
+        """Test that camel-case steps are detected by the lowercase tool patterns"""
+        assert analyzer._extract_tools("withMaven { sh 'echo' }") == ('maven',)
+        assert analyzer._extract_tools("withGradle { sh 'echo' }") == ('gradle',)
+
+    def test_tool_patterns_are_written_lowercase(self, analyzer):
+        """Test that tool patterns, run against lowercased content, contain no uppercase"""
+        for patterns in analyzer.tool_patterns.values():
+            for pattern in patterns:
+                assert pattern.pattern == pattern.pattern.lower(), f"Tool pattern {pattern.pattern!r} should be lowercase"
+
+
+class TestAnalysisCache:
+    """Test class for the Jenkinsfile and stage result caches"""
+
+    def test_caches_are_bounded_lru(self):
+        """Test that the caches evict their least recently used entries"""
+        analyzer = JenkinsAnalyzer()
+        analyzer.ANALYSIS_CACHE_SIZE = 2
+        analyzer.STAGE_CACHE_SIZE = 2
+        files = [f"stage('S{i}') {{ sh 'mvn -v {i}' }}" for i in range(3)]
+
+        analyzer.analyze_jenkinsfile(files[0], 'repo')
+        analyzer.analyze_jenkinsfile(files[1], 'repo')
+        analyzer.analyze_jenkinsfile(files[0], 'repo')  # Most recently used again
+        analyzer.analyze_jenkinsfile(files[2], 'repo')  # Evicts files[1]
+        analyzer.analyze_jenkinsfile(files[0], 'repo')
+        analyzer.analyze_jenkinsfile(files[1], 'repo')
+
+        assert len(analyzer.analysis_cache) == 2 and len(analyzer.stage_cache) == 2
+        assert (analyzer.cache_hits, analyzer.cache_misses) == (2, 4)
+
+if __name__ == '__main__':
+    pytest.main([__file__])
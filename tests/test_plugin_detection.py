@@ -1,21 +1,18 @@
 import re
 import pytest
 
-def plugin_version_patterns():
-    return [
-        r'publishPluginVersion\s*=\s*([^\s]+)',
-        r'publishPluginVersion\s*=\s*[\'"]([^\'"]+)[\'"]'
-    ]
+# Compiled once at import; publishPluginVersion is a case-sensitive property name.
+# The value is double-quoted, single-quoted or bare - one group per form. The
+# property starts a line, so the anchor limits match attempts to line starts.
+_PLUGIN_RX = re.compile(r'^\s*publishPluginVersion\s*=\s*(?:"([^"]+)"|\'([^\']+)\'|(\S+))', re.MULTILINE)
 
 def extract_plugin_version(content):
-    for pattern in plugin_version_patterns():
-        match = re.search(pattern, content, re.IGNORECASE | re.MULTILINE)
-        if match:
-            value = match.group(1).strip()
-            # Remove surrounding quotes if present
-            if (value.startswith('"') and value.endswith('"')) or (value.startswith("'") and value.endswith("'")):
-                value = value[1:-1]
-            return value
+    # Cheap substring rejection for the common case of no plugin property
+    if 'publishPluginVersion' not in content:
+        return None
+    match = _PLUGIN_RX.search(content)
+    if match:
+        return match.group(1) or match.group(2) or match.group(3)
     return None
 
 def test_plugin_version_detection_plain():
@@ -35,4 +32,12 @@ def test_plugin_version_detection_quoted():
 
 def test_plugin_version_detection_none():
     content = '# No plugin version here\norg.gradle.jvmargs=-Xmx2048m'
-    assert extract_plugin_version(content) is None 
\ No newline at end of file
+    assert extract_plugin_version(content) is None 
+
+def test_plugin_version_detection_single_quoted():
+    content = "publishPluginVersion='7.8.9'"
+    assert extract_plugin_version(content) == "7.8.9"
+
+def test_plugin_version_detection_ignores_mid_line_mentions():
+    content = 'description=uses publishPluginVersion=0.0.1\npublishPluginVersion=2.0.0'
+    assert extract_plugin_version(content) == "2.0.0"